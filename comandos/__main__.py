@@ -0,0 +1,6 @@
+"""Permite ejecutar la CLI con `python -m comandos`."""
+import sys
+
+from comandos.cli import main
+
+sys.exit(main())
@@ -0,0 +1,408 @@
+"""API de biblioteca: crear proyectos sin prompts ni terminal.
+
+    import asyncio
+    from comandos.api import create_project
+
+    async def crear():
+        spec = {"generator": "python-uv", "name": "demo", "packages": ["requests"]}
+        async for event in create_project(spec):
+            print(event)
+
+    asyncio.run(crear())
+
+create_project(spec) es un generador asíncrono de eventos (diccionarios con
+"type", "project" y "time"):
+
+- step_started: empieza un paso ("step").
+- output: una línea ("line") de la salida de un comando, con su "stream"
+  (stdout o stderr) y su "step".
+- step_finished: termina un paso, con "ok", "seconds" y "error".
+- finished: termina la creación, con "ok", "path", "seconds", las
+  "options" que se guardaron en el manifiesto y "error": el de un fallo
+  fuera de los pasos (los de cada paso van en su step_finished), o None.
+
+Los comandos externos se lanzan con asyncio.create_subprocess_exec y los
+bloqueos de la caché compartida se esperan en hilos, así que en un mismo
+bucle de eventos pueden avanzar muchas creaciones a la vez; create_projects
+las lanza juntas y mezcla sus eventos. Los proyectos quedan con el mismo
+manifiesto que los del CLI, y el subcomando update funciona igual con ellos.
+
+La especificación admite las opciones de SPEC_DEFAULTS. Lo que en el CLI
+son extras interactivos (workspace, matriz de versiones, modo por capas,
+precompilación, hooks, GitHub y Cursor) no está en la API.
+"""
+import asyncio
+import sys
+import time
+from collections import deque
+from contextlib import asynccontextmanager, nullcontext
+from pathlib import Path
+
+from comandos.locking import installer_slot
+from comandos.tuning import apply_tuning
+from comandos.update import save_manifest, write_files
+
+GENERATORS = ["python-uv", "python-pip", "streamlit-uv", "streamlit-pip"]
+
+# Opciones de la especificación y su valor por defecto, según el generador
+SPEC_DEFAULTS = {
+    "common": {"directory": None, "packages": [], "git": True, "template_source": None},
+    "python": {"archetype": "basico", "benchmarks": False},
+    "streamlit": {"template": "basica", "perf_panel": False, "rerun_bench": False},
+    "uv": {"lazy_env": False},
+    "pip": {},
+}
+
+# Líneas finales de la salida de un comando que se devuelven como error
+ERROR_LINES = 20
+
+
+def _generator_module(generator):
+    # Cada generador se importa solo cuando se usa, como en comandos.cli
+    if generator == "python-uv":
+        from comandos.generators import python_uv as module
+    elif generator == "python-pip":
+        from comandos.generators import python_pip as module
+    elif generator == "streamlit-uv":
+        from comandos.generators import streamlit_uv as module
+    else:
+        from comandos.generators import streamlit_pip as module
+    return module
+
+
+def complete_spec(spec):
+    """Valida la especificación y la completa con los valores por defecto.
+
+    Lanza ValueError si el generador o alguna opción no existen, si falta
+    el nombre o si el proyecto ya existe.
+    """
+    generator = spec.get("generator")
+    if generator not in GENERATORS:
+        raise ValueError(f"generador desconocido: {generator!r} (opciones: {', '.join(GENERATORS)})")
+    kind, backend = generator.split("-")
+    allowed = {**SPEC_DEFAULTS["common"], **SPEC_DEFAULTS[kind], **SPEC_DEFAULTS[backend]}
+    unknown = set(spec) - set(allowed) - {"generator", "name"}
+    if unknown:
+        raise ValueError(f"opciones no admitidas por {generator}: {', '.join(sorted(unknown))}")
+    name = (spec.get("name") or "").strip()
+    if not name:
+        raise ValueError("el nombre no puede estar vacío")
+    completed = {**allowed, **spec, "name": name}
+    completed["directory"] = Path(completed["directory"] or Path.cwd()).resolve()
+    completed["path"] = completed["directory"] / name
+    if completed["template_source"]:
+        from comandos.template_sources import normalize_source
+
+        completed["template_source"] = normalize_source(completed["template_source"])
+    if completed["path"].exists():
+        raise ValueError(f"ya existe {completed['path']}")
+    return completed
+
+
+@asynccontextmanager
+async def _held(lock):
+    """Mantiene un bloqueo de comandos.locking sin parar el bucle de eventos.
+
+    Se espera en un hilo; se suelta en el propio bucle, que es inmediato y no
+    depende de que quede libre un hilo del pool.
+    """
+    acquire = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # El hilo puede conseguir el bloqueo después: se suelta en cuanto lo haga
+        def release(done):
+            if not done.cancelled() and done.exception() is None:
+                lock.__exit__(None, None, None)
+
+        acquire.add_done_callback(release)
+        raise
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
+
+
+class _Progress:
+    """Emite los eventos de una creación en la cola compartida."""
+
+    def __init__(self, project, queue):
+        self.project = project
+        self._queue = queue
+
+    def emit(self, event_type, **fields):
+        self._queue.put_nowait({"type": event_type, "project": self.project, "time": time.time(), **fields})
+
+    async def run(self, step, command, cwd, slot=False):
+        """Ejecuta un comando emitiendo su salida línea a línea; devuelve (ok, error).
+
+        Con slot se ocupa antes una plaza de instalación de la máquina.
+        """
+        async with _held(installer_slot()) if slot else nullcontext():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError as e:
+                return False, str(e)
+            tail = deque(maxlen=ERROR_LINES)
+
+            async def forward(stream, name):
+                async for raw in stream:
+                    line = raw.decode("utf-8", "replace").rstrip()
+                    tail.append(line)
+                    self.emit("output", step=step, stream=name, line=line)
+
+            try:
+                await asyncio.gather(forward(process.stdout, "stdout"), forward(process.stderr, "stderr"))
+                returncode = await process.wait()
+            except asyncio.CancelledError:
+                process.kill()
+                await process.wait()
+                raise
+        return returncode == 0, "\n".join(tail).strip()
+
+    async def step(self, name, action):
+        """Ejecuta un paso; action() es una corrutina que devuelve (ok, error)."""
+        self.emit("step_started", step=name)
+        start = time.perf_counter()
+        try:
+            ok, error = await action()
+        except Exception as e:
+            ok, error = False, str(e)
+        self.emit(
+            "step_finished", step=name, ok=ok, seconds=round(time.perf_counter() - start, 3),
+            error=None if ok else error,
+        )
+        return ok
+
+
+# Pasos de cada generador: devuelven True si todos terminaron bien
+
+
+async def _python_uv(spec, options, progress, generator):
+    from comandos.archetypes import entry_function, render_archetype
+    from comandos.benchmarking import DEV_DEPENDENCIES, write_harness
+
+    path, lazy = spec["path"], spec["lazy_env"]
+
+    async def project():
+        # Sin workspace: la API no pregunta si unirse a uno que haya más arriba
+        ok, error = await progress.run("project", ["uv", "init", "--no-workspace", spec["name"]], spec["directory"])
+        if ok:
+            files = {".gitignore": generator.GITIGNORE_CONTENT}
+            if spec["archetype"] != "basico":
+                files.update(render_archetype(spec["archetype"], "uv"))
+            await asyncio.to_thread(write_files, path, files)
+        return ok, error
+
+    async def deps():
+        # Todo con --no-sync: el entorno se sincroniza una sola vez en el paso venv
+        if spec["packages"]:
+            ok, error = await progress.run("deps", ["uv", "add", "--no-sync", *spec["packages"]], path, slot=True)
+            if not ok:
+                return ok, error
+        if spec["benchmarks"]:
+            options["benchmarks"] = await asyncio.to_thread(write_harness, path, "uv", entry_function(spec["archetype"]))
+            if not options["benchmarks"]:
+                return False, "no se encontró un punto de entrada main() para los benchmarks"
+            return await progress.run("deps", ["uv", "add", "--dev", "--no-sync", *DEV_DEPENDENCIES], path, slot=True)
+        return True, None
+
+    async def venv():
+        # Con el entorno diferido solo se resuelve uv.lock
+        return await progress.run("venv", ["uv", "lock"] if lazy else ["uv", "sync"], path, slot=True)
+
+    if not await progress.step("project", project):
+        return False
+    ok = True
+    if spec["packages"] or spec["benchmarks"]:
+        ok = await progress.step("deps", deps)
+    return await progress.step("venv", venv) and ok
+
+
+async def _python_pip(spec, options, progress, generator):
+    from comandos.archetypes import entry_function
+    from comandos.benchmarking import DEV_DEPENDENCIES, write_harness
+
+    path = spec["path"]
+
+    async def project():
+        path.mkdir()
+        ok, _ = await asyncio.to_thread(generator.create_project, spec["name"], spec["archetype"], spec["directory"])
+        await asyncio.to_thread(write_files, path, {".gitignore": generator.GITIGNORE_CONTENT})
+        return ok, None if ok else f"no se pudo crear {path}"
+
+    async def venv():
+        return await progress.run("venv", [sys.executable, "-m", "venv", ".venv"], path, slot=True)
+
+    async def deps():
+        requirements = ["-r", "requirements.txt"]
+        if spec["packages"]:
+            content = "# Dependencias del proyecto\n" + "".join(f"{pkg}\n" for pkg in spec["packages"])
+            await asyncio.to_thread(write_files, path, {"requirements.txt": content})
+        if spec["benchmarks"]:
+            options["benchmarks"] = await asyncio.to_thread(write_harness, path, "pip", entry_function(spec["archetype"]))
+            if not options["benchmarks"]:
+                return False, "no se encontró un punto de entrada main() para los benchmarks"
+            dev = {"requirements-dev.txt": generator.render_requirements_dev(DEV_DEPENDENCIES)}
+            await asyncio.to_thread(write_files, path, dev)
+            # requirements-dev.txt incluye requirements.txt
+            requirements = ["-r", "requirements-dev.txt"]
+        pip = str(generator.get_pip_path(path))
+        return await progress.run("deps", [pip, "install", *requirements], path, slot=True)
+
+    if not await progress.step("project", project) or not await progress.step("venv", venv):
+        return False
+    if spec["packages"] or spec["benchmarks"]:
+        return await progress.step("deps", deps)
+    return True
+
+
+async def _streamlit(spec, options, progress, generator, backend):
+    from comandos.rerun_bench import render_rerun_bench
+    from comandos.streamlit_templates import TEMPLATE_DEPENDENCIES
+
+    path = spec["path"]
+    packages = [*TEMPLATE_DEPENDENCIES.get(spec["template"], []), *spec["packages"]]
+
+    async def project():
+        path.mkdir()
+        created = await asyncio.to_thread(generator.create_project, spec["name"], spec["directory"])
+        ok = created[0] if isinstance(created, tuple) else created
+        files = {
+            ".streamlit/secrets.toml": generator.SECRETS_CONTENT,
+            ".gitignore": generator.GITIGNORE_CONTENT,
+            **generator.render_app(spec["template"], spec["perf_panel"]),
+        }
+        if spec["rerun_bench"]:
+            files.update(render_rerun_bench(spec["template"], backend))
+        await asyncio.to_thread(write_files, path, files)
+        return ok, None if ok else f"no se pudo crear {path}"
+
+    async def uv_deps():
+        return await progress.run("deps", ["uv", "add", "--no-sync", "streamlit", *packages], path, slot=True)
+
+    async def uv_venv():
+        return await progress.run("venv", ["uv", "lock"] if spec["lazy_env"] else ["uv", "sync"], path, slot=True)
+
+    async def pip_venv():
+        return await progress.run("venv", [sys.executable, "-m", "venv", ".venv"], path, slot=True)
+
+    async def pip_deps():
+        # requirements.txt ya trae Streamlit
+        with open(path / "requirements.txt", "a", encoding="utf-8") as f:
+            f.write("".join(f"{pkg}\n" for pkg in packages))
+        pip = str(generator.get_pip_path(path))
+        return await progress.run("deps", [pip, "install", "-r", "requirements.txt"], path, slot=True)
+
+    if not await progress.step("project", project):
+        return False
+    if backend == "uv":
+        ok = await progress.step("deps", uv_deps)
+        return await progress.step("venv", uv_venv) and ok
+    return await progress.step("venv", pip_venv) and await progress.step("deps", pip_deps)
+
+
+def _manifest_options(spec):
+    """Opciones con el mismo formato que guarda el CLI de cada generador."""
+    options = {"name": spec["name"], "packages": list(spec["packages"])}
+    if spec["generator"] == "python-uv":
+        options.update(
+            workspace=False, archetype=spec["archetype"], lazy_env=spec["lazy_env"], benchmarks=None, pythons=[],
+        )
+    elif spec["generator"] == "python-pip":
+        options.update(archetype=spec["archetype"], benchmarks=None, pythons=[])
+    else:
+        options.update(
+            template=spec["template"], layered=False, perf_panel=spec["perf_panel"], rerun_bench=spec["rerun_bench"],
+        )
+        if spec["generator"] == "streamlit-uv":
+            options["lazy_env"] = spec["lazy_env"]
+    return options
+
+
+async def _create(spec, progress):
+    """Crea el proyecto de `spec` emitiendo sus eventos; termina siempre con finished."""
+    from comandos.template_sources import render_source, template_params
+
+    start = time.perf_counter()
+    generator = _generator_module(spec["generator"])
+    kind, backend = spec["generator"].split("-")
+    options = _manifest_options(spec)
+    path = spec["path"]
+    ok, error = False, None
+    try:
+        spec["directory"].mkdir(parents=True, exist_ok=True)
+        if kind == "python" and backend == "uv":
+            ok = await _python_uv(spec, options, progress, generator)
+        elif kind == "python":
+            ok = await _python_pip(spec, options, progress, generator)
+        else:
+            ok = await _streamlit(spec, options, progress, generator, backend)
+        # Los pasos del generador terminan con el entorno: si alguno falló, `update` vuelve a sincronizar
+        synced = ok
+        if not path.exists():
+            return
+
+        if spec["git"]:
+            ok = await progress.step("git", lambda: progress.run("git", ["git", "init", "--quiet"], path)) and ok
+
+        async def template():
+            # La plantilla externa se escribe encima de los archivos del generador
+            params = template_params(options, generator.GENERATOR)
+            files, _, _ = await asyncio.to_thread(render_source, spec["template_source"], params)
+            await asyncio.to_thread(write_files, path, files)
+            options["template_source"] = spec["template_source"]
+            return True, None
+
+        if spec["template_source"]:
+            ok = await progress.step("template", template) and ok
+
+        async def manifest():
+            files, dependencies = await asyncio.to_thread(generator.render_files, options)
+            await asyncio.to_thread(save_manifest, path, generator.GENERATOR, options, files, dependencies, synced=synced)
+            return True, None
+
+        ok = await progress.step("manifest", manifest) and ok
+    except Exception as e:
+        # Fuera de los pasos: sin esto el motivo se perdería en create_projects
+        ok, error = False, str(e)
+    finally:
+        progress.emit(
+            "finished", ok=ok, path=str(path), seconds=round(time.perf_counter() - start, 3), options=options,
+            error=error,
+        )
+
+
+async def create_projects(specs):
+    """Crea varios proyectos a la vez y emite sus eventos según van llegando.
+
+    Todas las especificaciones se validan antes de empezar (ValueError).
+    """
+    specs = [complete_spec(spec) for spec in specs]
+    paths = [spec["path"] for spec in specs]
+    if len(set(paths)) != len(paths):
+        raise ValueError("hay dos especificaciones para el mismo proyecto")
+    # Las órdenes uv heredan la concurrencia calibrada para esta máquina
+    apply_tuning()
+    queue = asyncio.Queue()
+    tasks = [asyncio.create_task(_create(spec, _Progress(spec["name"], queue))) for spec in specs]
+    pending = len(tasks)
+    try:
+        while pending:
+            event = await queue.get()
+            if event["type"] == "finished":
+                pending -= 1
+            yield event
+    finally:
+        # Si se deja de iterar antes de tiempo, las creaciones en curso se cancelan
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def create_project(spec):
+    """Crea un proyecto según `spec` y emite sus eventos de progreso."""
+    async for event in create_projects([spec]):
+        yield event
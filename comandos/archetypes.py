@@ -0,0 +1,695 @@
+"""Arquetipos de rendimiento para los proyectos Python generados.
+
+Cada arquetipo cambia el main.py de ejemplo por el esqueleto de un patrón y
+trae un benchmark en benchmarks/ que demuestra que el patrón funciona. Solo
+usan la biblioteca estándar: no agregan dependencias.
+"""
+from comandos.benchmarking import SCRIPT_COMMANDS
+
+# Arquetipos disponibles; el básico es el main.py de siempre
+ARCHETYPE_CHOICES = ["basico", "cli", "servicio", "lotes"]
+
+ARCHETYPE_HELP = (
+    "basico: main.py de ejemplo · cli: subcomandos con imports perezosos · "
+    "servicio: asyncio con workers acotados · lotes: lectura en streaming y pool de procesos"
+)
+
+CLI_MAIN = '''"""CLI con imports perezosos.
+
+Cada subcomando vive en su propio módulo de cmds/ y solo se importa cuando se
+ejecuta: `--help` y los comandos ligeros no pagan lo que cuesta importar las
+dependencias de los pesados. Los argumentos se declaran aquí, no en cmds/,
+para que construir el parser no obligue a importar nada.
+
+Uso:
+    {script} main.py --help
+    {script} main.py saludo Ana
+    {script} main.py resumen datos.csv --columna precio
+"""
+import argparse
+import importlib
+import sys
+
+# subcomando -> "módulo:función" que lo ejecuta
+COMMANDS = {
+    "saludo": "cmds.saludo:run",
+    "resumen": "cmds.resumen:run",
+}
+
+
+def build_parser():
+    """Parser completo sin importar ningún subcomando."""
+    parser = argparse.ArgumentParser(description="CLI de ejemplo con imports perezosos")
+    subparsers = parser.add_subparsers(dest="command", metavar="comando")
+
+    saludo = subparsers.add_parser("saludo", help="saluda (comando ligero)")
+    saludo.add_argument("nombre", nargs="?", default="mundo")
+
+    resumen = subparsers.add_parser("resumen", help="estadísticas de una columna de un CSV (comando pesado)")
+    resumen.add_argument("csv", help="archivo CSV con cabecera")
+    resumen.add_argument("--columna", help="columna numérica (por defecto, la primera)")
+    return parser
+
+
+def dispatch(command, args):
+    """Importa el módulo del subcomando en el último momento y lo ejecuta."""
+    module_name, _, function = COMMANDS[command].partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, function)(args)
+
+
+def main(argv=None):
+    """Función principal: devuelve el código de salida."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return dispatch(args.command, args)
+
+
+def demo():
+    """Ejecución corta y representativa, para benchmarks y perfilado."""
+    return main(["saludo"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+CLI_PACKAGE = '''"""Subcomandos de la CLI: main.py importa cada uno solo al ejecutarlo."""
+'''
+
+CLI_GREETING = '''"""Subcomando ligero: no importa nada."""
+
+
+def run(args):
+    print(f"¡Hola, {args.nombre}!")
+    return 0
+'''
+
+CLI_SUMMARY = '''"""Subcomando pesado: sus imports solo se pagan al ejecutarlo.
+
+Sustituye csv y statistics por lo que use de verdad (pandas, numpy...):
+cuanto más pese el import, más se nota tenerlo aquí y no en main.py.
+"""
+import csv
+import statistics
+
+
+def run(args):
+    with open(args.csv, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        column = args.columna or reader.fieldnames[0]
+        values = [float(row[column]) for row in reader if row[column]]
+    if not values:
+        print(f"La columna '{column}' no tiene valores")
+        return 1
+    print(f"{column}: n={len(values)} media={statistics.fmean(values):.4g} "
+          f"mediana={statistics.median(values):.4g} desviación={statistics.pstdev(values):.4g}")
+    return 0
+'''
+
+CLI_BENCH = '''"""Demuestra que los imports perezosos de la CLI funcionan.
+
+Uso (desde la raíz del proyecto):
+    {script} benchmarks/bench_cli.py [--repeticiones N]
+
+Compara el arranque de `main.py saludo` con el mismo comando importando
+antes todos los subcomandos (lo que pasaría con imports al principio de
+main.py), y comprueba que el comando ligero no carga los módulos del pesado.
+Sale con código 1 si alguno se cuela.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Lo que importa el subcomando pesado y no debería cargar el ligero
+HEAVY_MODULES = ["cmds.resumen", "csv", "statistics"]
+
+LAZY = [sys.executable, "main.py", "saludo"]
+EAGER = [sys.executable, "-c", "import cmds.resumen, cmds.saludo, main; main.main(['saludo'])"]
+MODULES = [sys.executable, "-c", "import sys, main; main.main(['saludo']); print(*sys.modules)"]
+
+
+def median_ms(command, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los imports perezosos de la CLI")
+    parser.add_argument("--repeticiones", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline = median_ms([sys.executable, "-c", "pass"], args.repeticiones)
+    lazy = median_ms(LAZY, args.repeticiones)
+    eager = median_ms(EAGER, args.repeticiones)
+    print(f"python -c pass:            {baseline:7.1f} ms")
+    print(f"perezoso (main.py saludo): {lazy:7.1f} ms  (+{lazy - baseline:.1f} ms)")
+    print(f"todo importado al inicio:  {eager:7.1f} ms  (+{eager - baseline:.1f} ms)")
+
+    loaded = subprocess.run(MODULES, cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+    leaked = [name for name in HEAVY_MODULES if name in loaded]
+    if leaked:
+        print(f"✗ `saludo` importa módulos del comando pesado: {', '.join(leaked)}")
+        return 1
+    print("✓ `saludo` no importa nada del comando pesado")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+SERVICE_MAIN = '''"""Servicio asyncio con un pool de workers acotado.
+
+- Número fijo de workers: nunca hay más de WORKERS trabajos en curso, por
+  muchos que lleguen (conexiones, descriptores y memoria bajo control).
+- Cola con tamaño máximo: si los workers no dan abasto, el productor espera
+  en lugar de acumular trabajos en memoria (backpressure).
+- Parada ordenada con Ctrl+C o SIGTERM: se deja de aceptar trabajo, se
+  terminan los pendientes y se cierran los workers.
+
+Uso:
+    {script} main.py                       # sirve hasta Ctrl+C
+    {script} main.py --trabajos 1000 --workers 16
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import random
+import signal
+import sys
+import time
+
+WORKERS = 8
+QUEUE_SIZE = 100
+
+
+async def handle(job):
+    """Atiende un trabajo. Sustitúyelo por la E/S real (HTTP, base de datos...)."""
+    await asyncio.sleep(job["espera"])
+
+
+class Service:
+    """Pool de workers que consume una cola acotada."""
+
+    def __init__(self, handler=handle, workers=WORKERS, queue_size=QUEUE_SIZE):
+        self.handler = handler
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.tasks = []
+        self.processed = 0
+        self.errors = 0
+        self.active = 0
+        self.peak_active = 0
+        self.peak_queued = 0
+
+    async def submit(self, job):
+        """Encola un trabajo; espera si la cola está llena."""
+        await self.queue.put(job)
+        self.peak_queued = max(self.peak_queued, self.queue.qsize())
+
+    async def _worker(self):
+        while True:
+            job = await self.queue.get()
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                await self.handler(job)
+                self.processed += 1
+            except Exception as e:
+                # Un trabajo que falla no debe tirar el worker
+                self.errors += 1
+                print(f"Error en el trabajo {job.get('id')}: {e}", file=sys.stderr)
+            finally:
+                self.active -= 1
+                self.queue.task_done()
+
+    async def __aenter__(self):
+        self.tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Se terminan los trabajos pendientes antes de cerrar los workers
+        if exc_info[0] is None:
+            await self.queue.join()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+def incoming(count=None):
+    """Trabajos de ejemplo; con count=None no se acaban nunca."""
+    ids = itertools.count() if count is None else range(count)
+    for job_id in ids:
+        yield {"id": job_id, "espera": random.uniform(0.005, 0.02)}
+
+
+def stop_event():
+    """Evento que se activa con Ctrl+C o SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Windows no admite señales en el bucle: allí Ctrl+C lanza KeyboardInterrupt
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+    return stop
+
+
+async def serve(jobs, workers=WORKERS, queue_size=QUEUE_SIZE, handler=handle):
+    """Reparte `jobs` entre los workers hasta agotarlos o recibir la señal de parada."""
+    stop = stop_event()
+    async with Service(handler, workers, queue_size) as service:
+        for job in jobs:
+            if stop.is_set():
+                break
+            await service.submit(job)
+    return service
+
+
+def main(argv=None):
+    """Función principal: devuelve el código de salida."""
+    parser = argparse.ArgumentParser(description="Servicio asyncio con workers acotados")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="trabajos en curso como máximo")
+    parser.add_argument("--cola", type=int, default=QUEUE_SIZE, help="trabajos en espera como máximo")
+    parser.add_argument("--trabajos", type=int, help="trabajos a procesar (por defecto, sin fin)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    service = asyncio.run(serve(incoming(args.trabajos), args.workers, args.cola))
+    elapsed = time.perf_counter() - start
+    print(f"{service.processed} trabajos en {elapsed:.2f} s ({service.processed / elapsed:.0f}/s), "
+          f"{service.errors} errores, máximo {service.peak_active} en curso")
+    return 1 if service.errors else 0
+
+
+def demo():
+    """Ejecución corta y representativa, para benchmarks y perfilado."""
+    return main(["--trabajos", "200"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+SERVICE_BENCH = '''"""Demuestra que el pool acotado del servicio funciona.
+
+Uso (desde la raíz del proyecto):
+    {script} benchmarks/bench_servicio.py [--trabajos N] [--espera S]
+
+Procesa los mismos trabajos de E/S simulada con 1 worker, con el pool
+acotado y lanzándolos todos a la vez sin límite. El pool debe multiplicar el
+rendimiento de un solo worker sin pasar nunca de WORKERS trabajos en curso
+ni de QUEUE_SIZE en espera, y con mucha menos memoria que sin límite. Sale
+con código 1 si no se cumple.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Permite importar main.py desde benchmarks/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import QUEUE_SIZE, WORKERS, serve
+
+
+def jobs(count, wait):
+    return ({"id": job_id, "espera": wait} for job_id in range(count))
+
+
+def measure(run):
+    """Ejecuta la corrutina que devuelve run() y mide tiempo y pico de memoria."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+async def unbounded(count, wait):
+    """Todos los trabajos a la vez: lo que el pool evita."""
+    await asyncio.gather(*(asyncio.sleep(job["espera"]) for job in jobs(count, wait)))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del pool de workers acotado")
+    parser.add_argument("--trabajos", type=int, default=2000)
+    parser.add_argument("--espera", type=float, default=0.01, help="segundos de E/S simulada por trabajo")
+    args = parser.parse_args()
+
+    rows = []
+    failed = []
+    for workers in (1, WORKERS):
+        # Un worker tarda trabajos * espera: con menos trabajos basta para comparar
+        count = args.trabajos if workers > 1 else max(1, args.trabajos // 10)
+        service, elapsed, peak = measure(lambda: serve(jobs(count, args.espera), workers))
+        rows.append((f"{workers} worker(s)", count / elapsed, service.peak_active, service.peak_queued, peak))
+        if service.peak_active > workers or service.peak_queued > QUEUE_SIZE:
+            failed.append(f"con {workers} workers hubo {service.peak_active} en curso y {service.peak_queued} en cola")
+    _, elapsed, peak = measure(lambda: unbounded(args.trabajos, args.espera))
+    rows.append(("sin límite", args.trabajos / elapsed, args.trabajos, 0, peak))
+
+    print(f"{'':<14}{'trabajos/s':>12}{'en curso':>10}{'en cola':>9}{'memoria':>12}")
+    for name, rate, active, queued, peak in rows:
+        print(f"{name:<14}{rate:>12.0f}{active:>10}{queued:>9}{peak / 1024:>9.0f} KB")
+
+    single, pool, unlimited = rows
+    if pool[1] < single[1] * WORKERS / 2:
+        failed.append(f"el pool apenas mejora a un solo worker ({pool[1] / single[1]:.1f}x)")
+    if pool[4] >= unlimited[4]:
+        failed.append("el pool no usa menos memoria que sin límite")
+    for message in failed:
+        print(f"✗ {message}")
+    if failed:
+        return 1
+    print(f"✓ Pool acotado: {pool[1] / single[1]:.1f}x más rápido que un worker, "
+          f"{unlimited[4] / pool[4]:.0f}x menos memoria que sin límite")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+BATCH_MAIN = '''"""Trabajo por lotes: lectura por bloques en streaming y un pool de procesos.
+
+- La entrada nunca se carga entera: se lee en bloques de CHUNK_LINES líneas.
+- Cada bloque se procesa en un proceso del pool, así el trabajo de CPU usa
+  todos los núcleos (los hilos no lo harían por el GIL).
+- Solo hay unos pocos bloques en vuelo a la vez (IN_FLIGHT por proceso):
+  la memoria no crece con el tamaño del archivo. Pool.imap no sirve para
+  esto porque consume la entrada entera tan rápido como puede.
+- La salida se escribe en orden a medida que llegan los resultados.
+
+Uso:
+    {script} main.py --generar 1000000 entrada.csv   # datos de ejemplo
+    {script} main.py entrada.csv salida.csv --procesos 4
+"""
+import argparse
+import collections
+import itertools
+import math
+import multiprocessing
+import random
+import sys
+import time
+
+CHUNK_LINES = 10_000
+IN_FLIGHT = 2
+
+
+def read_chunks(path, size=CHUNK_LINES):
+    """Bloques de `size` líneas del archivo, sin leerlo entero."""
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = list(itertools.islice(f, size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def process_chunk(lines):
+    """Procesa un bloque. Sustitúyelo por el cálculo real.
+
+    Se ejecuta en otro proceso: debe estar definido a nivel de módulo y
+    recibir y devolver datos que se puedan serializar con pickle.
+    """
+    output = []
+    for line in lines:
+        values = [float(value) for value in line.split(",")]
+        norm = math.sqrt(sum(value * value for value in values))
+        output.append(f"{norm:.6f},{max(values):.6f},{min(values):.6f}\\n")
+    return output
+
+
+def run(source, target, processes=None, chunk_lines=CHUNK_LINES):
+    """Procesa `source` en paralelo y escribe el resultado en `target`.
+
+    Devuelve el número de líneas escritas.
+    """
+    processes = processes or multiprocessing.cpu_count()
+    written = 0
+    pending = collections.deque()
+    with multiprocessing.Pool(processes) as pool, open(target, "w", encoding="utf-8") as out:
+        for chunk in read_chunks(source, chunk_lines):
+            pending.append(pool.apply_async(process_chunk, (chunk,)))
+            # Con la ventana llena se espera al bloque más antiguo antes de leer más
+            if len(pending) >= processes * IN_FLIGHT:
+                result = pending.popleft().get()
+                out.writelines(result)
+                written += len(result)
+        while pending:
+            result = pending.popleft().get()
+            out.writelines(result)
+            written += len(result)
+    return written
+
+
+def run_serial(source, target, chunk_lines=CHUNK_LINES):
+    """Lo mismo en un solo proceso, como referencia."""
+    written = 0
+    with open(target, "w", encoding="utf-8") as out:
+        for chunk in read_chunks(source, chunk_lines):
+            result = process_chunk(chunk)
+            out.writelines(result)
+            written += len(result)
+    return written
+
+
+def generate(path, lines, columns=8, seed=0):
+    """Escribe un CSV de ejemplo con `lines` filas de números."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(lines):
+            f.write(",".join(f"{rng.uniform(-1000, 1000):.3f}" for _ in range(columns)) + "\\n")
+
+
+def main(argv=None):
+    """Función principal: devuelve el código de salida."""
+    parser = argparse.ArgumentParser(description="Trabajo por lotes en streaming con un pool de procesos")
+    parser.add_argument("entrada", help="CSV de entrada (o destino con --generar)")
+    parser.add_argument("salida", nargs="?", help="CSV de salida")
+    parser.add_argument("--procesos", type=int, help="procesos del pool (por defecto, uno por núcleo)")
+    parser.add_argument("--bloque", type=int, default=CHUNK_LINES, help="líneas por bloque")
+    parser.add_argument("--generar", type=int, metavar="FILAS", help="genera datos de ejemplo en `entrada`")
+    args = parser.parse_args(argv)
+
+    if args.generar:
+        generate(args.entrada, args.generar)
+        print(f"{args.generar} filas escritas en {args.entrada}")
+        return 0
+    if not args.salida:
+        parser.error("falta el archivo de salida")
+    start = time.perf_counter()
+    written = run(args.entrada, args.salida, args.procesos, args.bloque)
+    print(f"{written} filas procesadas en {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+def demo():
+    """Ejecución corta y representativa, para benchmarks y perfilado.
+
+    Va en un solo proceso para que el perfilador vea process_chunk.
+    """
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = Path(tmp) / "entrada.csv", Path(tmp) / "salida.csv"
+        generate(source, 20_000)
+        return run_serial(source, target)
+
+
+if __name__ == "__main__":
+    # Necesario con multiprocessing en Windows y macOS (los procesos se lanzan con spawn)
+    sys.exit(main())
+'''
+
+BATCH_BENCH = '''"""Demuestra que el streaming por bloques y el pool de procesos funcionan.
+
+Uso (desde la raíz del proyecto):
+    {script} benchmarks/bench_lotes.py [--filas N] [--procesos N]
+
+Procesa el mismo CSV en un solo proceso y con el pool, y mide la memoria
+del pool y de una versión que carga el archivo entero con N y con 2N filas.
+El pool debe dar el mismo resultado, mantener la memoria plana aunque la
+entrada se duplique y, con más de un núcleo, tardar menos. Sale con código 1
+si no se cumple.
+"""
+import argparse
+import filecmp
+import multiprocessing
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Permite importar main.py desde benchmarks/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import generate, process_chunk, run, run_serial
+
+# Bloques pequeños para que con muchos núcleos la ventana en vuelo siga
+# siendo mucho menor que la entrada
+CHUNK_LINES = 1_000
+
+
+def run_in_memory(source, target):
+    """Sin streaming: todo el archivo y todo el resultado en memoria."""
+    with open(source, encoding="utf-8") as f:
+        lines = f.readlines()
+    result = process_chunk(lines)
+    with open(target, "w", encoding="utf-8") as out:
+        out.writelines(result)
+    return len(result)
+
+
+def elapsed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def peak_memory(function, *args):
+    """Pico de memoria de este proceso (los del pool van aparte).
+
+    Se mide aparte del tiempo: tracemalloc ralentiza el código que vigila.
+    """
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del trabajo por lotes")
+    parser.add_argument("--filas", type=int, default=50_000)
+    parser.add_argument("--procesos", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        small, large = tmp / "entrada.csv", tmp / "entrada-x2.csv"
+        generate(small, args.filas)
+        generate(large, args.filas * 2)
+
+        serial = elapsed(run_serial, small, tmp / "serie.csv", CHUNK_LINES)
+        pool = elapsed(run, small, tmp / "pool.csv", args.procesos, CHUNK_LINES)
+        same = filecmp.cmp(tmp / "serie.csv", tmp / "pool.csv", shallow=False)
+        memory = {
+            name: [peak_memory(function, source, tmp / "salida.csv", *extra) for source in (small, large)]
+            for name, function, extra in [
+                ("todo en memoria", run_in_memory, ()),
+                ("streaming + pool", run, (args.procesos, CHUNK_LINES)),
+            ]
+        }
+
+    print(f"Tiempo con {args.filas} filas:")
+    print(f"  streaming, 1 proceso       {serial:6.2f} s")
+    print(f"  streaming + pool ({args.procesos:>2})     {pool:6.2f} s")
+    print("Pico de memoria (filas / doble de filas):")
+    for name, (one, two) in memory.items():
+        print(f"  {name:<24} {one / 2**20:6.1f} MB / {two / 2**20:6.1f} MB")
+
+    failed = []
+    if not same:
+        failed.append("el pool no da el mismo resultado que un solo proceso")
+    one, two = memory["streaming + pool"]
+    if two > one * 1.5:
+        failed.append("la memoria del pool crece con el tamaño de la entrada")
+    if args.procesos > 1 and multiprocessing.cpu_count() > 1 and pool >= serial:
+        failed.append("el pool no es más rápido que un solo proceso")
+    for message in failed:
+        print(f"✗ {message}")
+    if failed:
+        return 1
+    print(f"✓ Memoria plana con el doble de entrada; pool {serial / pool:.1f}x frente a un solo proceso")
+    if multiprocessing.cpu_count() == 1:
+        print("  (esta máquina tiene un solo núcleo: el pool no puede acelerar nada)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+
+def render_archetype(archetype, backend):
+    """Devuelve los archivos de un arquetipo como {ruta relativa: contenido}."""
+    if archetype == "cli":
+        files = {
+            "main.py": CLI_MAIN,
+            "cmds/__init__.py": CLI_PACKAGE,
+            "cmds/saludo.py": CLI_GREETING,
+            "cmds/resumen.py": CLI_SUMMARY,
+            "benchmarks/bench_cli.py": CLI_BENCH,
+        }
+    elif archetype == "servicio":
+        files = {"main.py": SERVICE_MAIN, "benchmarks/bench_servicio.py": SERVICE_BENCH}
+    elif archetype == "lotes":
+        files = {"main.py": BATCH_MAIN, "benchmarks/bench_lotes.py": BATCH_BENCH}
+    else:
+        raise ValueError(f"Arquetipo desconocido: {archetype}")
+    script = SCRIPT_COMMANDS[backend]
+    return {path: content.replace("{script}", script) for path, content in files.items()}
+
+
+def entry_function(archetype):
+    """Función de main.py que ejecutan los benchmarks y el perfilado.
+
+    main() de los arquetipos lee la línea de comandos (y el servicio no
+    termina nunca); demo() hace una ejecución corta y representativa.
+    """
+    return "main" if archetype == "basico" else "demo"
+
+
+def startup_args(archetype):
+    """Argumentos del intérprete para medir el arranque, o None para el de siempre."""
+    if archetype == "cli":
+        return ["main.py", "--help"]
+    if archetype in ("servicio", "lotes"):
+        # Ejecutarlos arrancaría el servicio o pediría archivos: basta con importarlos
+        return ["-c", "import main"]
+    return None
+
+
+def usage_rows(archetype, backend):
+    """(comando, descripción) para los próximos pasos del generador."""
+    script = SCRIPT_COMMANDS[backend]
+    rows = {
+        "cli": [
+            (f"{script} main.py --help", "Ver los subcomandos"),
+            (f"{script} main.py saludo Ana", "Ejecutar un subcomando"),
+        ],
+        "servicio": [
+            (f"{script} main.py", "Arrancar el servicio (Ctrl+C para parar)"),
+            (f"{script} main.py --trabajos 1000 --workers 16", "Procesar un número fijo de trabajos"),
+        ],
+        "lotes": [
+            (f"{script} main.py --generar 1000000 entrada.csv", "Generar datos de ejemplo"),
+            (f"{script} main.py entrada.csv salida.csv", "Procesar el archivo con todos los núcleos"),
+        ],
+    }.get(archetype, [])
+    if rows:
+        rows.append((f"{script} benchmarks/bench_{archetype}.py", "Demostrar que el patrón funciona"))
+    return rows
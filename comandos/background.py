@@ -0,0 +1,44 @@
+"""Pasos lentos en segundo plano mientras el usuario responde los prompts."""
+from concurrent.futures import ThreadPoolExecutor
+
+from comandos import resources
+
+
+class BackgroundTasks:
+    """Lanza pasos con nombre en hilos y recoge su resultado cuando hace falta.
+
+    Solo deben lanzarse pasos que no dependan de respuestas pendientes y que
+    no escriban en la terminal, para no mezclar su salida con los prompts.
+    """
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="comandos")
+        self._futures = {}
+
+    def start(self, name, fn, *args, **kwargs):
+        """Lanza fn(*args, **kwargs) en segundo plano con el nombre dado."""
+        self._futures[name] = self._executor.submit(fn, *args, **kwargs)
+
+    def started(self, name):
+        """Indica si hay un paso pendiente de recoger con ese nombre."""
+        return name in self._futures
+
+    def join(self, name):
+        """Espera al paso y devuelve su resultado (o relanza su excepción)."""
+        return self._futures.pop(name).result()
+
+    def shutdown(self):
+        """Espera a que terminen los pasos que nadie ha recogido."""
+        self._executor.shutdown(wait=True)
+
+
+def run_quiet(command, cwd=None):
+    """Ejecuta un comando sin escribir en la terminal.
+
+    Devuelve (ok, mensaje de error) para poder informar al recoger el paso.
+    """
+    try:
+        result = resources.run(command, cwd=cwd, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        return False, str(e)
+    return result.returncode == 0, (result.stderr or result.stdout).strip()
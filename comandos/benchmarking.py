@@ -0,0 +1,166 @@
+"""Arnés de benchmarks y perfilado para los proyectos Python generados."""
+import re
+
+from comandos.update import write_files
+
+DEV_DEPENDENCIES = ["pytest", "pytest-benchmark", "pyinstrument"]
+
+CONFTEST = '''"""Configuración compartida de los benchmarks."""
+import sys
+from pathlib import Path
+
+# Permite importar los módulos de la raíz del proyecto (main.py) desde benchmarks/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+'''
+
+BENCH_MAIN = '''"""Benchmarks del punto de entrada.
+
+Cada función test_* recibe el fixture `benchmark` de pytest-benchmark, que
+repite la llamada las veces necesarias y calcula estadísticas estables.
+"""
+from {module} import {entry}
+
+
+def test_main(benchmark, capsys):
+    """Tiempo de una ejecución completa de {entry}()."""
+    benchmark({entry})
+'''
+
+PROFILING = '''"""Perfilado del punto de entrada.
+
+Uso:
+    {script} profiling.py              # cProfile (determinista)
+    {script} profiling.py --sampling   # pyinstrument (muestreo, menos overhead)
+
+Los resultados se guardan en .profiles/ con fecha y hora en el nombre.
+"""
+import argparse
+import cProfile
+import pstats
+import time
+from pathlib import Path
+
+from {module} import {entry}
+
+OUTPUT_DIR = Path(__file__).resolve().parent / ".profiles"
+
+
+def run_cprofile(stamp, limit):
+    """Perfila {entry}() con cProfile y muestra las funciones más costosas."""
+    output = OUTPUT_DIR / f"main-{{stamp}}.prof"
+    profiler = cProfile.Profile()
+    profiler.runcall({entry})
+    profiler.dump_stats(output)
+    pstats.Stats(str(output)).sort_stats("cumulative").print_stats(limit)
+    print(f"Perfil guardado en {{output}}")
+    print(f"Explóralo con: python -m pstats {{output}}")
+
+
+def run_sampling(stamp, interval):
+    """Perfila {entry}() por muestreo con pyinstrument."""
+    from pyinstrument import Profiler
+
+    profiler = Profiler(interval=interval)
+    profiler.start()
+    {entry}()
+    profiler.stop()
+    output = OUTPUT_DIR / f"main-{{stamp}}.html"
+    output.write_text(profiler.output_html(), encoding="utf-8")
+    print(profiler.output_text(unicode=True))
+    print(f"Perfil guardado en {{output}}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Perfila el punto de entrada del proyecto")
+    parser.add_argument("--sampling", action="store_true", help="usar el perfilador por muestreo")
+    parser.add_argument("--interval", type=float, default=0.001, help="intervalo de muestreo en segundos")
+    parser.add_argument("--limit", type=int, default=20, help="funciones a mostrar con cProfile")
+    args = parser.parse_args()
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    if args.sampling:
+        run_sampling(stamp, args.interval)
+    else:
+        run_cprofile(stamp, args.limit)
+'''
+
+BENCH_README = '''# Benchmarks y perfilado
+
+## Benchmarks
+
+Los benchmarks viven en `benchmarks/` y usan
+[pytest-benchmark](https://pytest-benchmark.readthedocs.io/).
+
+```bash
+# Ejecutar los benchmarks
+{pytest} benchmarks
+
+# Guardar el resultado como línea base (se guarda en .benchmarks/)
+{pytest} benchmarks --benchmark-autosave
+
+# Comparar con la última línea base y fallar si la media empeora más de un 10 %
+{pytest} benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+```
+
+Versiona `.benchmarks/` si quieres compartir la línea base con el equipo;
+compara siempre resultados obtenidos en la misma máquina.
+
+## Perfilado
+
+```bash
+# cProfile: resultado en .profiles/main-<fecha>.prof
+{script} profiling.py
+
+# Muestreo con pyinstrument: informe HTML en .profiles/main-<fecha>.html
+{script} profiling.py --sampling
+```
+'''
+
+PYTEST_COMMANDS = {
+    "uv": "uv run pytest",
+    "pip": "python -m pytest",
+}
+
+SCRIPT_COMMANDS = {
+    "uv": "uv run",
+    "pip": "python",
+}
+
+
+def find_entry_module(project_path):
+    """Devuelve el módulo que define main(): main.py o el paquete en src/."""
+    if (project_path / "main.py").exists():
+        return "main"
+    src_path = project_path / "src"
+    if src_path.is_dir():
+        for package_path in sorted(src_path.iterdir()):
+            if (package_path / "__init__.py").exists():
+                return package_path.name
+    return None
+
+
+def render_harness(module, backend, entry="main"):
+    """Devuelve los archivos del arnés como {ruta relativa: contenido}.
+
+    `entry` es la función del módulo que se mide y se perfila.
+    """
+    commands = {"pytest": PYTEST_COMMANDS[backend], "script": SCRIPT_COMMANDS[backend]}
+    return {
+        "benchmarks/conftest.py": CONFTEST,
+        "benchmarks/test_bench_main.py": BENCH_MAIN.format(module=module, entry=entry),
+        "benchmarks/README.md": BENCH_README.format(**commands),
+        "profiling.py": PROFILING.format(module=module, entry=entry, **commands),
+    }
+
+
+def write_harness(project_path, backend, entry="main"):
+    """Escribe el arnés en el proyecto.
+
+    Devuelve el módulo del punto de entrada, o None si no hay ninguno.
+    """
+    module = find_entry_module(project_path)
+    if module is None or not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", module):
+        return None
+    write_files(project_path, render_harness(module, backend, entry))
+    return module
@@ -0,0 +1,23 @@
+"""Directorio de caché compartido por los generadores."""
+import os
+import sys
+from pathlib import Path
+
+
+def cache_root():
+    """Devuelve la raíz de la caché (COMANDOS_CACHE_DIR o la del sistema)."""
+    if os.environ.get("COMANDOS_CACHE_DIR"):
+        return Path(os.environ["COMANDOS_CACHE_DIR"])
+    if sys.platform == "win32":
+        local_app_data = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        return Path(local_app_data) / "comandos" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "comandos"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "comandos"
+
+
+def cache_dir(*parts):
+    """Devuelve un subdirectorio de la caché, creándolo si no existe."""
+    path = cache_root().joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,276 @@
+"""Calibración de la concurrencia del instalador para esta máquina.
+
+Instala los mismos paquetes desde un wheelhouse local (sin red) con distintos
+ajustes y guarda los mejores (comandos.tuning), que los generadores aplican
+después solos:
+
+- UV: UV_CONCURRENT_INSTALLS, con la caché de UV vacía en cada instalación.
+  Solo se guarda si mejora claramente lo que UV hace por defecto. Desde un
+  wheelhouse local no se descarga nada, así que UV_CONCURRENT_DOWNLOADS no
+  se puede medir y se deja como esté.
+- pip instala de uno en uno: se mide cuántas instalaciones a la vez rinden
+  más en total, que es el número de plazas de instalación de la máquina.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.cache import cache_dir
+from comandos.package_index import normalize
+from comandos.prefetch import wheelhouse_dir
+from comandos.tuning import UV_SETTINGS, load_tuning, reset_tuning, save_tuning, tuning_path
+
+console = Console()
+
+# Mejora mínima frente a lo que UV hace por defecto para fijar un ajuste
+MIN_GAIN = 0.05
+
+# Un instalador más a la vez solo si el rendimiento total sube al menos esto
+PIP_MIN_GAIN = 0.1
+
+
+def levels():
+    """Valores de concurrencia a probar: potencias de 2 hasta el doble de núcleos."""
+    top = max(4, 2 * (os.cpu_count() or 1))
+    values, value = [], 1
+    while value <= top:
+        values.append(value)
+        value *= 2
+    return values
+
+
+def install_args(wheelhouse, packages):
+    """Argumentos de instalación sin red desde el wheelhouse.
+
+    Sin paquetes se instala una rueda de cada paquete del wheelhouse. El de
+    comandos guarda las ruedas en un subdirectorio por descarga: se buscan en
+    todos.
+    """
+    wheels = sorted(wheelhouse.rglob("*.whl"))
+    if not wheels:
+        return None
+    if packages:
+        find_links = sorted({str(wheel.parent) for wheel in wheels})
+        return ["--no-index", *[arg for link in find_links for arg in ("--find-links", link)], *packages]
+    by_name = {}
+    for wheel in wheels:
+        by_name[normalize(wheel.name.split("-")[0])] = str(wheel)
+    return ["--no-index", *by_name.values()]
+
+
+def _check(result, command):
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(str(arg) for arg in command)}\n{(result.stderr or '').strip()}")
+
+
+def uv_install(workdir, args, settings):
+    """Instala en un directorio nuevo con la caché de UV vacía; devuelve los segundos."""
+    run_dir = Path(tempfile.mkdtemp(dir=workdir))
+    env = {name: value for name, value in os.environ.items() if name not in UV_SETTINGS}
+    env.update({name: str(value) for name, value in settings.items()})
+    # Caché en el mismo sistema de archivos que el destino: UV enlaza como en un proyecto real
+    env["UV_CACHE_DIR"] = str(run_dir / "cache")
+    command = [
+        "uv", "pip", "install", "--quiet", "--offline", "--python", sys.executable,
+        "--target", str(run_dir / "target"), *args,
+    ]
+    try:
+        start = time.perf_counter()
+        result = resources.run(command, env=env, capture_output=True, text=True, step="calibración uv")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    _check(result, command)
+    return elapsed
+
+
+def pip_installs(workdir, args, count):
+    """Lanza `count` instalaciones de pip a la vez; devuelve los segundos hasta que acaban todas."""
+    run_dirs = [Path(tempfile.mkdtemp(dir=workdir)) for _ in range(count)]
+
+    def install(run_dir):
+        command = [
+            sys.executable, "-m", "pip", "install", "--quiet", "--no-cache-dir", "--disable-pip-version-check",
+            "--target", str(run_dir), *args,
+        ]
+        return command, resources.run(command, capture_output=True, text=True, step="calibración pip")
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(install, run_dirs))
+        elapsed = time.perf_counter() - start
+    finally:
+        for run_dir in run_dirs:
+            shutil.rmtree(run_dir, ignore_errors=True)
+    for command, result in results:
+        _check(result, command)
+    return elapsed
+
+
+def median_of(repeats, measure):
+    return statistics.median(measure() for _ in range(repeats))
+
+
+def calibrate_uv(workdir, args, repeats):
+    """Devuelve (ajustes de UV que mejoran lo de por defecto, mediciones)."""
+    # La primera instalación paga la lectura del wheelhouse desde disco: no se mide
+    uv_install(workdir, args, {})
+    with console.status("[bold green]UV con los ajustes por defecto..."):
+        reference = median_of(repeats, lambda: uv_install(workdir, args, {}))
+    measurements = {"default": reference}
+    best = {}
+    for name in UV_SETTINGS:
+        timings = {}
+        for value in levels():
+            with console.status(f"[bold green]UV con {name}={value}..."):
+                timings[value] = median_of(repeats, lambda: uv_install(workdir, args, {**best, name: value}))
+        measurements[name] = timings
+        value, seconds = min(timings.items(), key=lambda item: item[1])
+        if seconds < reference * (1 - MIN_GAIN):
+            best[name] = value
+            reference = seconds
+    return best, measurements
+
+
+def calibrate_pip(workdir, args, repeats):
+    """Devuelve (instaladores a la vez que más rinden, mediciones)."""
+    measurements, best, best_rate = {}, 1, 0
+    for count in levels():
+        if count > best * 2:
+            # El nivel anterior ya no mejoró: con más instaladores a la vez solo se compite por lo mismo
+            break
+        with console.status(f"[bold green]pip con {count} instalación(es) a la vez..."):
+            seconds = median_of(repeats, lambda: pip_installs(workdir, args, count))
+        measurements[count] = seconds
+        rate = count / seconds
+        if rate > best_rate * (1 + PIP_MIN_GAIN):
+            best, best_rate = count, rate
+    return best, measurements
+
+
+def uv_table(measurements, chosen):
+    table = Table(title="UV (mediana por instalación)", title_style="bold")
+    table.add_column("Ajuste", style="cyan")
+    table.add_column("Tiempo", justify="right")
+    table.add_column("Frente a por defecto", justify="right")
+    default = measurements["default"]
+    table.add_row("por defecto", f"{default:.2f} s", "")
+    for name, timings in measurements.items():
+        if name == "default":
+            continue
+        for value, seconds in timings.items():
+            mark = " [green]✓[/green]" if chosen.get(name) == value else ""
+            table.add_row(f"{name}={value}{mark}", f"{seconds:.2f} s", f"{seconds / default - 1:+.0%}")
+    return table
+
+
+def pip_table(measurements, chosen):
+    table = Table(title="pip (instalaciones a la vez)", title_style="bold")
+    table.add_column("A la vez", style="cyan", justify="right")
+    table.add_column("Tiempo", justify="right")
+    table.add_column("Instalaciones/min", justify="right")
+    for count, seconds in measurements.items():
+        mark = " [green]✓[/green]" if count == chosen else ""
+        table.add_row(f"{count}{mark}", f"{seconds:.2f} s", f"{count / seconds * 60:.1f}")
+    return table
+
+
+def show_tuning():
+    tuning = load_tuning()
+    if not tuning:
+        console.print("[yellow]⚠️  Esta máquina no está calibrada: se usan los valores por defecto[/yellow]")
+        console.print("[dim]Calíbrala con: comandos calibrate[/dim]")
+        return 0
+    table = Table(title=f"Calibración de {tuning['host']} ({tuning['calibrated_at']})", title_style="bold")
+    table.add_column("Ajuste", style="cyan")
+    table.add_column("Calibrado", justify="right")
+    table.add_column("En uso", justify="right")
+    for name in UV_SETTINGS:
+        value = tuning.get("uv", {}).get(name)
+        in_use = os.environ.get(name, value)
+        table.add_row(name, str(value) if value is not None else "por defecto", str(in_use) if in_use else "por defecto")
+    installs = tuning.get("installs")
+    table.add_row(
+        "instalaciones a la vez", str(installs) if installs else "-",
+        os.environ.get("COMANDOS_MAX_INSTALLS") or (str(installs) if installs else "-"),
+    )
+    console.print(table)
+    console.print(f"[dim]{tuning_path()}[/dim]")
+    return 0
+
+
+def main(argv=None, prog=None):
+    """Punto de entrada de la calibración."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Mide instalaciones desde un wheelhouse local con distinta concurrencia y guarda la mejor para esta máquina"
+    )
+    parser.add_argument("--wheelhouse", type=Path, help="directorio con las ruedas (por defecto, el de la caché de comandos)")
+    parser.add_argument("--packages", nargs="*", default=[], help="paquetes a instalar (por defecto, una rueda de cada uno)")
+    parser.add_argument("--backend", choices=["uv", "pip", "all"], default="all", help="instalador a calibrar")
+    parser.add_argument("--repeats", type=int, default=3, help="instalaciones por ajuste")
+    parser.add_argument("--show", action="store_true", help="muestra la calibración guardada")
+    parser.add_argument("--reset", action="store_true", help="borra la calibración y vuelve a los valores por defecto")
+    args = parser.parse_args(argv)
+
+    if args.show:
+        return show_tuning()
+    if args.reset:
+        if reset_tuning():
+            console.print("[green]✓[/green] Calibración borrada")
+        else:
+            console.print("[dim]No había calibración[/dim]")
+        return 0
+
+    wheelhouse = (args.wheelhouse or wheelhouse_dir()).resolve()
+    arguments = install_args(wheelhouse, args.packages) if wheelhouse.is_dir() else None
+    if not arguments:
+        console.print(f"[red]❌ No hay ruedas en {wheelhouse}[/red]")
+        console.print("[dim]Llénalo con: pip download -d <directorio> <paquetes>, y pásalo con --wheelhouse[/dim]")
+        return 1
+    backends = ["uv", "pip"] if args.backend == "all" else [args.backend]
+    if "uv" in backends and not shutil.which("uv"):
+        console.print("[yellow]⚠️  UV no está instalado: solo se calibra pip[/yellow]")
+        backends.remove("uv")
+        if not backends:
+            return 1
+
+    # Lo que no se calibra ahora se conserva de la calibración anterior
+    previous = load_tuning()
+    uv_settings, installs = previous.get("uv", {}), previous.get("installs")
+    measurements = previous.get("measurements", {})
+    try:
+        with tempfile.TemporaryDirectory(dir=cache_dir("tmp")) as workdir:
+            if "uv" in backends:
+                uv_settings, measurements["uv"] = calibrate_uv(workdir, arguments, args.repeats)
+                console.print(uv_table(measurements["uv"], uv_settings))
+            if "pip" in backends:
+                installs, measurements["pip"] = calibrate_pip(workdir, arguments, args.repeats)
+                console.print(pip_table(measurements["pip"], installs))
+    except RuntimeError as e:
+        console.print(f"[red]✗[/red] Falló una instalación:\n[dim]{e}[/dim]")
+        return 1
+
+    path = save_tuning(uv_settings, installs, measurements)
+    chosen = [f"{name}={value}" for name, value in uv_settings.items()]
+    if installs:
+        chosen.append(f"{installs} instalación(es) a la vez")
+    console.print(f"[green]✓[/green] Calibración guardada en {path}")
+    console.print(f"[dim]Los generadores usarán: {', '.join(chosen) or 'los valores por defecto'}[/dim]")
+    return 0
@@ -0,0 +1,59 @@
+"""Punto de entrada único: `comandos <tipo> <backend>` y las herramientas.
+
+Solo se importa el módulo del subcomando elegido: `comandos python uv` no
+carga los otros generadores, y `comandos --help` no carga ninguno ni Rich.
+Por eso aquí no hay más imports que los imprescindibles.
+"""
+import importlib
+import sys
+
+# (tipo, backend) -> módulo con cli(argv, prog)
+GENERATORS = {
+    ("python", "uv"): "comandos.generators.python_uv",
+    ("python", "pip"): "comandos.generators.python_pip",
+    ("streamlit", "uv"): "comandos.generators.streamlit_uv",
+    ("streamlit", "pip"): "comandos.generators.streamlit_pip",
+}
+
+KINDS = {
+    "python": "crea un proyecto Python genérico",
+    "streamlit": "crea una aplicación Streamlit",
+}
+
+# herramienta -> (módulo con main(argv, prog), ayuda)
+TOOLS = {
+    "compare": ("comandos.compare", "compara UV y pip construyendo el mismo proyecto"),
+    "calibrate": ("comandos.calibrate", "mide la concurrencia del instalador que más rinde en esta máquina"),
+    "snapshot": ("comandos.snapshot", "empaqueta o restaura un proyecto con su entorno"),
+    "inventory": ("comandos.inventory", "índice SQLite de los proyectos generados en un directorio"),
+    "startup-check": ("comandos.selfcheck", "comprueba el tiempo de arranque de la CLI (para CI)"),
+}
+
+
+def build_parser():
+    """Parser solo para la ayuda y los errores: el despacho no lo necesita."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="comandos", description="Generadores de proyectos Python y Streamlit")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="comando")
+    for kind, help_text in KINDS.items():
+        kind_parser = subparsers.add_parser(kind, help=help_text)
+        kind_parser.add_argument("backend", choices=["uv", "pip"], help="gestor de paquetes y entornos")
+    for tool, (_, help_text) in TOOLS.items():
+        subparsers.add_parser(tool, help=help_text)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 2 and tuple(argv[:2]) in GENERATORS:
+        module = importlib.import_module(GENERATORS[tuple(argv[:2])])
+        return module.cli(argv[2:], prog=f"comandos {argv[0]} {argv[1]}")
+    if argv and argv[0] in TOOLS:
+        module = importlib.import_module(TOOLS[argv[0]][0])
+        return module.main(argv[1:], prog=f"comandos {argv[0]}")
+    # Lo que llega aquí es --help o un error: argparse lo explica y sale
+    parser = build_parser()
+    parser.parse_args(argv)
+    parser.print_help()
+    return 2
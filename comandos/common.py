@@ -0,0 +1,99 @@
+"""Comprobaciones e integraciones compartidas por los cuatro generadores."""
+import os
+import subprocess
+import sys
+
+from comandos import resources
+
+
+def check_uv(console):
+    """Verifica si UV está instalado."""
+    try:
+        resources.run(["uv", "--version"], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        console.print("[red]❌ UV no está instalado[/red]")
+        console.print("\n[yellow]Instálalo con:[/yellow]")
+        console.print("  Windows:  [cyan]powershell -c \"irm https://astral.sh/uv/install.ps1 | iex\"[/cyan]")
+        console.print("  Linux/Mac: [cyan]curl -LsSf https://astral.sh/uv/install.sh | sh[/cyan]")
+        return False
+
+
+def check_pip(console):
+    """Verifica si pip está instalado."""
+    try:
+        resources.run(["pip", "--version"], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        console.print("[red]❌ pip no está instalado correctamente[/red]")
+        console.print("\n[yellow]Instálalo con:[/yellow]")
+        console.print("  [cyan]python -m ensurepip --upgrade[/cyan]")
+        return False
+
+
+def check_cursor():
+    """Verifica si Cursor está instalado y disponible."""
+    try:
+        if sys.platform == "win32":
+            resources.run(["where", "cursor"], capture_output=True, check=True)
+        else:
+            resources.run(["which", "cursor"], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def check_gh():
+    """Verifica si GitHub CLI está instalado y disponible."""
+    try:
+        resources.run(["gh", "--version"], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def open_in_cursor(project_path, console):
+    """Intenta abrir el proyecto en Cursor IDE."""
+    try:
+        if sys.platform == "win32":
+            # En Windows, usar shell=True para mejor compatibilidad
+            resources.run(f'cursor "{str(project_path)}"', shell=True, check=True)
+        else:
+            # En Linux/Mac
+            resources.run(["cursor", str(project_path)], check=True)
+        return True
+    except Exception as e:
+        console.print(f"[yellow]Debug:[/yellow] {e}")
+        # Método alternativo
+        try:
+            os.system(f'cursor "{str(project_path)}"')
+            return True
+        except Exception as e2:
+            console.print(f"[red]Error:[/red] {e2}")
+            return False
+
+
+def create_github_repo(project_name, project_path, console, visibility="private", init=False):
+    """Crea un repositorio en GitHub usando gh CLI.
+
+    Los generadores con pip no inicializan Git antes: lo hace aquí init=True.
+    """
+    try:
+        # Primero hacer el commit inicial
+        console.print("[dim]Creando commit inicial...[/dim]")
+        if init:
+            resources.run(["git", "init"], cwd=project_path, check=True)
+        resources.run(["git", "add", "."], cwd=project_path, check=True)
+        resources.run(["git", "commit", "-m", "Initial commit"], cwd=project_path, check=True)
+
+        # Crear el repositorio en GitHub
+        console.print("[dim]Creando repositorio en GitHub...[/dim]")
+        resources.run(
+            ["gh", "repo", "create", project_name, f"--{visibility}", "--source", ".", "--remote", "origin", "--push"],
+            cwd=project_path,
+            check=True
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Error creando repositorio en GitHub:[/red] {e}")
+        return False
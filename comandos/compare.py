@@ -0,0 +1,231 @@
+"""Comparación de los backends UV y pip construyendo el mismo proyecto."""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.common import check_uv
+from comandos.generators import python_pip, python_uv, streamlit_pip, streamlit_uv
+from comandos.resources import format_bytes
+
+console = Console()
+
+PROJECT_NAME = "proyecto-comparado"
+
+
+def uv_steps(kind, packages, workdir):
+    """Comandos que ejecutan python-uv.py / streamlit-uv.py para el proyecto."""
+    generator = python_uv if kind == "python" else streamlit_uv
+    project_path = workdir / PROJECT_NAME
+    steps = []
+    if kind == "python":
+        steps.append((python_uv.init_command(PROJECT_NAME), workdir))
+    # Los generadores instalan los paquetes de uno en uno
+    for pkg in packages:
+        steps.append((generator.add_command([pkg]), project_path))
+    steps.append((generator.sync_command(), project_path))
+    return project_path, steps
+
+
+def pip_steps(kind, packages, workdir):
+    """Comandos que ejecutan python-pip.py / streamlit-pip.py para el proyecto."""
+    generator = python_pip if kind == "python" else streamlit_pip
+    project_path = workdir / PROJECT_NAME
+    steps = [(generator.venv_command(), project_path)]
+    for pkg in packages:
+        steps.append((generator.install_command(project_path, [pkg]), project_path))
+    return project_path, steps
+
+
+BACKENDS = {
+    "uv": uv_steps,
+    "pip": pip_steps,
+}
+
+
+def disk_usage(path):
+    """Devuelve (bytes, archivos, bytes compartidos por enlaces duros) de un árbol."""
+    total = files = shared = 0
+    seen = set()
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                stat = os.lstat(os.path.join(root, name))
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            files += 1
+            total += stat.st_size
+            # UV enlaza desde su caché: esos bytes no ocupan espacio nuevo
+            if stat.st_nlink > 1:
+                shared += stat.st_size
+    return total, files, shared
+
+
+def build_once(backend, kind, packages, env):
+    """Construye el proyecto una vez y devuelve sus métricas."""
+    workdir = Path(tempfile.mkdtemp(prefix="comandos-compare-"))
+    try:
+        project_path, steps = BACKENDS[backend](kind, packages, workdir)
+        if kind == "streamlit" and backend == "uv":
+            # streamlit-uv.py escribe su propio pyproject.toml en lugar de usar uv init
+            project_path.mkdir()
+            (project_path / "pyproject.toml").write_text(
+                streamlit_uv.render_pyproject(PROJECT_NAME), encoding="utf-8"
+            )
+        else:
+            project_path.mkdir(exist_ok=True)
+
+        start = time.perf_counter()
+        usages = []
+        for command, cwd in steps:
+            result = resources.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"{' '.join(command)}\n{result.stderr.strip()}")
+            usages.append(result.resources)
+        wall = time.perf_counter() - start
+
+        def total(key):
+            values = [usage[key] for usage in usages if usage[key] is not None]
+            return sum(values) if values else None
+
+        size, files, shared = disk_usage(project_path)
+        return {
+            "wall": wall,
+            "cpu": total("user") + total("sys") if total("user") is not None else None,
+            "max_rss": max((usage["max_rss"] or 0) for usage in usages),
+            "read_bytes": total("read_bytes"),
+            "write_bytes": total("write_bytes"),
+            "bytes": size,
+            "files": files,
+            "shared_bytes": shared,
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def backend_env(backend, cache_path, wheelhouse, config_dir):
+    """Entorno con cachés aisladas que instala solo desde el wheelhouse.
+
+    Las órdenes son las de los generadores tal cual: el índice se cambia por
+    el wheelhouse desde la configuración (un uv.toml propio para UV, que
+    sustituye al del usuario, y variables PIP_* para pip).
+    """
+    env = dict(os.environ)
+    if backend == "uv":
+        config = Path(config_dir) / "uv.toml"
+        config.write_text(f"no-index = true\nfind-links = [{json.dumps(str(wheelhouse))}]\n", encoding="utf-8")
+        env["UV_CONFIG_FILE"] = str(config)
+        env["UV_CACHE_DIR"] = str(cache_path)
+    else:
+        env["PIP_NO_INDEX"] = "1"
+        env["PIP_FIND_LINKS"] = str(wheelhouse)
+        env["PIP_CACHE_DIR"] = str(cache_path)
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    return env
+
+
+def compare(kind, packages, wheelhouse, repeats, cold):
+    """Ejecuta todas las repeticiones de ambos backends."""
+    results = {}
+    for backend in BACKENDS:
+        runs = []
+        with tempfile.TemporaryDirectory(prefix=f"comandos-cache-{backend}-") as cache_root:
+            if not cold:
+                # Una construcción previa, que no cuenta, deja la caché caliente
+                with console.status(f"[bold green]Calentando la caché de {backend}..."):
+                    env = backend_env(backend, Path(cache_root) / "cache", wheelhouse, cache_root)
+                    build_once(backend, kind, packages, env)
+            for attempt in range(1, repeats + 1):
+                cache_path = Path(cache_root) / (f"run-{attempt}" if cold else "cache")
+                with console.status(f"[bold green]{backend}: construcción {attempt}/{repeats}..."):
+                    env = backend_env(backend, cache_path, wheelhouse, cache_root)
+                    runs.append(build_once(backend, kind, packages, env))
+        results[backend] = runs
+    return results
+
+
+def results_table(results):
+    """Tabla de Rich con las medianas de cada backend."""
+    table = Table(title="UV vs pip", title_style="bold")
+    table.add_column("Métrica", style="cyan")
+    for backend in results:
+        table.add_column(backend, justify="right")
+
+    def median(backend, key):
+        values = [run[key] for run in results[backend] if run[key] is not None]
+        return statistics.median(values) if values else None
+
+    def row(label, key, fmt):
+        table.add_row(label, *["-" if median(b, key) is None else fmt(median(b, key)) for b in results])
+
+    table.add_row("Tiempo total (mediana)", *[f"{median(b, 'wall'):.2f} s" for b in results])
+    table.add_row("Tiempo total (mínimo)", *[f"{min(r['wall'] for r in results[b]):.2f} s" for b in results])
+    row("CPU (usuario + sistema)", "cpu", lambda v: f"{v:.2f} s")
+    row("Memoria máxima (RSS)", "max_rss", format_bytes)
+    row("Lectura de disco", "read_bytes", format_bytes)
+    row("Escritura de disco", "write_bytes", format_bytes)
+    row("Tamaño en disco", "bytes", format_bytes)
+    row("  compartido por enlaces duros", "shared_bytes", format_bytes)
+    row("Archivos", "files", lambda v: f"{v:.0f}")
+    return table
+
+
+def main(argv=None, prog=None):
+    """Punto de entrada de la comparación."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Construye el mismo proyecto con UV y con pip desde un wheelhouse local y compara los resultados"
+    )
+    parser.add_argument("--wheelhouse", required=True, type=Path, help="directorio con las ruedas (sin acceso a la red)")
+    parser.add_argument("--kind", choices=["python", "streamlit"], default="python", help="tipo de proyecto")
+    parser.add_argument("--packages", nargs="*", default=[], help="dependencias del proyecto")
+    parser.add_argument("--repeats", type=int, default=3, help="construcciones por backend")
+    parser.add_argument("--cold", action="store_true", help="caché vacía en cada construcción")
+    parser.add_argument("--json", type=Path, help="guardar los resultados de cada construcción en JSON")
+    args = parser.parse_args(argv)
+
+    if not args.wheelhouse.is_dir():
+        console.print(f"[red]❌ No existe el wheelhouse {args.wheelhouse}[/red]")
+        return 1
+
+    if not check_uv(console):
+        return 1
+
+    packages = (["streamlit"] if args.kind == "streamlit" else []) + args.packages
+    try:
+        results = compare(args.kind, packages, args.wheelhouse.resolve(), args.repeats, args.cold)
+    except RuntimeError as e:
+        console.print(f"[red]✗[/red] Falló un comando:\n[dim]{e}[/dim]")
+        return 1
+    except FileNotFoundError as e:
+        console.print(f"[red]✗[/red] No se encontró un programa: {e.filename}")
+        return 1
+
+    console.print(results_table(results))
+    if args.json:
+        args.json.write_text(json.dumps({
+            "kind": args.kind,
+            "packages": packages,
+            "repeats": args.repeats,
+            "cold_cache": args.cold,
+            "results": results,
+        }, indent=2), encoding="utf-8")
+        console.print(f"[green]✓[/green] Resultados guardados en {args.json}")
+    return 0
@@ -0,0 +1,4 @@
+"""Generadores de proyectos: uno por combinación de tipo (python, streamlit) y backend (uv, pip).
+
+Cada módulo expone cli(argv); comandos.cli solo importa el que se pide.
+"""
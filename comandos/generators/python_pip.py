@@ -0,0 +1,531 @@
+"""
+Creador de proyectos Python con pip y venv
+"""
+import sys
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.archetypes import ARCHETYPE_CHOICES, ARCHETYPE_HELP, entry_function, render_archetype, startup_args, usage_rows
+from comandos.background import BackgroundTasks, run_quiet
+from comandos.common import check_cursor, check_gh, check_pip, create_github_repo, open_in_cursor
+from comandos.benchmarking import DEV_DEPENDENCIES, find_entry_module, render_harness, write_harness
+from comandos.hooks import finish_hooks, start_hooks
+from comandos.locking import installer_slot
+from comandos.matrix import (
+    DEFAULT_VERSIONS, MATRIX_DEV_DEPENDENCIES, RUNNER_SCRIPT, build_matrix, matrix_table, parse_versions,
+)
+from comandos.package_index import completion, load_index, review_packages
+from comandos.prefetch import Prefetcher
+from comandos.startup import entry_command, precompile_and_measure, startup_table, venv_python
+from comandos.template_sources import apply_template_source, external_files, normalize_source
+from comandos.update import parse_args, save_manifest, update_project, write_files
+
+console = Console()
+
+GENERATOR = "python-pip"
+
+MAIN_CONTENT = '''"""Punto de entrada principal de la aplicación."""
+
+def main():
+    """Función principal."""
+    print("¡Hola mundo!")
+
+if __name__ == "__main__":
+    main()
+'''
+
+README_TEMPLATE = """# {name}
+
+## Descripción
+Un proyecto Python creado con python-pip.py.
+
+## Requisitos
+- Python 3.8 o superior
+- Dependencias listadas en requirements.txt
+
+## Instalación
+
+1. Clona este repositorio o descárgalo:
+   ```bash
+   git clone <url-del-repositorio>
+   cd {name}
+   ```
+
+2. Crea un entorno virtual:
+   ```bash
+   python -m venv .venv
+   ```
+
+3. Activa el entorno virtual:
+   ```bash
+   # En Windows
+   .venv\\Scripts\\activate
+   
+   # En Linux/Mac
+   source .venv/bin/activate
+   ```
+
+4. Instala las dependencias:
+   ```bash
+   pip install -r requirements.txt
+   ```
+
+## Uso
+
+```bash
+python main.py
+```
+
+## Estructura del proyecto
+```
+{name}/
+├── main.py              # Punto de entrada principal
+├── .venv/               # Entorno virtual (generado)
+├── requirements.txt     # Lista de dependencias
+└── README.md            # Este archivo
+```
+
+## Licencia
+Este proyecto está disponible bajo la licencia MIT.
+"""
+
+GITIGNORE_CONTENT = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+.Python
+env/
+venv/
+.env
+.venv/
+.venv-*/
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# Testing
+.pytest_cache/
+.coverage
+htmlcov/
+.profiles/
+.matrix/
+
+# Build
+build/
+dist/
+*.egg-info/
+"""
+
+def render_requirements_dev(packages):
+    """requirements-dev.txt: las dependencias del proyecto más las de desarrollo."""
+    return "# Dependencias de desarrollo\n-r requirements.txt\n" + "".join(f"{pkg}\n" for pkg in packages)
+
+def dev_dependencies(options):
+    """Dependencias de desarrollo según los extras elegidos."""
+    packages = list(DEV_DEPENDENCIES) if options["benchmarks"] else []
+    if options.get("pythons"):
+        packages += [pkg for pkg in MATRIX_DEV_DEPENDENCIES if pkg not in packages]
+    return packages
+
+def render_base(name, archetype="basico"):
+    """Archivos de plantilla que se escriben al crear el proyecto."""
+    files = {
+        "main.py": MAIN_CONTENT,
+        "README.md": README_TEMPLATE.format(name=name),
+        ".gitignore": GITIGNORE_CONTENT,
+    }
+    if archetype != "basico":
+        files.update(render_archetype(archetype, "pip"))
+    return files
+
+def render_files(options):
+    """Archivos de plantilla y dependencias del proyecto según sus opciones."""
+    archetype = options.get("archetype", "basico")
+    files = render_base(options["name"], archetype)
+    dependencies = {"main": options["packages"], "dev": dev_dependencies(options)}
+    if options["benchmarks"]:
+        files.update(render_harness(options["benchmarks"], "pip", entry_function(archetype)))
+    if dependencies["dev"]:
+        # Las dependencias de desarrollo van aparte para no llevarlas a producción
+        files["requirements-dev.txt"] = render_requirements_dev(dependencies["dev"])
+    if options.get("pythons"):
+        files["run_matrix.py"] = RUNNER_SCRIPT
+    # La plantilla externa, si la hay, va encima de la del generador
+    files.update(external_files(options, GENERATOR))
+    return files, dependencies
+
+def create_project(name, archetype="basico", parent=None):
+    """Crea un proyecto Python básico o con el esqueleto de un arquetipo.
+
+    El proyecto se crea en `parent` (por defecto, el directorio actual).
+    """
+    try:
+        # Crear el directorio del proyecto
+        project_path = (parent or Path.cwd()) / name
+        project_path.mkdir(exist_ok=True)
+        
+        # Crear archivo requirements.txt vacío
+        requirements_path = project_path / "requirements.txt"
+        with open(requirements_path, "w", encoding="utf-8") as f:
+            f.write("# Dependencias del proyecto\n")
+        
+        # main.py, README.md y los archivos del arquetipo salen de la plantilla
+        files = render_base(name, archetype)
+        write_files(project_path, files, only=[path for path in files if path != ".gitignore"])
+            
+        return True, project_path
+    except Exception as e:
+        console.print(f"[red]Error al crear el proyecto: {e}[/red]")
+        return False, None
+
+def venv_command():
+    """Orden que crea el entorno virtual del proyecto."""
+    return [sys.executable, "-m", "venv", ".venv"]
+
+def create_venv(project_path):
+    """Crea un entorno virtual con venv sin escribir en la terminal."""
+    # venv instala pip con ensurepip: cuenta como una instalación más
+    with installer_slot():
+        return run_quiet(venv_command(), cwd=project_path)
+
+def get_pip_path(project_path):
+    """Obtiene la ruta al pip del entorno virtual."""
+    if sys.platform == "win32":
+        return project_path / ".venv" / "Scripts" / "pip"
+    else:
+        return project_path / ".venv" / "bin" / "pip"
+
+def install_command(project_path, packages, local_args=()):
+    """Orden del pip del entorno que instala paquetes (desde local_args si se dan)."""
+    return [str(get_pip_path(project_path)), "install", *local_args, *packages]
+
+def pip_install(project_path, pkg, prefetcher=None):
+    """Instala un paquete, solo desde lo descargado por adelantado si es posible."""
+    local_args = prefetcher.local_install_args([pkg]) if prefetcher else []
+    with installer_slot():
+        if local_args:
+            result = resources.run(install_command(project_path, [pkg], local_args), cwd=project_path)
+            if result.returncode == 0:
+                return True
+        result = resources.run(install_command(project_path, [pkg]), cwd=project_path)
+    return result.returncode == 0
+
+def ask_dependencies():
+    """Pregunta qué dependencias se desean instalar."""
+    console.print("\n[bold cyan]📦 Escribe las dependencias que deseas instalar:[/bold cyan]")
+    console.print("[dim]Ejemplo: requests fastapi pytest rich[/dim]")
+    
+    # Tab completa con el índice local; las erratas se corrigen antes de llamar al instalador
+    index = load_index()
+    with completion(index):
+        dependencies = Prompt.ask(
+            "\n[cyan]Dependencias (separadas por espacios)[/cyan]",
+            default=""
+        )
+    return review_packages(dependencies.strip().split(), index, console)
+
+def add_dependencies(project_path, packages, prefetcher=None):
+    """Agrega dependencias al proyecto y devuelve True si se instalaron todas."""
+    # Actualizar requirements.txt
+    requirements_path = project_path / "requirements.txt"
+    with open(requirements_path, "w", encoding="utf-8") as f:
+        f.write("# Dependencias del proyecto\n")
+        for pkg in packages:
+            f.write(f"{pkg}\n")
+    
+    installed = True
+    with console.status("[bold green]Instalando dependencias...") as status:
+        for pkg in packages:
+            status.update(f"[bold green]Instalando {pkg}...")
+            if pip_install(project_path, pkg, prefetcher):
+                console.print(f"[green]✓[/green] {pkg} instalado")
+            else:
+                console.print(f"[red]✗[/red] Error instalando {pkg}")
+                installed = False
+    return installed
+
+def add_benchmark_harness(project_path, prefetcher=None, entry="main"):
+    """Agrega benchmarks, un script de perfilado y sus dependencias de desarrollo."""
+    module = write_harness(project_path, "pip", entry)
+    if not module:
+        console.print("[yellow]⚠️[/yellow] No se encontró un punto de entrada main(), se omiten los benchmarks")
+        return None
+    console.print("[green]✓[/green] Benchmarks y script de perfilado creados")
+    
+    # Las dependencias de desarrollo van aparte para no llevarlas a producción
+    write_files(project_path, {"requirements-dev.txt": render_requirements_dev(DEV_DEPENDENCIES)})
+    
+    # requirements.txt ya está instalado: basta con las dependencias de desarrollo
+    with console.status("[bold green]Instalando dependencias de desarrollo..."):
+        if all([pip_install(project_path, pkg, prefetcher) for pkg in DEV_DEPENDENCIES]):
+            console.print(f"[green]✓[/green] {', '.join(DEV_DEPENDENCIES)} instalados")
+        else:
+            console.print("[red]✗[/red] Error instalando las dependencias de desarrollo")
+    return module
+
+def resync_environment(project_path, options, missing):
+    """Instala en el entorno las dependencias que agregó la plantilla."""
+    if not (project_path / ".venv").exists():
+        ok, error = create_venv(project_path)
+        if not ok:
+            return ok, error
+    if missing["main"]:
+        # Tras una instalación fallida las dependencias ya pueden estar en requirements.txt
+        requirements_path = project_path / "requirements.txt"
+        listed = requirements_path.read_text(encoding="utf-8").splitlines() if requirements_path.exists() else []
+        with open(requirements_path, "a", encoding="utf-8") as f:
+            for pkg in missing["main"]:
+                if pkg not in listed:
+                    f.write(f"{pkg}\n")
+    command = [str(get_pip_path(project_path)), "install", "-r", "requirements.txt"]
+    if (project_path / "requirements-dev.txt").exists():
+        command += ["-r", "requirements-dev.txt"]
+    with installer_slot():
+        ok, error = run_quiet(command, cwd=project_path)
+    if ok and options.get("pythons"):
+        failed = [r for r in build_matrix(project_path, "pip", options["pythons"]) if r.get("error")]
+        if failed:
+            return False, "; ".join(f"{r['version']}: {r['error']}" for r in failed)
+    return ok, error
+
+def ask_versions():
+    """Pregunta las versiones de Python de la matriz (lista vacía si no se quiere)."""
+    if not Confirm.ask("\n[cyan]¿Crear entornos para varias versiones de Python (matriz de tests)?[/cyan]", default=False):
+        return []
+    versions = parse_versions(Prompt.ask("[cyan]Versiones[/cyan]", default=" ".join(DEFAULT_VERSIONS)))
+    if not versions:
+        console.print("[yellow]⚠️[/yellow] Ninguna versión válida (formato 3.X), se omite la matriz")
+    return versions
+
+def create_matrix(project_path, versions, prefetcher=None):
+    """Crea en paralelo un .venv-X.Y por versión y el script run_matrix.py."""
+    # pytest entra en requirements-dev.txt (ya está si se eligieron benchmarks)
+    requirements_dev = project_path / "requirements-dev.txt"
+    if not requirements_dev.exists():
+        write_files(project_path, {"requirements-dev.txt": render_requirements_dev(MATRIX_DEV_DEPENDENCIES)})
+        with console.status("[bold green]Instalando pytest..."):
+            for pkg in MATRIX_DEV_DEPENDENCIES:
+                pip_install(project_path, pkg, prefetcher)
+    write_files(project_path, {"run_matrix.py": RUNNER_SCRIPT})
+    
+    with console.status(f"[bold green]Creando entornos para Python {', '.join(versions)}..."):
+        results = build_matrix(project_path, "pip", versions)
+    console.print(matrix_table(results))
+    if any(result.get("error") for result in results):
+        console.print("[yellow]⚠️[/yellow] Algunas versiones no se pudieron preparar")
+    else:
+        console.print("[green]✓[/green] Matriz de versiones lista: python run_matrix.py")
+
+def precompile_environment(project_path, venv_path, archetype="basico"):
+    """Precompila el entorno a bytecode y muestra el efecto en el arranque."""
+    module = find_entry_module(project_path)
+    args = startup_args(archetype) or (entry_command(project_path, module) if module else ["-c", "pass"])
+    with console.status("[bold green]Midiendo el arranque y precompilando el entorno..."):
+        cold, warm, ok, error = precompile_and_measure(venv_python(venv_path), args, project_path)
+    if ok:
+        console.print("[green]✓[/green] Entorno precompilado a bytecode")
+    else:
+        console.print("[yellow]⚠️[/yellow] Algunos archivos del entorno no se pudieron precompilar")
+    console.print(startup_table(cold, warm))
+
+def main(template_source=None):
+    """Función principal; template_source es la plantilla externa (--plantilla)."""
+    # Una ruta relativa guardada en el manifiesto dependería del directorio desde el que se ejecute update
+    template_source = normalize_source(template_source)
+    resources.report_at_exit(console)
+    console.print(Panel.fit(
+        "[bold blue]Creador de Proyectos Python con pip y venv[/bold blue]\n[dim]Crea proyectos Python modernos con facilidad[/dim]",
+        border_style="blue"
+    ))
+    
+    # Verificar pip
+    if not check_pip(console):
+        return
+    
+    # Los pasos que no dependen de las respuestas pendientes se adelantan en
+    # segundo plano y se recogen justo cuando hacen falta
+    tasks = BackgroundTasks()
+    tasks.start("gh", check_gh)
+    tasks.start("cursor", check_cursor)
+    
+    # Nombre del proyecto
+    project_name = Prompt.ask("\n[bold cyan]📝 Nombre del proyecto[/bold cyan]")
+    
+    if not project_name.strip():
+        console.print("[red]❌ El nombre no puede estar vacío[/red]")
+        return
+    
+    project_name = project_name.strip()
+    project_path = Path.cwd() / project_name
+    
+    # Verificar si el proyecto ya existe
+    if project_path.exists():
+        console.print(f"[red]❌ Ya existe un proyecto con ese nombre[/red]")
+        return
+    
+    # Arquetipo: el main.py de ejemplo o el esqueleto de un patrón de rendimiento
+    console.print(f"\n[dim]{ARCHETYPE_HELP}[/dim]")
+    archetype = Prompt.ask(
+        "[cyan]Arquetipo del proyecto[/cyan]",
+        choices=ARCHETYPE_CHOICES,
+        default="basico"
+    )
+    
+    # Crear proyecto
+    with console.status(f"[bold green]Creando proyecto '{project_name}'...") as status:
+        success, project_path = create_project(project_name, archetype)
+        if success:
+            console.print(f"[green]✓[/green] Proyecto '{project_name}' creado")
+        else:
+            console.print(f"[red]✗[/red] Error al crear el proyecto '{project_name}'")
+            return
+    
+    # Los hooks del usuario arrancan en cuanto están listos los pasos que piden
+    hooks = start_hooks(GENERATOR, project_path, project_path / ".venv", console)
+    hooks.step_done("project")
+    
+    # El entorno virtual se crea mientras se responden las preguntas
+    tasks.start("venv", create_venv, project_path)
+    
+    # Las descargas empiezan en cuanto se conocen los nombres de los paquetes
+    prefetcher = Prefetcher("pip")
+    
+    packages = []
+    if Confirm.ask("\n[cyan]¿Deseas agregar dependencias?[/cyan]", default=False):
+        packages = ask_dependencies()
+        prefetcher.start(packages)
+    wants_harness = Confirm.ask("\n[cyan]¿Agregar benchmarks y perfilado (pytest-benchmark, cProfile)?[/cyan]", default=False)
+    if wants_harness:
+        prefetcher.start(DEV_DEPENDENCIES)
+    versions = ask_versions()
+    if versions:
+        prefetcher.start(MATRIX_DEV_DEPENDENCIES)
+    wants_precompile = Confirm.ask("\n[cyan]¿Precompilar el entorno a bytecode y medir el primer arranque?[/cyan]", default=False)
+    
+    with console.status("[bold green]Creando entorno virtual..."):
+        ok, error = tasks.join("venv")
+    hooks.step_done("venv", ok)
+    if ok:
+        console.print("[green]✓[/green] Entorno virtual creado")
+    else:
+        console.print("[red]✗[/red] Error al crear entorno virtual")
+        console.print(f"[dim]{error}[/dim]")
+        finish_hooks(hooks, console)
+        return
+    
+    # Agregar dependencias si el usuario quiere
+    deps_ok = add_dependencies(project_path, packages, prefetcher) if packages else True
+    
+    # Benchmarks y perfilado
+    harness_module = add_benchmark_harness(project_path, prefetcher, entry_function(archetype)) if wants_harness else None
+    hooks.step_done("deps", deps_ok)
+    
+    # Entornos para otras versiones de Python
+    if versions:
+        create_matrix(project_path, versions, prefetcher)
+    
+    # Precompilar a bytecode
+    if wants_precompile:
+        precompile_environment(project_path, project_path / ".venv", archetype)
+
+    # Crear .gitignore
+    write_files(project_path, render_base(project_name), only=[".gitignore"])
+    console.print("[green]✓[/green] Archivo .gitignore creado")
+    
+    # Manifiesto para `python-pip.py update`
+    options = {
+        "name": project_name, "archetype": archetype, "packages": packages,
+        "benchmarks": harness_module, "pythons": versions,
+    }
+    # La plantilla externa (--plantilla) se escribe encima de los archivos del generador
+    if template_source and apply_template_source(project_path, template_source, options, GENERATOR, console):
+        options["template_source"] = template_source
+    # Si algo no se instaló, `update` vuelve a sincronizar
+    save_manifest(project_path, GENERATOR, options, *render_files(options), synced=deps_ok)
+    
+    # Preguntar si crear repositorio en GitHub (Git solo se inicializa con él)
+    git_ok = False
+    if tasks.join("gh"):
+        if Confirm.ask("\n[cyan]¿Crear repositorio en GitHub?[/cyan]", default=False):
+            git_ok = create_github_repo(project_name, project_path, console, visibility="private", init=True)
+            if git_ok:
+                console.print("[green]✓[/green] Repositorio creado en GitHub")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo crear el repositorio en GitHub")
+    hooks.step_done("git", git_ok)
+    
+    # Preguntar si abrir en Cursor (solo si está instalado)
+    if tasks.join("cursor"):
+        if Confirm.ask("\n[cyan]¿Abrir proyecto en Cursor IDE?[/cyan]", default=False):
+            if open_in_cursor(project_path, console):
+                console.print("[green]✓[/green] Abriendo en Cursor IDE...")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo abrir Cursor IDE")
+    
+    finish_hooks(hooks, console)
+    
+    # Instrucciones finales
+    console.print("\n[bold green]✨ ¡Proyecto listo![/bold green]\n")
+    
+    instructions = Table(show_header=False, box=None, padding=(0, 2))
+    instructions.add_column("Paso", style="yellow")
+    instructions.add_column("Comando", style="cyan")
+    
+    instructions.add_row("1.", f"cd {project_name}")
+    instructions.add_row("2.", ".venv\\Scripts\\activate" if sys.platform == "win32" else "source .venv/bin/activate")
+    # Con un arquetipo, su primer comando de uso
+    usage = usage_rows(archetype, "pip")
+    instructions.add_row("3.", usage[0][0] if usage else "python main.py")
+    
+    console.print(Panel(instructions, title="[bold]Próximos pasos[/bold]", border_style="green"))
+    
+    # Comandos útiles
+    tips = Table(show_header=False, box=None, padding=(0, 2))
+    tips.add_column("Comando", style="cyan")
+    tips.add_column("Descripción", style="white")
+    
+    for command, description in usage_rows(archetype, "pip"):
+        tips.add_row(command, description)
+    tips.add_row("pip install <paquete>", "Agregar dependencias")
+    tips.add_row("pip freeze > requirements.txt", "Actualizar requirements.txt")
+    tips.add_row("python -m pytest", "Ejecutar tests (si pytest está instalado)")
+    if versions:
+        tips.add_row("python run_matrix.py", f"Ejecutar los tests en Python {', '.join(versions)}")
+    
+    console.print(Panel(tips, title="[bold]Comandos útiles[/bold]", border_style="blue"))
+
+def update(path):
+    """Aplica las plantillas actuales a un proyecto creado con este script."""
+    resources.report_at_exit(console)
+    project_path = Path(path).resolve()
+    console.print(Panel.fit(
+        f"[bold blue]Actualizar proyecto Python con pip y venv[/bold blue]\n[dim]{project_path}[/dim]",
+        border_style="blue"
+    ))
+    if not check_pip(console):
+        return
+    update_project(project_path, GENERATOR, render_files, resync_environment, console)
+
+def cli(argv=None, prog=None):
+    """Crea un proyecto nuevo o, con el subcomando update, actualiza uno existente."""
+    args = parse_args("Creador de proyectos Python con pip y venv", argv, prog)
+    if args.command == "update":
+        update(args.ruta)
+    else:
+        main(args.plantilla) 
+
+if __name__ == "__main__":
+    cli()
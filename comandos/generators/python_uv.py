@@ -0,0 +1,578 @@
+"""
+Creador de proyectos Python con UV
+"""
+import subprocess
+import sys
+import os
+import tomllib
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.archetypes import ARCHETYPE_CHOICES, ARCHETYPE_HELP, entry_function, render_archetype, startup_args, usage_rows
+from comandos.background import BackgroundTasks, run_quiet
+from comandos.common import check_cursor, check_gh, check_uv, create_github_repo, open_in_cursor
+from comandos.benchmarking import DEV_DEPENDENCIES, find_entry_module, render_harness, write_harness
+from comandos.hooks import finish_hooks, start_hooks
+from comandos.locking import installer_slot, path_lock
+from comandos.matrix import (
+    DEFAULT_VERSIONS, MATRIX_DEV_DEPENDENCIES, RUNNER_SCRIPT, build_matrix, matrix_table, parse_versions,
+    relax_requires_python,
+)
+from comandos.package_index import completion, load_index, review_packages
+from comandos.prefetch import Prefetcher
+from comandos.startup import entry_command, precompile_and_measure, startup_table, venv_python
+from comandos.template_sources import apply_template_source, external_files, normalize_source
+from comandos.tuning import apply_tuning
+from comandos.update import parse_args, save_manifest, update_project, write_files
+
+console = Console()
+
+GENERATOR = "python-uv"
+
+GITIGNORE_CONTENT = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+.Python
+env/
+venv/
+.env
+.venv/
+.venv-*/
+
+# UV
+.uv/
+uv.lock
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# Testing
+.pytest_cache/
+.coverage
+htmlcov/
+.profiles/
+.matrix/
+
+# Build
+build/
+dist/
+*.egg-info/
+"""
+
+def render_files(options):
+    """Archivos de plantilla y dependencias del proyecto según sus opciones.
+
+    README.md y pyproject.toml los escribe uv init y no se gestionan; main.py
+    tampoco, salvo que lo sustituya un arquetipo.
+    """
+    archetype = options.get("archetype", "basico")
+    files = {}
+    if not options["workspace"]:
+        files[".gitignore"] = GITIGNORE_CONTENT
+    if archetype != "basico":
+        files.update(render_archetype(archetype, "uv"))
+    dependencies = {"main": options["packages"], "dev": []}
+    if options["benchmarks"]:
+        files.update(render_harness(options["benchmarks"], "uv", entry_function(archetype)))
+        dependencies["dev"] = list(DEV_DEPENDENCIES)
+    if options.get("pythons"):
+        files["run_matrix.py"] = RUNNER_SCRIPT
+        dependencies["dev"] += [pkg for pkg in MATRIX_DEV_DEPENDENCIES if pkg not in dependencies["dev"]]
+    # La plantilla externa, si la hay, va encima de la del generador
+    files.update(external_files(options, GENERATOR))
+    return files, dependencies
+
+def find_workspace_root(start):
+    """Busca hacia arriba un pyproject.toml que declare un workspace de UV."""
+    for directory in [start, *start.parents]:
+        pyproject_path = directory / "pyproject.toml"
+        if not pyproject_path.is_file():
+            continue
+        try:
+            with open(pyproject_path, "rb") as f:
+                data = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError):
+            continue
+        if "workspace" in data.get("tool", {}).get("uv", {}):
+            return directory
+    return None
+
+def environment_lock(path):
+    """Bloqueo entre procesos del entorno de un proyecto.
+
+    En un workspace el uv.lock y el .venv de la raíz son de todos los
+    miembros, así que se bloquea la raíz.
+    """
+    return path_lock(find_workspace_root(path) or path)
+
+def create_workspace(root):
+    """Prepara la raíz de un workspace de UV en un directorio.
+
+    Devuelve True si lo creó y False si el directorio ya era un workspace.
+    Un pyproject.toml que no declara workspace no se toca (ValueError):
+    añadirle la tabla convertiría su proyecto en la raíz del workspace.
+    """
+    pyproject_path = root / "pyproject.toml"
+    if pyproject_path.exists():
+        try:
+            with open(pyproject_path, "rb") as f:
+                data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"{pyproject_path} no es un TOML válido: {e}") from e
+        if "workspace" in data.get("tool", {}).get("uv", {}):
+            return False
+        raise ValueError(
+            f"{pyproject_path} ya existe y no declara un workspace de UV: "
+            "añade [tool.uv.workspace] a mano o elige otro directorio"
+        )
+    root.mkdir(parents=True, exist_ok=True)
+    # Sin [project] la raíz es un workspace virtual: solo agrupa miembros
+    pyproject_path.write_text("[tool.uv.workspace]\nmembers = []\n", encoding="utf-8")
+    return True
+
+def init_command(name):
+    """Orden de UV que crea el proyecto."""
+    return ["uv", "init", name]
+
+def add_command(packages, lazy=False):
+    """Orden de UV que agrega paquetes (con lazy, solo a pyproject.toml y uv.lock)."""
+    return ["uv", "add", *(["--no-sync"] if lazy else []), *packages]
+
+def sync_command(workspace=False, lazy=False):
+    """Orden de UV que deja el entorno al día (con lazy, solo uv.lock)."""
+    if lazy:
+        return ["uv", "lock"]
+    # En un workspace el .venv de la raíz se comparte: se sincronizan
+    # todos los miembros para no desinstalar lo que usan los demás.
+    return ["uv", "sync", "--all-packages"] if workspace else ["uv", "sync"]
+
+def create_project(name, cwd=None):
+    """Crea un proyecto con UV sin escribir en la terminal."""
+    # Dentro de un workspace, uv init registra el proyecto como miembro
+    with environment_lock(cwd or Path.cwd()):
+        return run_quiet(init_command(name), cwd=cwd)
+
+def ask_dependencies():
+    """Pregunta qué dependencias se desean instalar."""
+    console.print("\n[bold cyan]📦 Escribe las dependencias que deseas instalar:[/bold cyan]")
+    console.print("[dim]Ejemplo: requests fastapi pytest rich[/dim]")
+    
+    # Tab completa con el índice local; las erratas se corrigen antes de llamar al instalador
+    index = load_index()
+    with completion(index):
+        dependencies = Prompt.ask(
+            "\n[cyan]Dependencias (separadas por espacios)[/cyan]",
+            default=""
+        )
+    return review_packages(dependencies.strip().split(), index, console)
+
+def add_dependencies(project_path, packages, prefetcher=None, lazy=False):
+    """Agrega dependencias al proyecto (con lazy, solo a pyproject.toml y uv.lock).
+
+    Devuelve True si se agregaron todas.
+    """
+    added = True
+    with console.status("[bold green]Instalando dependencias...") as status:
+        for pkg in packages:
+            status.update(f"[bold green]Instalando {pkg}...")
+            if prefetcher:
+                # Con la caché ya llena, uv add solo enlaza archivos locales
+                prefetcher.wait(pkg)
+            try:
+                with installer_slot(), environment_lock(project_path):
+                    resources.run(add_command([pkg], lazy), cwd=project_path, check=True)
+                console.print(f"[green]✓[/green] {pkg} {'agregado' if lazy else 'instalado'}")
+            except subprocess.CalledProcessError:
+                console.print(f"[red]✗[/red] Error instalando {pkg}")
+                added = False
+    return added
+
+def sync_environment(project_path, workspace=False, lazy=False):
+    """Crea el entorno virtual y lo sincroniza sin escribir en la terminal.
+
+    Con lazy solo se resuelve uv.lock: el entorno se crea en el primer
+    `uv run` o con `uv sync`.
+    """
+    # UV sync automáticamente crea el entorno virtual si no existe.
+    with installer_slot(), environment_lock(project_path):
+        return run_quiet(sync_command(workspace, lazy), cwd=project_path)
+
+def init_git(project_path):
+    """Inicializa Git y crea el .gitignore sin escribir en la terminal."""
+    ok, error = run_quiet(["git", "init"], cwd=project_path)
+    if ok:
+        write_files(project_path, {".gitignore": GITIGNORE_CONTENT})
+    return ok, error
+
+def add_benchmark_harness(project_path, prefetcher=None, entry="main", lazy=False):
+    """Agrega benchmarks, un script de perfilado y sus dependencias de desarrollo."""
+    module = write_harness(project_path, "uv", entry)
+    if not module:
+        console.print("[yellow]⚠️[/yellow] No se encontró un punto de entrada main(), se omiten los benchmarks")
+        return None
+    console.print("[green]✓[/green] Benchmarks y script de perfilado creados")
+    
+    with console.status("[bold green]Instalando dependencias de desarrollo..."):
+        if prefetcher:
+            for pkg in DEV_DEPENDENCIES:
+                prefetcher.wait(pkg)
+        try:
+            with installer_slot(), environment_lock(project_path):
+                resources.run(
+                    ["uv", "add", "--dev", *(["--no-sync"] if lazy else []), *DEV_DEPENDENCIES],
+                    cwd=project_path, check=True,
+                )
+            console.print(f"[green]✓[/green] {', '.join(DEV_DEPENDENCIES)} {'agregados' if lazy else 'instalados'}")
+        except subprocess.CalledProcessError:
+            console.print("[red]✗[/red] Error instalando las dependencias de desarrollo")
+    return module
+
+def resync_environment(project_path, options, missing):
+    """Agrega las dependencias que incorporó la plantilla y sincroniza."""
+    # Con el entorno diferido y aún sin crear basta con actualizar uv.lock
+    root = (find_workspace_root(project_path) if options["workspace"] else None) or project_path
+    lazy = options.get("lazy_env", False) and not (root / ".venv").exists()
+    no_sync = ["--no-sync"] if lazy else []
+    with installer_slot(), environment_lock(project_path):
+        if missing["main"]:
+            ok, error = run_quiet(add_command(missing["main"], lazy), cwd=project_path)
+            if not ok:
+                return ok, error
+        if missing["dev"]:
+            ok, error = run_quiet(["uv", "add", "--dev", *no_sync, *missing["dev"]], cwd=project_path)
+            if not ok:
+                return ok, error
+    ok, error = sync_environment(project_path, options["workspace"], lazy)
+    if ok and options.get("pythons"):
+        failed = [r for r in build_matrix(project_path, "uv", options["pythons"]) if r.get("error")]
+        if failed:
+            return False, "; ".join(f"{r['version']}: {r['error']}" for r in failed)
+    return ok, error
+
+def ask_versions():
+    """Pregunta las versiones de Python de la matriz (lista vacía si no se quiere)."""
+    if not Confirm.ask("\n[cyan]¿Crear entornos para varias versiones de Python (matriz de tests)?[/cyan]", default=False):
+        return []
+    versions = parse_versions(Prompt.ask("[cyan]Versiones[/cyan]", default=" ".join(DEFAULT_VERSIONS)))
+    if not versions:
+        console.print("[yellow]⚠️[/yellow] Ninguna versión válida (formato 3.X), se omite la matriz")
+    return versions
+
+def create_matrix(project_path, versions, prefetcher=None):
+    """Crea en paralelo un .venv-X.Y por versión y el script run_matrix.py."""
+    # El lock tiene que admitir la versión más antigua y llevar pytest
+    relax_requires_python(project_path, versions)
+    with console.status("[bold green]Resolviendo el lock para todas las versiones..."):
+        if prefetcher:
+            for pkg in MATRIX_DEV_DEPENDENCIES:
+                prefetcher.wait(pkg)
+        with installer_slot(), environment_lock(project_path):
+            ok, error = run_quiet(["uv", "add", "--dev", *MATRIX_DEV_DEPENDENCIES], cwd=project_path)
+    if not ok:
+        console.print("[red]✗[/red] No se pudo resolver el lock para todas las versiones")
+        console.print(f"[dim]{error}[/dim]")
+        return
+    write_files(project_path, {"run_matrix.py": RUNNER_SCRIPT})
+    
+    # UV descarga las versiones de Python que falten; la caché es la misma para todas
+    with console.status(f"[bold green]Creando entornos para Python {', '.join(versions)}..."):
+        results = build_matrix(project_path, "uv", versions)
+    console.print(matrix_table(results))
+    if any(result.get("error") for result in results):
+        console.print("[yellow]⚠️[/yellow] Algunas versiones no se pudieron preparar")
+    else:
+        console.print("[green]✓[/green] Matriz de versiones lista: uv run run_matrix.py")
+
+def precompile_environment(project_path, venv_path, archetype="basico"):
+    """Precompila el entorno a bytecode y muestra el efecto en el arranque."""
+    module = find_entry_module(project_path)
+    args = startup_args(archetype) or (entry_command(project_path, module) if module else ["-c", "pass"])
+    with console.status("[bold green]Midiendo el arranque y precompilando el entorno..."):
+        cold, warm, ok, error = precompile_and_measure(venv_python(venv_path), args, project_path)
+    if ok:
+        console.print("[green]✓[/green] Entorno precompilado a bytecode")
+    else:
+        console.print("[yellow]⚠️[/yellow] Algunos archivos del entorno no se pudieron precompilar")
+    console.print(startup_table(cold, warm))
+
+def main(template_source=None):
+    """Función principal; template_source es la plantilla externa (--plantilla)."""
+    # Una ruta relativa guardada en el manifiesto dependería del directorio desde el que se ejecute update
+    template_source = normalize_source(template_source)
+    resources.report_at_exit(console)
+    console.print(Panel.fit(
+        "[bold blue]Creador de Proyectos Python con UV[/bold blue]\n[dim]Crea proyectos Python modernos con facilidad[/dim]",
+        border_style="blue"
+    ))
+    
+    # Verificar UV
+    if not check_uv(console):
+        return
+    
+    # Los pasos que no dependen de las respuestas pendientes se adelantan en
+    # segundo plano y se recogen justo cuando hacen falta
+    tasks = BackgroundTasks()
+    tasks.start("gh", check_gh)
+    tasks.start("cursor", check_cursor)
+    
+    # Modo workspace: lock y .venv compartidos entre proyectos miembros
+    workspace_root = find_workspace_root(Path.cwd())
+    if workspace_root:
+        console.print(f"\n[dim]Workspace de UV detectado en {workspace_root}[/dim]")
+        if not Confirm.ask("[cyan]¿Agregar el proyecto como miembro del workspace?[/cyan]", default=True):
+            workspace_root = None
+    elif Confirm.ask("\n[cyan]¿Crear el proyecto dentro de un workspace de UV (lock y .venv compartidos)?[/cyan]", default=False):
+        workspace_dir = Prompt.ask("[cyan]Directorio del workspace[/cyan]", default=".")
+        workspace_root = (Path.cwd() / workspace_dir).resolve()
+        try:
+            created = create_workspace(workspace_root)
+        except ValueError as e:
+            console.print(f"[red]✗[/red] {e}")
+            return
+        if created:
+            console.print(f"[green]✓[/green] Workspace creado en {workspace_root}")
+        else:
+            console.print(f"[dim]Workspace de UV existente en {workspace_root}[/dim]")
+    
+    # Nombre del proyecto
+    project_name = Prompt.ask("\n[bold cyan]📝 Nombre del proyecto[/bold cyan]")
+    
+    if not project_name.strip():
+        console.print("[red]❌ El nombre no puede estar vacío[/red]")
+        return
+    
+    project_name = project_name.strip()
+    if workspace_root and not Path.cwd().is_relative_to(workspace_root):
+        project_parent = workspace_root
+    else:
+        project_parent = Path.cwd()
+    project_path = project_parent / project_name
+    
+    # Verificar si el proyecto ya existe
+    if project_path.exists():
+        console.print(f"[red]❌ Ya existe un proyecto con ese nombre[/red]")
+        return
+    
+    # Crear proyecto mientras se responden las siguientes preguntas
+    tasks.start("init", create_project, project_name, project_parent)
+    
+    # Arquetipo: el main.py de uv init o el esqueleto de un patrón de rendimiento
+    console.print(f"\n[dim]{ARCHETYPE_HELP}[/dim]")
+    archetype = Prompt.ask(
+        "[cyan]Arquetipo del proyecto[/cyan]",
+        choices=ARCHETYPE_CHOICES,
+        default="basico"
+    )
+    # Entorno diferido: sin .venv, para proyectos que se generan aquí y se usan en otra máquina
+    lazy_env = Confirm.ask(
+        "\n[cyan]¿Diferir el entorno (solo pyproject.toml y uv.lock; .venv se crea en el primer `uv run`)?[/cyan]",
+        default=False
+    )
+    wants_dependencies = Confirm.ask("\n[cyan]¿Deseas agregar dependencias?[/cyan]", default=False)
+    
+    with console.status(f"[bold green]Creando proyecto '{project_name}'..."):
+        ok, error = tasks.join("init")
+    if ok:
+        if archetype != "basico":
+            write_files(project_path, render_archetype(archetype, "uv"))
+        console.print(f"[green]✓[/green] Proyecto '{project_name}' creado")
+    else:
+        console.print(f"[red]✗[/red] Error al crear el proyecto '{project_name}'")
+        console.print(f"[dim]{error}[/dim]")
+        return
+    
+    # Los hooks del usuario arrancan en cuanto están listos los pasos que piden
+    hooks = start_hooks(GENERATOR, project_path, (workspace_root or project_path) / ".venv", console)
+    hooks.step_done("project")
+    
+    # El entorno virtual y Git se preparan mientras se escriben las dependencias
+    tasks.start("sync", sync_environment, project_path, bool(workspace_root), lazy_env)
+    if not workspace_root:
+        tasks.start("git", init_git, project_path)
+    
+    # Las descargas empiezan en cuanto se conocen los nombres de los paquetes
+    # (con el entorno diferido no se instala nada: uv lock solo lee metadatos)
+    prefetcher = None
+    if not lazy_env:
+        python_version_path = project_path / ".python-version"
+        python_version = python_version_path.read_text(encoding="utf-8").strip() if python_version_path.exists() else None
+        prefetcher = Prefetcher("uv", python=python_version)
+    
+    packages = ask_dependencies() if wants_dependencies else []
+    if prefetcher:
+        prefetcher.start(packages)
+    wants_harness = Confirm.ask("\n[cyan]¿Agregar benchmarks y perfilado (pytest-benchmark, cProfile)?[/cyan]", default=False)
+    if wants_harness and prefetcher:
+        prefetcher.start(DEV_DEPENDENCIES)
+    # La matriz usa .venv-X.Y propios: en un workspace el entorno es compartido
+    # y con el entorno diferido no se crea ninguno
+    versions = [] if workspace_root or lazy_env else ask_versions()
+    if versions:
+        prefetcher.start(MATRIX_DEV_DEPENDENCIES)
+    wants_precompile = not lazy_env and Confirm.ask(
+        "\n[cyan]¿Precompilar el entorno a bytecode y medir el primer arranque?[/cyan]", default=False
+    )
+    
+    # uv add y uv sync no deben ejecutarse a la vez sobre el mismo proyecto
+    sync_label = "Resolviendo dependencias en uv.lock" if lazy_env else "Creando entorno virtual y sincronizando"
+    with console.status(f"[bold green]{sync_label}..."):
+        env_ok, env_error = tasks.join("sync")
+    # Con el entorno diferido no hay .venv: los hooks que lo piden se omiten
+    venv_ready = env_ok and not lazy_env
+    if venv_ready:
+        hooks.step_done("venv")
+    
+    deps_ok = add_dependencies(project_path, packages, prefetcher, lazy_env) if packages else True
+    
+    # Benchmarks y perfilado
+    harness_module = (
+        add_benchmark_harness(project_path, prefetcher, entry_function(archetype), lazy_env) if wants_harness else None
+    )
+    
+    # Volver a sincronizar solo si algo cambió desde la sincronización adelantada
+    if packages or wants_harness or not env_ok:
+        with console.status(f"[bold green]{sync_label}..."):
+            env_ok, env_error = sync_environment(project_path, bool(workspace_root), lazy_env)
+    if not venv_ready:
+        hooks.step_done("venv", env_ok and not lazy_env)
+    hooks.step_done("deps", env_ok and not lazy_env)
+    if env_ok and lazy_env:
+        console.print("[green]✓[/green] pyproject.toml y uv.lock listos; el entorno se creará en el primer uv run")
+    elif env_ok:
+        console.print("[green]✓[/green] Entorno virtual creado y dependencias instaladas")
+    else:
+        console.print(f"[red]✗[/red] {'Error al resolver uv.lock' if lazy_env else 'Error al crear entorno virtual'}")
+        console.print(f"[dim]{env_error}[/dim]")
+    
+    # Entornos para otras versiones de Python
+    if versions and env_ok:
+        create_matrix(project_path, versions, prefetcher)
+    
+    # Precompilar a bytecode (el .venv de un workspace está en su raíz)
+    if wants_precompile and env_ok:
+        precompile_environment(project_path, (workspace_root or project_path) / ".venv", archetype)
+    
+    # Git (un miembro vive en el repositorio del workspace)
+    if workspace_root:
+        console.print(f"[green]✓[/green] Proyecto agregado al workspace {workspace_root}")
+        hooks.step_done("git", (workspace_root / ".git").exists())
+    else:
+        git_ok, _ = tasks.join("git")
+        hooks.step_done("git", git_ok)
+        if git_ok:
+            console.print("[green]✓[/green] Repositorio Git inicializado")
+        else:
+            console.print("[yellow]⚠️[/yellow] Git no está instalado o no se pudo inicializar")
+    
+    # Manifiesto para `python-uv.py update`
+    options = {
+        "name": project_name,
+        "workspace": bool(workspace_root),
+        "archetype": archetype,
+        "lazy_env": lazy_env,
+        "packages": packages,
+        "benchmarks": harness_module,
+        "pythons": versions,
+    }
+    # La plantilla externa (--plantilla) se escribe encima de los archivos del generador
+    if template_source and apply_template_source(project_path, template_source, options, GENERATOR, console):
+        options["template_source"] = template_source
+    # Si algo no se instaló, `update` vuelve a sincronizar
+    save_manifest(project_path, GENERATOR, options, *render_files(options), synced=env_ok and deps_ok)
+    
+    # Preguntar si crear repositorio en GitHub
+    has_gh = tasks.join("gh")
+    if not workspace_root and has_gh:
+        if Confirm.ask("\n[cyan]¿Crear repositorio en GitHub?[/cyan]", default=False):
+            if create_github_repo(project_name, project_path, console, visibility="private"):
+                console.print("[green]✓[/green] Repositorio creado en GitHub")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo crear el repositorio en GitHub")
+    
+    # Preguntar si abrir en Cursor (solo si está instalado)
+    if tasks.join("cursor"):
+        if Confirm.ask("\n[cyan]¿Abrir proyecto en Cursor IDE?[/cyan]", default=False):
+            if open_in_cursor(project_path, console):
+                console.print("[green]✓[/green] Abriendo en Cursor IDE...")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo abrir Cursor IDE")
+    
+    finish_hooks(hooks, console)
+    
+    # Instrucciones finales
+    console.print("\n[bold green]✨ ¡Proyecto listo![/bold green]\n")
+    
+    instructions = Table(show_header=False, box=None, padding=(0, 2))
+    instructions.add_column("Paso", style="yellow")
+    instructions.add_column("Comando", style="cyan")
+    
+    instructions.add_row("1.", f"cd {os.path.relpath(project_path)}")
+    # Con un arquetipo, su primer comando de uso
+    usage = usage_rows(archetype, "uv")
+    instructions.add_row("2.", usage[0][0] if usage else "uv run main.py")
+    
+    console.print(Panel(instructions, title="[bold]Próximos pasos[/bold]", border_style="green"))
+    
+    # Comandos útiles
+    tips = Table(show_header=False, box=None, padding=(0, 2))
+    tips.add_column("Comando", style="cyan")
+    tips.add_column("Descripción", style="white")
+    
+    for command, description in usage_rows(archetype, "uv"):
+        tips.add_row(command, description)
+    tips.add_row("uv add <paquete>", "Agregar dependencias")
+    if lazy_env:
+        tips.add_row("uv sync --frozen", "Crear el entorno exactamente como fija uv.lock")
+    if workspace_root:
+        tips.add_row("uv sync --all-packages", "Sincronizar el entorno compartido del workspace")
+    else:
+        tips.add_row("uv sync", "Sincronizar entorno")
+    tips.add_row("uv run <script>", "Ejecutar scripts")
+    if versions:
+        tips.add_row("uv run run_matrix.py", f"Ejecutar los tests en Python {', '.join(versions)}")
+    
+    console.print(Panel(tips, title="[bold]Comandos útiles de UV[/bold]", border_style="blue"))
+
+def update(path):
+    """Aplica las plantillas actuales a un proyecto creado con este script."""
+    resources.report_at_exit(console)
+    project_path = Path(path).resolve()
+    console.print(Panel.fit(
+        f"[bold blue]Actualizar proyecto Python con UV[/bold blue]\n[dim]{project_path}[/dim]",
+        border_style="blue"
+    ))
+    if not check_uv(console):
+        return
+    update_project(project_path, GENERATOR, render_files, resync_environment, console)
+
+def cli(argv=None, prog=None):
+    """Crea un proyecto nuevo o, con el subcomando update, actualiza uno existente."""
+    args = parse_args("Creador de proyectos Python con UV", argv, prog)
+    # Concurrencia de UV calibrada para esta máquina (comandos calibrate)
+    apply_tuning()
+    try:
+        if args.command == "update":
+            update(args.ruta)
+        else:
+            main(args.plantilla)
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]👋 ¡Hasta luego![/yellow]")
+    except Exception as e:
+        console.print(f"\n[red]❌ Error: {e}[/red]")
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,601 @@
+"""
+Creador de proyectos Streamlit con pip y venv
+"""
+import sys
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.background import BackgroundTasks, run_quiet
+from comandos.common import check_cursor, check_gh, check_pip, create_github_repo, open_in_cursor
+from comandos.hooks import finish_hooks, start_hooks
+from comandos.layers import create_layered_venv, install_layer, project_requirements, report_layer
+from comandos.locking import installer_slot
+from comandos.package_index import completion, load_index, review_packages
+from comandos.prefetch import Prefetcher
+from comandos.rerun_bench import RERUN_BENCH_PATH, render_rerun_bench
+from comandos.startup import STREAMLIT_ENTRY, precompile_and_measure, startup_table, venv_python
+from comandos.streamlit_templates import TEMPLATE_CHOICES, TEMPLATE_DEPENDENCIES, add_perf_panel, render_template
+from comandos.template_sources import apply_template_source, external_files, normalize_source
+from comandos.update import parse_args, save_manifest, update_project, write_files
+
+console = Console()
+
+GENERATOR = "streamlit-pip"
+
+README_TEMPLATE = """# {name}
+
+## Descripción
+Una aplicación Streamlit creada con streamlit-pip.py.
+
+## Requisitos
+- Python 3.8 o superior
+- Streamlit y otras dependencias listadas en requirements.txt
+
+## Instalación
+
+1. Clona este repositorio o descárgalo:
+   ```bash
+   git clone <url-del-repositorio>
+   cd {name}
+   ```
+
+2. Crea un entorno virtual:
+   ```bash
+   python -m venv .venv
+   ```
+
+3. Activa el entorno virtual:
+   ```bash
+   # En Windows
+   .venv\\Scripts\\activate
+   
+   # En Linux/Mac
+   source .venv/bin/activate
+   ```
+
+4. Instala las dependencias:
+   ```bash
+   pip install -r requirements.txt
+   ```
+
+## Uso
+
+Para ejecutar la aplicación Streamlit:
+```bash
+streamlit run app.py
+```
+
+## Estructura del proyecto
+```
+{name}/
+├── app.py                # Aplicación principal de Streamlit
+├── .streamlit/           # Configuración de Streamlit
+│   └── secrets.toml      # Secretos (no incluidos en Git)
+├── .venv/                # Entorno virtual (generado)
+├── requirements.txt      # Lista de dependencias
+└── README.md             # Este archivo
+```
+
+## Licencia
+Este proyecto está disponible bajo la licencia MIT.
+"""
+
+BASIC_APP = """import streamlit as st
+
+# Configuración de la página
+st.set_page_config(
+    page_title="Mi Aplicación Streamlit",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="auto"
+)
+
+# Título principal
+st.title("Mi Aplicación Streamlit")
+
+# Sidebar
+with st.sidebar:
+    st.header("Configuración")
+    nombre = st.text_input("Tu nombre")
+    color = st.color_picker("Elige un color", "#0066ff")
+    
+# Contenido principal
+st.header("¡Bienvenido a Streamlit!")
+
+if nombre:
+    st.markdown(f"### Hola, {nombre}! 👋")
+    st.write(f"Tu color elegido es: {color}")
+    
+    # Demostración de algunos widgets
+    tab1, tab2, tab3 = st.tabs(["Datos", "Visualización", "Acerca de"])
+    
+    with tab1:
+        st.subheader("Ejemplo de tabla de datos")
+        st.dataframe({
+            "Columna 1": [1, 2, 3, 4],
+            "Columna 2": [10, 20, 30, 40],
+            "Columna 3": ["a", "b", "c", "d"]
+        })
+        
+    with tab2:
+        st.subheader("Ejemplo de gráfico")
+        st.line_chart({"datos": [1, 5, 2, 6, 2, 8, 3]})
+        
+    with tab3:
+        st.subheader("Acerca de esta aplicación")
+        st.info("Esta es una aplicación de demostración creada con Streamlit.")
+        with st.expander("Ver más información"):
+            st.write(\"\"\"
+                Streamlit es una biblioteca de Python que facilita la creación de aplicaciones web 
+                para ciencia de datos y machine learning en minutos.
+                
+                Esta app fue creada automáticamente con el script streamlit-pip.py.
+            \"\"\")
+else:
+    st.info("👈 Ingresa tu nombre en la barra lateral para comenzar")
+
+# Pie de página
+st.divider()
+st.caption("Creado con Streamlit y pip 🚀")
+"""
+
+SECRETS_CONTENT = """# Archivo de secretos para Streamlit
+# Agrega tus variables secretas aquí
+
+API_KEY = ""
+"""
+
+GITIGNORE_CONTENT = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+.Python
+env/
+venv/
+.env
+.venv/
+
+# Streamlit
+.streamlit/secrets.toml
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# Testing
+.pytest_cache/
+.coverage
+htmlcov/
+
+# Build
+build/
+dist/
+*.egg-info/
+"""
+
+def render_app(template, perf_panel=False):
+    """Archivos de la aplicación según la plantilla elegida."""
+    if template == "basica":
+        files = {"app.py": BASIC_APP}
+    else:
+        files = render_template(template, "pip")
+    return add_perf_panel(files) if perf_panel else files
+
+def render_files(options):
+    """Archivos de plantilla y dependencias del proyecto según sus opciones."""
+    files = {
+        "README.md": README_TEMPLATE.format(name=options["name"]),
+        ".streamlit/secrets.toml": SECRETS_CONTENT,
+        ".gitignore": GITIGNORE_CONTENT,
+        **render_app(options["template"], options.get("perf_panel", False)),
+    }
+    if options.get("rerun_bench"):
+        files.update(render_rerun_bench(options["template"], "pip"))
+    template_packages = TEMPLATE_DEPENDENCIES.get(options["template"], [])
+    # La plantilla externa, si la hay, va encima de la del generador
+    files.update(external_files(options, GENERATOR))
+    return files, {"main": ["streamlit", *template_packages, *options["packages"]]}
+
+def create_project(name, parent=None):
+    """Crea un proyecto Streamlit básico (en `parent` o el directorio actual)."""
+    try:
+        # Crear el directorio del proyecto
+        project_path = (parent or Path.cwd()) / name
+        project_path.mkdir(exist_ok=True)
+        
+        # Crear archivo requirements.txt con Streamlit
+        requirements_path = project_path / "requirements.txt"
+        with open(requirements_path, "w", encoding="utf-8") as f:
+            f.write("# Dependencias del proyecto\n")
+            f.write("streamlit>=1.37.0\n")
+        
+        # README.md sale de la plantilla
+        write_files(project_path, {"README.md": README_TEMPLATE.format(name=name)})
+            
+        return True, project_path
+    except Exception as e:
+        console.print(f"[red]Error al crear el proyecto: {e}[/red]")
+        return False, None
+
+def venv_command():
+    """Orden que crea el entorno virtual del proyecto."""
+    return [sys.executable, "-m", "venv", ".venv"]
+
+def create_venv(project_path):
+    """Crea un entorno virtual con venv sin escribir en la terminal."""
+    # venv instala pip con ensurepip: cuenta como una instalación más
+    with installer_slot():
+        return run_quiet(venv_command(), cwd=project_path)
+
+def get_pip_path(project_path):
+    """Obtiene la ruta al pip del entorno virtual."""
+    if sys.platform == "win32":
+        return project_path / ".venv" / "Scripts" / "pip"
+    else:
+        return project_path / ".venv" / "bin" / "pip"
+
+def install_command(project_path, packages, local_args=()):
+    """Orden del pip del entorno que instala paquetes (desde local_args si se dan)."""
+    return [str(get_pip_path(project_path)), "install", *local_args, *packages]
+
+def pip_install(project_path, pkg, prefetcher=None):
+    """Instala un paquete, solo desde lo descargado por adelantado si es posible."""
+    local_args = prefetcher.local_install_args([pkg]) if prefetcher else []
+    with installer_slot():
+        if local_args:
+            result = resources.run(install_command(project_path, [pkg], local_args), cwd=project_path)
+            if result.returncode == 0:
+                return True
+        result = resources.run(install_command(project_path, [pkg]), cwd=project_path)
+    return result.returncode == 0
+
+def install_streamlit(project_path, prefetcher=None):
+    """Instala Streamlit en el entorno virtual sin escribir en la terminal."""
+    local_args = prefetcher.local_install_args(["streamlit"]) if prefetcher else []
+    with installer_slot():
+        if local_args:
+            ok, error = run_quiet(install_command(project_path, ["streamlit"], local_args), cwd=project_path)
+            if ok:
+                return ok, error
+        return run_quiet(install_command(project_path, ["streamlit"]), cwd=project_path)
+
+def prepare_environment(project_path, prefetcher=None, layered=False):
+    """Crea el entorno virtual e instala Streamlit; devuelve (paso, ok, error).
+
+    En el modo por capas Streamlit no se instala: viene de la base compartida.
+    """
+    if layered:
+        return create_layered_venv(project_path, "pip")
+    ok, error = create_venv(project_path)
+    if not ok:
+        return "venv", ok, error
+    ok, error = install_streamlit(project_path, prefetcher)
+    return "streamlit", ok, error
+
+def resync_environment(project_path, options, missing):
+    """Instala en el entorno las dependencias que agregó la plantilla."""
+    layered = options.get("layered", False)
+    if not (project_path / ".venv").exists():
+        if layered:
+            _, ok, error = create_layered_venv(project_path, "pip")
+        else:
+            ok, error = create_venv(project_path)
+        if not ok:
+            return ok, error
+    if missing["main"]:
+        # Tras una instalación fallida las dependencias ya pueden estar en requirements.txt
+        requirements_path = project_path / "requirements.txt"
+        listed = requirements_path.read_text(encoding="utf-8").splitlines() if requirements_path.exists() else []
+        with open(requirements_path, "a", encoding="utf-8") as f:
+            for pkg in missing["main"]:
+                if pkg not in listed:
+                    f.write(f"{pkg}\n")
+    if layered:
+        result = install_layer(project_path, "pip", project_requirements(project_path))
+        return result["ok"], result["error"]
+    with installer_slot():
+        return run_quiet([str(get_pip_path(project_path)), "install", "-r", "requirements.txt"], cwd=project_path)
+
+def ask_dependencies():
+    """Pregunta qué dependencias se desean instalar además de Streamlit."""
+    console.print("\n[bold cyan]📦 ¿Deseas agregar otras dependencias además de Streamlit?[/bold cyan]")
+    console.print("[dim]Ejemplo: pandas numpy matplotlib plotly altair[/dim]")
+    
+    # Tab completa con el índice local; las erratas se corrigen antes de llamar al instalador
+    index = load_index()
+    with completion(index):
+        dependencies = Prompt.ask(
+            "\n[cyan]Dependencias adicionales (separadas por espacios)[/cyan]",
+            default=""
+        )
+    return review_packages(dependencies.strip().split(), index, console)
+
+def add_dependencies(project_path, packages, prefetcher=None, layered=False):
+    """Agrega dependencias adicionales y devuelve True si se instalaron todas."""
+    # Actualizar requirements.txt manteniendo streamlit
+    requirements_path = project_path / "requirements.txt"
+    with open(requirements_path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    
+    with open(requirements_path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line)
+        for pkg in packages:
+            f.write(f"{pkg}\n")
+    
+    if layered:
+        # Se resuelven junto con Streamlit para detectar conflictos con la base
+        with console.status("[bold green]Instalando dependencias en la capa del proyecto..."):
+            result = install_layer(project_path, "pip", ["streamlit", *packages])
+        report_layer(project_path, result, console)
+        return result["ok"]
+    
+    installed = True
+    with console.status("[bold green]Instalando dependencias adicionales...") as status:
+        for pkg in packages:
+            status.update(f"[bold green]Instalando {pkg}...")
+            if pip_install(project_path, pkg, prefetcher):
+                console.print(f"[green]✓[/green] {pkg} instalado")
+            else:
+                console.print(f"[red]✗[/red] Error instalando {pkg}")
+                installed = False
+    return installed
+
+def create_app_file(project_path, template="basica", perf_panel=False):
+    """Crea app.py (y la configuración que acompañe a la plantilla).
+
+    Con perf_panel se añade perf.py, el panel de rendimiento que se activa
+    con PERF_PANEL=1.
+    """
+    write_files(project_path, render_app(template, perf_panel))
+    if template == "basica":
+        console.print(f"[green]✓[/green] Archivo app.py creado")
+    else:
+        console.print(f"[green]✓[/green] Archivo app.py creado con la plantilla '{template}'")
+    if perf_panel:
+        console.print("[green]✓[/green] Panel de rendimiento añadido (perf.py, se activa con PERF_PANEL=1)")
+
+def create_secrets_folder(project_path):
+    """Crea carpeta .streamlit con archivo secrets.toml."""
+    write_files(project_path, {".streamlit/secrets.toml": SECRETS_CONTENT})
+    console.print(f"[green]✓[/green] Configuración de secretos creada")
+
+def precompile_environment(project_path):
+    """Precompila el entorno a bytecode y muestra el efecto en el arranque."""
+    python = venv_python(project_path / ".venv")
+    with console.status("[bold green]Midiendo el arranque y precompilando el entorno..."):
+        cold, warm, ok, error = precompile_and_measure(python, STREAMLIT_ENTRY, project_path)
+    if ok:
+        console.print("[green]✓[/green] Entorno precompilado a bytecode")
+    else:
+        console.print("[yellow]⚠️[/yellow] Algunos archivos del entorno no se pudieron precompilar")
+    console.print(startup_table(cold, warm))
+
+def main(template_source=None):
+    """Función principal; template_source es la plantilla externa (--plantilla)."""
+    # Una ruta relativa guardada en el manifiesto dependería del directorio desde el que se ejecute update
+    template_source = normalize_source(template_source)
+    resources.report_at_exit(console)
+    console.print(Panel.fit(
+        "[bold blue]Creador de Proyectos Streamlit con pip y venv[/bold blue]\n[dim]Crea aplicaciones Streamlit modernas con facilidad[/dim]",
+        border_style="blue"
+    ))
+    
+    # Verificar pip
+    if not check_pip(console):
+        return
+    
+    # Los pasos que no dependen de las respuestas pendientes se adelantan en
+    # segundo plano y se recogen justo cuando hacen falta
+    tasks = BackgroundTasks()
+    tasks.start("gh", check_gh)
+    tasks.start("cursor", check_cursor)
+    
+    # Nombre del proyecto
+    project_name = Prompt.ask("\n[bold cyan]📝 Nombre del proyecto Streamlit[/bold cyan]")
+    
+    if not project_name.strip():
+        console.print("[red]❌ El nombre no puede estar vacío[/red]")
+        return
+    
+    project_name = project_name.strip()
+    project_path = Path.cwd() / project_name
+    
+    # Verificar si el proyecto ya existe
+    if project_path.exists():
+        console.print(f"[red]❌ Ya existe un proyecto con ese nombre[/red]")
+        return
+    
+    # Modo por capas: Streamlit y sus dependencias vienen de una base compartida
+    layered = Confirm.ask(
+        "\n[cyan]¿Usar el entorno base compartido de Streamlit (modo por capas)?[/cyan]",
+        default=False
+    )
+    
+    # Crear proyecto
+    with console.status(f"[bold green]Creando proyecto Streamlit '{project_name}'...") as status:
+        success, project_path = create_project(project_name)
+        if success:
+            console.print(f"[green]✓[/green] Proyecto '{project_name}' creado")
+        else:
+            console.print(f"[red]✗[/red] Error al crear el proyecto '{project_name}'")
+            return
+    
+    # Los hooks del usuario arrancan en cuanto están listos los pasos que piden
+    hooks = start_hooks(GENERATOR, project_path, project_path / ".venv", console)
+    hooks.step_done("project")
+    
+    # Streamlit empieza a descargarse mientras se crea el entorno virtual, y
+    # ambos avanzan mientras se eligen la plantilla y las dependencias
+    prefetcher = Prefetcher("pip")
+    if not layered:
+        prefetcher.start(["streamlit"])
+    tasks.start("environment", prepare_environment, project_path, prefetcher, layered)
+    
+    # Plantilla de la aplicación
+    console.print("\n[dim]basica: demo sencilla · rendimiento: caché, fragmentos y config.toml ajustado · datos: Parquet con lectura perezosa y tabla paginada[/dim]")
+    template = Prompt.ask(
+        "[cyan]Plantilla de la aplicación[/cyan]",
+        choices=TEMPLATE_CHOICES,
+        default="basica"
+    )
+    
+    perf_panel = Confirm.ask(
+        "\n[cyan]¿Añadir un panel de rendimiento (tiempos por rerun y por sección, caché y memoria de la sesión)?[/cyan]",
+        default=False
+    )
+    rerun_bench = Confirm.ask(
+        "\n[cyan]¿Añadir un benchmark de reruns (AppTest: latencia p50/p95 y memoria frente a una línea base)?[/cyan]",
+        default=False
+    )
+    
+    packages = ask_dependencies()
+    # Lo que pide la plantilla se instala junto con las dependencias elegidas
+    to_install = [*TEMPLATE_DEPENDENCIES.get(template, []), *packages]
+    prefetcher.start(to_install)
+    wants_precompile = Confirm.ask("\n[cyan]¿Precompilar el entorno a bytecode y medir el primer arranque?[/cyan]", default=False)
+    
+    if layered:
+        # La primera vez se construye la base; después solo se reutiliza
+        message = "[bold green]Preparando la base compartida y el entorno virtual..."
+    else:
+        message = "[bold green]Creando entorno virtual e instalando Streamlit..."
+    with console.status(message):
+        step, ok, error = tasks.join("environment")
+    if step == "base":
+        console.print("[red]✗[/red] No se pudo preparar la base compartida de Streamlit")
+        console.print(f"[dim]{error}[/dim]")
+        finish_hooks(hooks, console)
+        return
+    if step == "venv" and not ok:
+        console.print("[red]✗[/red] Error al crear entorno virtual")
+        console.print(f"[dim]{error}[/dim]")
+        finish_hooks(hooks, console)
+        return
+    hooks.step_done("venv")
+    console.print("[green]✓[/green] Entorno virtual creado")
+    if layered:
+        console.print("[green]✓[/green] Entorno enlazado a la base compartida de Streamlit")
+    elif ok:
+        console.print(f"[green]✓[/green] Streamlit instalado")
+    else:
+        console.print("[red]✗[/red] No se pudo instalar Streamlit, el proyecto podría no funcionar correctamente")
+        console.print(f"[dim]{error}[/dim]")
+    
+    # Agregar dependencias adicionales si el usuario quiere
+    if to_install or layered:
+        deps_ok = add_dependencies(project_path, to_install, prefetcher, layered)
+    else:
+        deps_ok = True
+    hooks.step_done("deps", ok and deps_ok)
+    
+    # Crear archivos específicos de Streamlit
+    create_app_file(project_path, template, perf_panel)
+    create_secrets_folder(project_path)
+    if rerun_bench:
+        write_files(project_path, render_rerun_bench(template, "pip"))
+        console.print(f"[green]✓[/green] Benchmark de reruns creado ({RERUN_BENCH_PATH})")
+    
+    # Precompilar a bytecode
+    if wants_precompile:
+        precompile_environment(project_path)
+
+    # Crear .gitignore
+    with console.status("[bold green]Creando .gitignore..."):
+        write_files(project_path, {".gitignore": GITIGNORE_CONTENT})
+        console.print("[green]✓[/green] Archivo .gitignore creado")
+    
+    # Manifiesto para `streamlit-pip.py update`
+    options = {
+        "name": project_name, "template": template, "packages": packages, "layered": layered,
+        "perf_panel": perf_panel, "rerun_bench": rerun_bench,
+    }
+    # La plantilla externa (--plantilla) se escribe encima de los archivos del generador
+    if template_source and apply_template_source(project_path, template_source, options, GENERATOR, console):
+        options["template_source"] = template_source
+    # Si algo no se instaló, `update` vuelve a sincronizar
+    save_manifest(project_path, GENERATOR, options, *render_files(options), synced=ok and deps_ok)
+    
+    # Preguntar si crear repositorio en GitHub (Git solo se inicializa con él)
+    git_ok = False
+    if tasks.join("gh"):
+        if Confirm.ask("\n[cyan]¿Crear repositorio en GitHub?[/cyan]", default=False):
+            git_ok = create_github_repo(project_name, project_path, console, visibility="public", init=True)
+            if git_ok:
+                console.print("[green]✓[/green] Repositorio creado en GitHub")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo crear el repositorio en GitHub")
+    hooks.step_done("git", git_ok)
+    
+    # Preguntar si abrir en Cursor (solo si está instalado)
+    if tasks.join("cursor"):
+        if Confirm.ask("\n[cyan]¿Abrir proyecto en Cursor IDE?[/cyan]", default=False):
+            if open_in_cursor(project_path, console):
+                console.print("[green]✓[/green] Abriendo en Cursor IDE...")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo abrir Cursor IDE")
+    
+    finish_hooks(hooks, console)
+    
+    # Instrucciones finales
+    console.print("\n[bold green]✨ ¡Proyecto Streamlit listo![/bold green]\n")
+    
+    instructions = Table(show_header=False, box=None, padding=(0, 2))
+    instructions.add_column("Paso", style="yellow")
+    instructions.add_column("Comando", style="cyan")
+    
+    instructions.add_row("1.", f"cd {project_name}")
+    instructions.add_row("2.", ".venv\\Scripts\\activate" if sys.platform == "win32" else "source .venv/bin/activate")
+    instructions.add_row("3.", "streamlit run app.py")
+    
+    console.print(Panel(instructions, title="[bold]Próximos pasos[/bold]", border_style="green"))
+    
+    # Comandos útiles
+    tips = Table(show_header=False, box=None, padding=(0, 2))
+    tips.add_column("Comando", style="cyan")
+    tips.add_column("Descripción", style="white")
+    
+    tips.add_row("pip install <paquete>", "Agregar dependencias")
+    tips.add_row("pip freeze > requirements.txt", "Actualizar requirements.txt")
+    tips.add_row("streamlit --help", "Ver opciones de Streamlit")
+    if perf_panel:
+        tips.add_row("PERF_PANEL=1", "Variable que muestra el panel de rendimiento")
+    if rerun_bench:
+        tips.add_row(f"python {RERUN_BENCH_PATH}", "Medir la latencia de los reruns (--guardar-base para fijar la línea base)")
+    
+    console.print(Panel(tips, title="[bold]Comandos útiles[/bold]", border_style="blue"))
+
+def update(path):
+    """Aplica las plantillas actuales a un proyecto creado con este script."""
+    resources.report_at_exit(console)
+    project_path = Path(path).resolve()
+    console.print(Panel.fit(
+        f"[bold blue]Actualizar proyecto Streamlit con pip y venv[/bold blue]\n[dim]{project_path}[/dim]",
+        border_style="blue"
+    ))
+    if not check_pip(console):
+        return
+    update_project(project_path, GENERATOR, render_files, resync_environment, console)
+
+def cli(argv=None, prog=None):
+    """Crea un proyecto nuevo o, con el subcomando update, actualiza uno existente."""
+    args = parse_args("Creador de proyectos Streamlit con pip y venv", argv, prog)
+    if args.command == "update":
+        update(args.ruta)
+    else:
+        main(args.plantilla) 
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,623 @@
+"""
+Creador de proyectos Streamlit con UV
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.background import BackgroundTasks, run_quiet
+from comandos.common import check_cursor, check_gh, check_uv, create_github_repo, open_in_cursor
+from comandos.hooks import finish_hooks, start_hooks
+from comandos.layers import create_layered_venv, install_layer, project_requirements, report_layer
+from comandos.locking import installer_slot
+from comandos.package_index import completion, load_index, review_packages
+from comandos.prefetch import Prefetcher
+from comandos.rerun_bench import RERUN_BENCH_PATH, render_rerun_bench
+from comandos.startup import STREAMLIT_ENTRY, precompile_and_measure, startup_table, venv_python
+from comandos.streamlit_templates import TEMPLATE_CHOICES, TEMPLATE_DEPENDENCIES, add_perf_panel, render_template
+from comandos.template_sources import apply_template_source, external_files, normalize_source
+from comandos.tuning import apply_tuning
+from comandos.update import parse_args, save_manifest, update_project, write_files
+
+console = Console()
+
+GENERATOR = "streamlit-uv"
+
+README_TEMPLATE = """# {name}
+
+## Descripción
+Esta es una aplicación Streamlit creada con UV, un gestor de paquetes y entornos virtuales ultrarrápido.
+
+## Características
+- Interfaz de usuario moderna con Streamlit
+- Gestión de dependencias con UV
+- Estructura de proyecto optimizada
+
+## Requisitos
+- Python 3.8 o superior
+- UV (instalado con `curl -LsSf https://astral.sh/uv/install.sh | sh` o `powershell -c "irm https://astral.sh/uv/install.ps1 | iex"`)
+
+## Instalación
+
+1. Clona este repositorio o descárgalo:
+   ```bash
+   git clone <url-del-repositorio>
+   cd {name}
+   ```
+
+2. Sincroniza las dependencias con UV:
+   ```bash
+   uv sync
+   ```
+
+## Uso
+
+Para ejecutar la aplicación:
+```bash
+uv run streamlit run app.py
+```
+
+O si tienes el entorno virtual activado:
+```bash
+streamlit run app.py
+```
+
+## Estructura del proyecto
+```
+{name}/
+├── app.py                # Aplicación principal de Streamlit
+├── .streamlit/           # Configuración de Streamlit
+│   └── secrets.toml      # Secretos (no incluidos en Git)
+├── .venv/                # Entorno virtual (generado por UV)
+├── pyproject.toml        # Configuración del proyecto y dependencias
+└── README.md             # Este archivo
+```
+
+## Licencia
+Este proyecto está disponible bajo la licencia MIT.
+
+## Créditos
+Creado con [streamlit-uv.py](https://github.com/usuario/streamlit-uv)
+"""
+
+BASIC_APP = """import streamlit as st
+
+# Configuración de la página
+st.set_page_config(
+    page_title="Mi Aplicación Streamlit",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="auto"
+)
+
+# Título principal
+st.title("Mi Aplicación Streamlit")
+
+# Sidebar
+with st.sidebar:
+    st.header("Configuración")
+    nombre = st.text_input("Tu nombre")
+    color = st.color_picker("Elige un color", "#0066ff")
+    
+# Contenido principal
+st.header("¡Bienvenido a Streamlit!")
+
+if nombre:
+    st.markdown(f"### Hola, {nombre}! 👋")
+    st.write(f"Tu color elegido es: {color}")
+    
+    # Demostración de algunos widgets
+    tab1, tab2, tab3 = st.tabs(["Datos", "Visualización", "Acerca de"])
+    
+    with tab1:
+        st.subheader("Ejemplo de tabla de datos")
+        st.dataframe({
+            "Columna 1": [1, 2, 3, 4],
+            "Columna 2": [10, 20, 30, 40],
+            "Columna 3": ["a", "b", "c", "d"]
+        })
+        
+    with tab2:
+        st.subheader("Ejemplo de gráfico")
+        st.line_chart({"datos": [1, 5, 2, 6, 2, 8, 3]})
+        
+    with tab3:
+        st.subheader("Acerca de esta aplicación")
+        st.info("Esta es una aplicación de demostración creada con Streamlit y UV.")
+        with st.expander("Ver más información"):
+            st.write(\"\"\"
+                Streamlit es una biblioteca de Python que facilita la creación de aplicaciones web 
+                para ciencia de datos y machine learning en minutos.
+                
+                Esta app fue creada automáticamente con el script streamlit-uv.py.
+            \"\"\")
+else:
+    st.info("👈 Ingresa tu nombre en la barra lateral para comenzar")
+
+# Pie de página
+st.divider()
+st.caption("Creado con Streamlit y UV 🚀")
+"""
+
+SECRETS_CONTENT = """# Archivo de secretos para Streamlit
+# Agrega tus variables secretas aquí
+
+API_KEY = ""
+"""
+
+GITIGNORE_CONTENT = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+.Python
+env/
+venv/
+.env
+.venv/
+
+# UV
+.uv/
+uv.lock
+
+# Streamlit
+.streamlit/credentials.toml
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# Testing
+.pytest_cache/
+.coverage
+htmlcov/
+
+# Build
+build/
+dist/
+*.egg-info/
+"""
+
+def render_app(template, perf_panel=False):
+    """Archivos de la aplicación según la plantilla elegida."""
+    if template == "basica":
+        files = {"app.py": BASIC_APP}
+    else:
+        files = render_template(template, "uv")
+    return add_perf_panel(files) if perf_panel else files
+
+def render_files(options):
+    """Archivos de plantilla y dependencias del proyecto según sus opciones."""
+    files = {
+        "README.md": README_TEMPLATE.format(name=options["name"]),
+        ".streamlit/secrets.toml": SECRETS_CONTENT,
+        ".gitignore": GITIGNORE_CONTENT,
+        **render_app(options["template"], options.get("perf_panel", False)),
+    }
+    if options.get("rerun_bench"):
+        files.update(render_rerun_bench(options["template"], "uv"))
+    template_packages = TEMPLATE_DEPENDENCIES.get(options["template"], [])
+    # La plantilla externa, si la hay, va encima de la del generador
+    files.update(external_files(options, GENERATOR))
+    return files, {"main": ["streamlit", *template_packages, *options["packages"]]}
+
+def render_pyproject(name):
+    """pyproject.toml inicial del proyecto (sin dependencias)."""
+    return f"""[project]
+name = "{name}"
+version = "0.1.0"
+description = "Aplicación Streamlit creada con UV"
+readme = "README.md"
+requires-python = ">=3.8"
+dependencies = []
+"""
+
+def add_command(packages, no_sync=False):
+    """Orden de UV que agrega paquetes (con no_sync, solo a pyproject.toml y uv.lock)."""
+    return ["uv", "add", *(["--no-sync"] if no_sync else []), *packages]
+
+def sync_command():
+    """Orden de UV que crea el entorno virtual y lo sincroniza."""
+    return ["uv", "sync"]
+
+def create_project(name, parent=None):
+    """Crea un proyecto con UV pero sin crear main.py (en `parent` o el directorio actual)."""
+    try:
+        # Primero creamos el directorio del proyecto
+        project_path = (parent or Path.cwd()) / name
+        project_path.mkdir(exist_ok=True)
+        
+        # Creamos manualmente pyproject.toml en lugar de usar uv init
+        pyproject_path = project_path / "pyproject.toml"
+        with open(pyproject_path, "w", encoding="utf-8") as f:
+            f.write(render_pyproject(name))
+            
+        # README.md sale de la plantilla
+        write_files(project_path, {"README.md": README_TEMPLATE.format(name=name)})
+            
+        return True
+    except Exception as e:
+        console.print(f"[red]Error al crear el proyecto: {e}[/red]")
+        return False
+
+def install_streamlit(project_path, layered=False, lazy=False):
+    """Agrega Streamlit, la dependencia principal, sin escribir en la terminal.
+
+    En el modo por capas solo se anota en pyproject.toml y uv.lock: el .venv
+    se enlaza a la base compartida, que ya trae Streamlit. Con el entorno
+    diferido (lazy) también, pero sin crear ningún .venv.
+    """
+    if lazy:
+        with installer_slot():
+            return run_quiet(add_command(["streamlit"], no_sync=True), cwd=project_path)
+    if layered:
+        _, ok, error = create_layered_venv(project_path, "uv")
+        if not ok:
+            return ok, error
+        with installer_slot():
+            return run_quiet(add_command(["streamlit"], no_sync=True), cwd=project_path)
+    with installer_slot():
+        return run_quiet(add_command(["streamlit"]), cwd=project_path)
+
+def resync_environment(project_path, options, missing):
+    """Agrega las dependencias que incorporó la plantilla y sincroniza."""
+    # Con el entorno diferido y aún sin crear basta con actualizar uv.lock
+    if options.get("lazy_env", False) and not (project_path / ".venv").exists():
+        with installer_slot():
+            if missing["main"]:
+                ok, error = run_quiet(add_command(missing["main"], no_sync=True), cwd=project_path)
+                if not ok:
+                    return ok, error
+            return run_quiet(["uv", "lock"], cwd=project_path)
+    if options.get("layered", False):
+        if not (project_path / ".venv").exists():
+            _, ok, error = create_layered_venv(project_path, "uv")
+            if not ok:
+                return ok, error
+        if missing["main"]:
+            with installer_slot():
+                ok, error = run_quiet(add_command(missing["main"], no_sync=True), cwd=project_path)
+            if not ok:
+                return ok, error
+        result = install_layer(project_path, "uv", project_requirements(project_path))
+        return result["ok"], result["error"]
+    with installer_slot():
+        if missing["main"]:
+            ok, error = run_quiet(add_command(missing["main"]), cwd=project_path)
+            if not ok:
+                return ok, error
+        return run_quiet(sync_command(), cwd=project_path)
+
+def ask_dependencies():
+    """Pregunta qué dependencias se desean instalar además de Streamlit."""
+    console.print("\n[bold cyan]📦 ¿Deseas agregar otras dependencias además de Streamlit?[/bold cyan]")
+    console.print("[dim]Ejemplo: pandas numpy matplotlib plotly altair[/dim]")
+    
+    # Tab completa con el índice local; las erratas se corrigen antes de llamar al instalador
+    index = load_index()
+    with completion(index):
+        dependencies = Prompt.ask(
+            "\n[cyan]Dependencias adicionales (separadas por espacios)[/cyan]",
+            default=""
+        )
+    return review_packages(dependencies.strip().split(), index, console)
+
+def add_dependencies(project_path, packages, prefetcher=None, no_sync=False):
+    """Agrega dependencias al proyecto (sin sincronizar en los modos por capas y diferido).
+
+    Devuelve True si se agregaron todas.
+    """
+    added = True
+    with console.status("[bold green]Instalando dependencias adicionales...") as status:
+        for pkg in packages:
+            status.update(f"[bold green]Instalando {pkg}...")
+            if prefetcher:
+                # Con la caché ya llena, uv add solo enlaza archivos locales
+                prefetcher.wait(pkg)
+            try:
+                with installer_slot():
+                    resources.run(add_command([pkg], no_sync), cwd=project_path, check=True)
+                console.print(f"[green]✓[/green] {pkg} {'agregado' if no_sync else 'instalado'}")
+            except subprocess.CalledProcessError:
+                console.print(f"[red]✗[/red] Error instalando {pkg}")
+                added = False
+    return added
+
+def create_app_file(project_path, template="basica", perf_panel=False):
+    """Crea app.py (y la configuración que acompañe a la plantilla).
+
+    Con perf_panel se añade perf.py, el panel de rendimiento que se activa
+    con PERF_PANEL=1.
+    """
+    write_files(project_path, render_app(template, perf_panel))
+    if template == "basica":
+        console.print(f"[green]✓[/green] Archivo app.py creado")
+    else:
+        console.print(f"[green]✓[/green] Archivo app.py creado con la plantilla '{template}'")
+    if perf_panel:
+        console.print("[green]✓[/green] Panel de rendimiento añadido (perf.py, se activa con PERF_PANEL=1)")
+
+def create_secrets_folder(project_path):
+    """Crea carpeta .streamlit con archivo secrets.toml."""
+    write_files(project_path, {".streamlit/secrets.toml": SECRETS_CONTENT})
+    console.print(f"[green]✓[/green] Configuración de secretos creada")
+
+def precompile_environment(project_path):
+    """Precompila el entorno a bytecode y muestra el efecto en el arranque."""
+    python = venv_python(project_path / ".venv")
+    with console.status("[bold green]Midiendo el arranque y precompilando el entorno..."):
+        cold, warm, ok, error = precompile_and_measure(python, STREAMLIT_ENTRY, project_path)
+    if ok:
+        console.print("[green]✓[/green] Entorno precompilado a bytecode")
+    else:
+        console.print("[yellow]⚠️[/yellow] Algunos archivos del entorno no se pudieron precompilar")
+    console.print(startup_table(cold, warm))
+
+def main(template_source=None):
+    """Función principal; template_source es la plantilla externa (--plantilla)."""
+    # Una ruta relativa guardada en el manifiesto dependería del directorio desde el que se ejecute update
+    template_source = normalize_source(template_source)
+    resources.report_at_exit(console)
+    console.print(Panel.fit(
+        "[bold blue]Creador de Proyectos Streamlit con UV[/bold blue]\n[dim]Crea aplicaciones Streamlit modernas con facilidad[/dim]",
+        border_style="blue"
+    ))
+    
+    # Verificar UV
+    if not check_uv(console):
+        return
+    
+    # Los pasos que no dependen de las respuestas pendientes se adelantan en
+    # segundo plano y se recogen justo cuando hacen falta
+    tasks = BackgroundTasks()
+    tasks.start("gh", check_gh)
+    tasks.start("cursor", check_cursor)
+    
+    # Nombre del proyecto
+    project_name = Prompt.ask("\n[bold cyan]📝 Nombre del proyecto Streamlit[/bold cyan]")
+    
+    if not project_name.strip():
+        console.print("[red]❌ El nombre no puede estar vacío[/red]")
+        return
+    
+    project_name = project_name.strip()
+    project_path = Path.cwd() / project_name
+    
+    # Verificar si el proyecto ya existe
+    if project_path.exists():
+        console.print(f"[red]❌ Ya existe un proyecto con ese nombre[/red]")
+        return
+    
+    # Modo por capas: Streamlit y sus dependencias vienen de una base compartida
+    layered = Confirm.ask(
+        "\n[cyan]¿Usar el entorno base compartido de Streamlit (modo por capas)?[/cyan]",
+        default=False
+    )
+    # Entorno diferido: sin .venv, para proyectos que se generan aquí y se usan en otra máquina
+    lazy_env = not layered and Confirm.ask(
+        "\n[cyan]¿Diferir el entorno (solo pyproject.toml y uv.lock; .venv se crea en el primer `uv run`)?[/cyan]",
+        default=False
+    )
+    
+    # Crear proyecto
+    with console.status(f"[bold green]Creando proyecto Streamlit '{project_name}'...") as status:
+        if create_project(project_name):
+            console.print(f"[green]✓[/green] Proyecto '{project_name}' creado")
+        else:
+            console.print(f"[red]✗[/red] Error al crear el proyecto '{project_name}'")
+            return
+    
+    # Los hooks del usuario arrancan en cuanto están listos los pasos que piden
+    hooks = start_hooks(GENERATOR, project_path, project_path / ".venv", console)
+    hooks.step_done("project")
+    
+    # Streamlit siempre se agrega: su instalación avanza mientras se eligen
+    # la plantilla y las dependencias adicionales
+    tasks.start("streamlit", install_streamlit, project_path, layered, lazy_env)
+    
+    # Plantilla de la aplicación
+    console.print("\n[dim]basica: demo sencilla · rendimiento: caché, fragmentos y config.toml ajustado · datos: Parquet con lectura perezosa y tabla paginada[/dim]")
+    template = Prompt.ask(
+        "[cyan]Plantilla de la aplicación[/cyan]",
+        choices=TEMPLATE_CHOICES,
+        default="basica"
+    )
+    
+    perf_panel = Confirm.ask(
+        "\n[cyan]¿Añadir un panel de rendimiento (tiempos por rerun y por sección, caché y memoria de la sesión)?[/cyan]",
+        default=False
+    )
+    rerun_bench = Confirm.ask(
+        "\n[cyan]¿Añadir un benchmark de reruns (AppTest: latencia p50/p95 y memoria frente a una línea base)?[/cyan]",
+        default=False
+    )
+    
+    packages = ask_dependencies()
+    # Lo que pide la plantilla se instala junto con las dependencias elegidas
+    to_install = [*TEMPLATE_DEPENDENCIES.get(template, []), *packages]
+    # Las descargas empiezan en cuanto se conocen los nombres de los paquetes
+    # (con el entorno diferido no se instala nada: uv lock solo lee metadatos)
+    prefetcher = None
+    if not lazy_env:
+        prefetcher = Prefetcher("uv")
+        prefetcher.start(to_install)
+    wants_precompile = not lazy_env and Confirm.ask(
+        "\n[cyan]¿Precompilar el entorno a bytecode y medir el primer arranque?[/cyan]", default=False
+    )
+    
+    # uv add no debe ejecutarse dos veces a la vez sobre el mismo proyecto
+    with console.status("[bold green]Instalando Streamlit..."):
+        ok, error = tasks.join("streamlit")
+    # uv add deja creado el .venv con Streamlit dentro (salvo con el entorno diferido)
+    hooks.step_done("venv", ok and not lazy_env)
+    if ok and lazy_env:
+        console.print("[green]✓[/green] Streamlit agregado a pyproject.toml y uv.lock")
+    elif ok and layered:
+        console.print("[green]✓[/green] Entorno enlazado a la base compartida de Streamlit")
+    elif ok:
+        console.print(f"[green]✓[/green] Streamlit instalado")
+    else:
+        console.print(f"[red]✗[/red] Error instalando Streamlit")
+        console.print(f"[dim]{error}[/dim]")
+    
+    deps_ok = add_dependencies(project_path, to_install, prefetcher, layered or lazy_env) if to_install else True
+    
+    if lazy_env:
+        # uv add --no-sync ya dejó uv.lock resuelto: no hay entorno que sincronizar
+        console.print("[green]✓[/green] pyproject.toml y uv.lock listos; el entorno se creará en el primer uv run")
+        hooks.step_done("deps", False)
+        env_ok = True
+    elif layered:
+        # La capa del proyecto recibe solo lo que no trae la base
+        with console.status("[bold green]Instalando dependencias en la capa del proyecto..."):
+            result = install_layer(project_path, "uv", ["streamlit", *to_install])
+        report_layer(project_path, result, console)
+        hooks.step_done("deps", result["ok"])
+        env_ok = result["ok"]
+    else:
+        # Crear entorno virtual y sincronizar
+        with console.status("[bold green]Creando entorno virtual y sincronizando..."):
+            try:
+                # UV sync automáticamente crea el entorno virtual si no existe
+                with installer_slot():
+                    resources.run(sync_command(), cwd=project_path, check=True)
+                console.print("[green]✓[/green] Entorno virtual creado y dependencias instaladas")
+                hooks.step_done("deps")
+                env_ok = True
+            except subprocess.CalledProcessError:
+                console.print("[red]✗[/red] Error al crear entorno virtual")
+                hooks.step_done("deps", False)
+                env_ok = False
+    
+    # Crear archivos específicos de Streamlit
+    create_app_file(project_path, template, perf_panel)
+    create_secrets_folder(project_path)
+    if rerun_bench:
+        write_files(project_path, render_rerun_bench(template, "uv"))
+        console.print(f"[green]✓[/green] Benchmark de reruns creado ({RERUN_BENCH_PATH})")
+    
+    # Precompilar a bytecode
+    if wants_precompile:
+        precompile_environment(project_path)
+    
+    # Inicializar Git automáticamente
+    with console.status("[bold green]Inicializando Git..."):
+        try:
+            resources.run(["git", "init"], cwd=project_path, check=True)
+            # Crear .gitignore
+            write_files(project_path, {".gitignore": GITIGNORE_CONTENT})
+            console.print("[green]✓[/green] Repositorio Git inicializado")
+            hooks.step_done("git")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            console.print("[yellow]⚠️[/yellow] Git no está instalado o no se pudo inicializar")
+            hooks.step_done("git", False)
+    
+    # Manifiesto para `streamlit-uv.py update`
+    options = {
+        "name": project_name, "template": template, "packages": packages, "layered": layered,
+        "lazy_env": lazy_env, "perf_panel": perf_panel, "rerun_bench": rerun_bench,
+    }
+    # La plantilla externa (--plantilla) se escribe encima de los archivos del generador
+    if template_source and apply_template_source(project_path, template_source, options, GENERATOR, console):
+        options["template_source"] = template_source
+    # Si algo no se instaló, `update` vuelve a sincronizar
+    save_manifest(project_path, GENERATOR, options, *render_files(options), synced=ok and deps_ok and env_ok)
+    
+    # Preguntar si crear repositorio en GitHub
+    if tasks.join("gh"):
+        if Confirm.ask("\n[cyan]¿Crear repositorio en GitHub?[/cyan]", default=False):
+            if create_github_repo(project_name, project_path, console, visibility="public"):
+                console.print("[green]✓[/green] Repositorio creado en GitHub")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo crear el repositorio en GitHub")
+    
+    # Preguntar si abrir en Cursor (solo si está instalado)
+    if tasks.join("cursor"):
+        if Confirm.ask("\n[cyan]¿Abrir proyecto en Cursor IDE?[/cyan]", default=False):
+            if open_in_cursor(project_path, console):
+                console.print("[green]✓[/green] Abriendo en Cursor IDE...")
+            else:
+                console.print("[yellow]⚠️[/yellow] No se pudo abrir Cursor IDE")
+    
+    # Eliminar main.py si existe
+    main_py_path = project_path / "main.py"
+    if main_py_path.exists():
+        main_py_path.unlink()
+        console.print("[yellow]ℹ️[/yellow] Archivo main.py eliminado")
+    
+    finish_hooks(hooks, console)
+    
+    # Instrucciones finales
+    console.print("\n[bold green]✨ ¡Proyecto Streamlit listo![/bold green]\n")
+    
+    instructions = Table(show_header=False, box=None, padding=(0, 2))
+    instructions.add_column("Paso", style="yellow")
+    instructions.add_column("Comando", style="cyan")
+    
+    instructions.add_row("1.", f"cd {project_name}")
+    # uv run sin --no-sync instalaría en el .venv todo lo que ya da la base
+    run_command = "uv run --no-sync streamlit run app.py" if layered else "uv run streamlit run app.py"
+    instructions.add_row("2.", run_command)
+    
+    console.print(Panel(instructions, title="[bold]Próximos pasos[/bold]", border_style="green"))
+    
+    # Comandos útiles
+    tips = Table(show_header=False, box=None, padding=(0, 2))
+    tips.add_column("Comando", style="cyan")
+    tips.add_column("Descripción", style="white")
+    
+    if layered:
+        tips.add_row("uv add --no-sync <paquete>", "Agregar dependencias al proyecto")
+        tips.add_row("streamlit-uv.py update", "Instalar en la capa lo que falte")
+        tips.add_row("uv sync", "Pasar a un entorno completo, sin la base")
+    else:
+        tips.add_row("uv add <paquete>", "Agregar dependencias")
+        if lazy_env:
+            tips.add_row("uv sync --frozen", "Crear el entorno exactamente como fija uv.lock")
+        else:
+            tips.add_row("uv sync", "Sincronizar entorno")
+    tips.add_row(run_command, "Ejecutar la app Streamlit")
+    if perf_panel:
+        tips.add_row("PERF_PANEL=1", "Variable que muestra el panel de rendimiento")
+    if rerun_bench:
+        bench_command = f"uv run {'--no-sync ' if layered else ''}{RERUN_BENCH_PATH}"
+        tips.add_row(bench_command, "Medir la latencia de los reruns (--guardar-base para fijar la línea base)")
+    
+    console.print(Panel(tips, title="[bold]Comandos útiles[/bold]", border_style="blue"))
+
+def update(path):
+    """Aplica las plantillas actuales a un proyecto creado con este script."""
+    resources.report_at_exit(console)
+    project_path = Path(path).resolve()
+    console.print(Panel.fit(
+        f"[bold blue]Actualizar proyecto Streamlit con UV[/bold blue]\n[dim]{project_path}[/dim]",
+        border_style="blue"
+    ))
+    if not check_uv(console):
+        return
+    update_project(project_path, GENERATOR, render_files, resync_environment, console)
+
+def cli(argv=None, prog=None):
+    """Crea un proyecto nuevo o, con el subcomando update, actualiza uno existente."""
+    args = parse_args("Creador de proyectos Streamlit con UV", argv, prog)
+    # Concurrencia de UV calibrada para esta máquina (comandos calibrate)
+    apply_tuning()
+    if args.command == "update":
+        update(args.ruta)
+    else:
+        main(args.plantilla)
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,285 @@
+"""Hooks del usuario que se ejecutan al crear un proyecto.
+
+Se declaran en hooks.toml (en el directorio de configuración de comandos o
+en la ruta de COMANDOS_HOOKS):
+
+    [[hook]]
+    name = "pre-commit"
+    run = "pre-commit install"
+    after = ["git", "venv"]   # pasos integrados u otros hooks
+    timeout = 120             # segundos (opcional)
+    generators = ["python-uv"]  # opcional: por defecto, todos
+
+Cada hook arranca en cuanto terminan los pasos de los que depende, en
+paralelo con los demás hooks y con lo que quede del generador. Si un hook
+falla solo se omiten los que dependen de él.
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from comandos import resources
+
+# Pasos integrados que los generadores anuncian al completarse
+BUILTIN_STEPS = {
+    "project": "proyecto creado",
+    "venv": "entorno virtual listo",
+    "deps": "dependencias instaladas",
+    "git": "repositorio Git inicializado",
+}
+
+STATUS_LABELS = {
+    "ok": ("ok", "green"),
+    "error": ("falló", "red"),
+    "timeout": ("tiempo agotado", "red"),
+    "skipped": ("omitido", "yellow"),
+}
+
+
+def config_root():
+    """Directorio de configuración de comandos según el sistema."""
+    if sys.platform == "win32":
+        return Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming")) / "comandos"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "comandos"
+    return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "comandos"
+
+
+def hooks_path():
+    """Ruta de hooks.toml (COMANDOS_HOOKS o el directorio de configuración)."""
+    if os.environ.get("COMANDOS_HOOKS"):
+        return Path(os.environ["COMANDOS_HOOKS"])
+    return config_root() / "hooks.toml"
+
+
+def load_hooks(generator, path=None, warn=None):
+    """Lee y valida los hooks que aplican al generador.
+
+    Lanza ValueError con un mensaje legible si la configuración no es válida.
+    Los hooks que dependen de otro que no aplica al generador se omiten y se
+    avisa con warn(mensaje).
+    """
+    path = path or hooks_path()
+    if not path.is_file():
+        return []
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+    hooks, generators = [], {}
+    for index, raw in enumerate(data.get("hook", []), start=1):
+        name = raw.get("name") or f"hook-{index}"
+        if not raw.get("run") or not isinstance(raw["run"], (str, list)):
+            raise ValueError(f"El hook '{name}' necesita 'run' (texto o lista)")
+        if name in BUILTIN_STEPS:
+            raise ValueError(f"El hook '{name}' se llama como un paso integrado")
+        after = raw.get("after", ["project"])
+        hooks.append({
+            "name": name,
+            "run": raw["run"],
+            "after": [after] if isinstance(after, str) else list(after),
+            "timeout": raw.get("timeout"),
+        })
+        generators[name] = raw.get("generators")
+
+    # Todo el archivo se valida igual para cualquier generador
+    names = [hook["name"] for hook in hooks]
+    if len(set(names)) != len(names):
+        raise ValueError("Hay hooks con el mismo nombre")
+    known = set(BUILTIN_STEPS) | set(names)
+    for hook in hooks:
+        unknown = [step for step in hook["after"] if step not in known]
+        if unknown:
+            raise ValueError(f"El hook '{hook['name']}' depende de pasos desconocidos: {', '.join(unknown)}")
+    _check_cycles(hooks)
+
+    # En orden de dependencias: así se omiten también los que dependen de un hook omitido
+    selected = {}
+    for hook in _dependency_order(hooks):
+        if generators[hook["name"]] is not None and generator not in generators[hook["name"]]:
+            continue
+        missing = [step for step in hook["after"] if step not in BUILTIN_STEPS and step not in selected]
+        if missing:
+            if warn:
+                warn(f"Se omite el hook '{hook['name']}': depende de {', '.join(missing)}, que no se ejecuta con {generator}")
+            continue
+        selected[hook["name"]] = hook
+    return [hook for hook in hooks if hook["name"] in selected]
+
+
+def _dependency_order(hooks):
+    """Los hooks ordenados para que cada uno vaya después de los hooks de los que depende."""
+    by_name = {hook["name"]: hook for hook in hooks}
+    ordered, seen = [], set()
+
+    def visit(hook):
+        if hook["name"] in seen:
+            return
+        seen.add(hook["name"])
+        for step in hook["after"]:
+            if step in by_name:
+                visit(by_name[step])
+        ordered.append(hook)
+
+    for hook in hooks:
+        visit(hook)
+    return ordered
+
+
+def _check_cycles(hooks):
+    """Lanza ValueError si las dependencias entre hooks forman un ciclo."""
+    graph = {hook["name"]: [step for step in hook["after"] if step not in BUILTIN_STEPS] for hook in hooks}
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Las dependencias del hook '{name}' forman un ciclo")
+        visiting.add(name)
+        for step in graph[name]:
+            visit(step)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in graph:
+        visit(name)
+
+
+class HookRunner:
+    """Lanza cada hook en cuanto se cumplen sus dependencias.
+
+    El generador llama a step_done() al terminar cada paso integrado y a
+    finish() al final, que espera a los hooks y devuelve sus resultados.
+    """
+
+    def __init__(self, hooks, cwd, env, max_workers=8):
+        self.hooks = hooks
+        self._pending = {hook["name"]: hook for hook in hooks}
+        self._cwd = cwd
+        self._env = env
+        self._status = {}
+        self._results = {}
+        self._futures = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hook")
+
+    def step_done(self, step, ok=True):
+        """Anuncia que un paso integrado terminó (bien o mal)."""
+        with self._lock:
+            self._status[step] = ok
+            self._schedule()
+
+    def finish(self):
+        """Da por fallidos los pasos no anunciados y espera a todos los hooks."""
+        with self._lock:
+            for step in BUILTIN_STEPS:
+                self._status.setdefault(step, False)
+            self._schedule()
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            wait(futures)
+            with self._lock:
+                if len(self._futures) == len(futures):
+                    break
+        self._executor.shutdown(wait=True)
+        return [self._results[hook["name"]] for hook in self.hooks]
+
+    def _schedule(self):
+        """Lanza u omite los hooks pendientes; requiere tener el bloqueo."""
+        changed = True
+        while changed:
+            changed = False
+            for name, hook in list(self._pending.items()):
+                failed = [step for step in hook["after"] if self._status.get(step) is False]
+                if failed:
+                    del self._pending[name]
+                    self._status[name] = False
+                    self._results[name] = {
+                        "name": name, "status": "skipped", "wall": 0.0,
+                        "error": f"no se completó: {', '.join(failed)}",
+                    }
+                    changed = True
+                elif all(self._status.get(step) for step in hook["after"]):
+                    del self._pending[name]
+                    self._futures.append(self._executor.submit(self._run, hook))
+
+    def _run(self, hook):
+        start = time.perf_counter()
+        status, error = "ok", ""
+        try:
+            result = resources.run(
+                hook["run"], shell=isinstance(hook["run"], str), cwd=self._cwd, env=self._env,
+                capture_output=True, text=True, timeout=hook["timeout"], step=f"hook {hook['name']}",
+            )
+            if result.returncode != 0:
+                lines = (result.stderr or result.stdout or "").strip().splitlines()
+                status, error = "error", lines[-1] if lines else f"código {result.returncode}"
+        except subprocess.TimeoutExpired:
+            status, error = "timeout", f"más de {hook['timeout']} s"
+        except Exception as e:
+            # Un hook roto no debe tumbar al generador ni a los demás hooks
+            status, error = "error", str(e)
+        with self._lock:
+            self._status[hook["name"]] = status == "ok"
+            self._results[hook["name"]] = {
+                "name": hook["name"], "status": status, "wall": time.perf_counter() - start, "error": error,
+            }
+            self._schedule()
+
+
+def hook_env(generator, project_path, venv_path):
+    """Variables de entorno de los hooks: proyecto, generador y su .venv en el PATH."""
+    env = dict(os.environ)
+    env["COMANDOS_GENERATOR"] = generator
+    env["COMANDOS_PROJECT"] = str(project_path)
+    env["COMANDOS_PROJECT_NAME"] = project_path.name
+    env["VIRTUAL_ENV"] = str(venv_path)
+    scripts = venv_path / ("Scripts" if sys.platform == "win32" else "bin")
+    env["PATH"] = os.pathsep.join([str(scripts), env.get("PATH", "")])
+    return env
+
+
+def start_hooks(generator, project_path, venv_path, console):
+    """Carga los hooks del generador y devuelve su HookRunner."""
+    try:
+        hooks = load_hooks(generator, warn=lambda message: console.print(f"[yellow]⚠️[/yellow] {message}"))
+    except ValueError as e:
+        console.print(f"[yellow]⚠️[/yellow] Se ignoran los hooks: {e}")
+        hooks = []
+    if hooks:
+        console.print(f"[dim]{len(hooks)} hook(s) de {hooks_path()}[/dim]")
+    return HookRunner(hooks, project_path, hook_env(generator, project_path, venv_path))
+
+
+def hooks_table(results):
+    """Tabla de Rich con el resultado y la duración de cada hook."""
+    from rich.table import Table
+
+    table = Table(title="Hooks", title_style="bold")
+    table.add_column("Hook", style="cyan")
+    table.add_column("Estado")
+    table.add_column("Tiempo", justify="right")
+    table.add_column("Detalle", style="dim")
+    for result in results:
+        label, style = STATUS_LABELS[result["status"]]
+        table.add_row(result["name"], f"[{style}]{label}[/{style}]", f"{result['wall']:.2f} s", result["error"])
+    return table
+
+
+def finish_hooks(runner, console):
+    """Espera a los hooks que sigan en marcha y muestra sus resultados."""
+    if not runner.hooks:
+        runner.finish()
+        return
+    with console.status("[bold green]Esperando a los hooks..."):
+        results = runner.finish()
+    console.print(hooks_table(results))
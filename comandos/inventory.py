@@ -0,0 +1,412 @@
+"""Inventario de los proyectos generados en un índice SQLite local.
+
+`scan` recorre uno o varios directorios en busca de proyectos generados (los
+que tienen .comandos/manifest.json) y guarda de cada uno el generador, la
+versión de Python, las versiones fijadas de sus dependencias, el hash del
+lock y lo que ocupan sus entornos virtuales. `list` consulta el índice.
+
+El recorrido y la inspección van en paralelo con hilos: casi todo es esperar
+al sistema de archivos. Cada proyecto tiene una huella con las fechas de
+modificación de lo que decide su inventario (manifiesto, lock, requirements,
+pyvenv.cfg y site-packages); si no cambió desde el último escaneo no se
+vuelve a inspeccionar, que es lo caro (medir el entorno archivo a archivo).
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos.cache import cache_dir
+from comandos.package_index import normalize
+from comandos.resources import format_bytes
+from comandos.update import MANIFEST_PATH, load_manifest
+
+console = Console()
+
+INDEX_NAME = "inventario.sqlite"
+
+# Cambiarlo reconstruye el índice desde cero
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    name TEXT,
+    generator TEXT,
+    python TEXT,
+    lock_file TEXT,
+    lock_hash TEXT,
+    environments TEXT,
+    venv_size INTEGER,
+    dependencies TEXT,
+    fingerprint TEXT,
+    scanned_at REAL
+);
+CREATE TABLE IF NOT EXISTS packages (
+    project TEXT REFERENCES projects(path) ON DELETE CASCADE,
+    name TEXT,
+    version TEXT,
+    PRIMARY KEY (project, name)
+);
+CREATE INDEX IF NOT EXISTS packages_name ON packages(name);
+"""
+
+# Directorios que nunca contienen proyectos (los ocultos, como .venv o .git, tampoco se recorren)
+SKIPPED_DIRS = {"node_modules", "__pycache__", "site-packages"}
+
+# Archivos cuya fecha de modificación entra en la huella del proyecto
+FINGERPRINT_FILES = [
+    MANIFEST_PATH.as_posix(), "pyproject.toml", "uv.lock", "requirements.txt", "requirements-dev.txt", ".python-version",
+]
+
+# Archivos del lock, por orden de preferencia
+LOCK_FILES = ["uv.lock", "requirements.txt"]
+
+
+def index_path(path=None):
+    return Path(path) if path else cache_dir("inventario") / INDEX_NAME
+
+
+def open_index(path):
+    """Abre el índice, creándolo (o recreándolo si cambió el esquema)."""
+    db = sqlite3.connect(path)
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        db.executescript("DROP TABLE IF EXISTS packages; DROP TABLE IF EXISTS projects;")
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    # WAL: se puede consultar el índice mientras otro proceso escanea
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute("PRAGMA foreign_keys = ON")
+    db.executescript(SCHEMA)
+    return db
+
+
+# Recorrido
+
+
+def _list_dir(path):
+    """(si es un proyecto generado, subdirectorios a recorrer)."""
+    is_project, subdirs = False, []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == MANIFEST_PATH.parent.name:
+                    is_project = os.path.isfile(os.path.join(entry.path, MANIFEST_PATH.name))
+                elif (
+                    not entry.name.startswith(".") and entry.name not in SKIPPED_DIRS
+                    and entry.is_dir(follow_symlinks=False)
+                ):
+                    subdirs.append(entry.path)
+    except OSError:
+        # Sin permisos o borrado durante el recorrido: se sigue con el resto
+        pass
+    return is_project, subdirs
+
+
+def find_projects(roots, executor):
+    """Proyectos generados bajo `roots`, recorriendo cada nivel en paralelo."""
+    projects, frontier = [], [str(root) for root in roots]
+    while frontier:
+        next_frontier = []
+        for path, (is_project, subdirs) in zip(frontier, executor.map(_list_dir, frontier)):
+            if is_project:
+                projects.append(Path(path))
+            next_frontier += subdirs
+        frontier = next_frontier
+    return sorted(projects)
+
+
+# Inspección de un proyecto
+
+
+def environment_root(project_path):
+    """Directorio con el lock y el .venv del proyecto (la raíz, en un workspace)."""
+    for directory in [project_path, *project_path.parents]:
+        if (directory / "uv.lock").exists() or (directory / ".venv").exists():
+            return directory
+        if directory != project_path and not (directory / "pyproject.toml").exists():
+            # Fuera del workspace: el proyecto aún no tiene ni lock ni entorno
+            break
+    return project_path
+
+
+def environments(root):
+    """Entornos virtuales del directorio (los que tienen pyvenv.cfg)."""
+    try:
+        return sorted(
+            child.name for child in root.iterdir()
+            if child.is_dir() and not child.is_symlink() and (child / "pyvenv.cfg").exists()
+        )
+    except OSError:
+        return []
+
+
+def site_packages(env_path):
+    if sys.platform == "win32":
+        return [env_path / "Lib" / "site-packages"]
+    return sorted(env_path.glob("lib/python*/site-packages"))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def fingerprint(project_path):
+    """Fechas de modificación de lo que decide el inventario del proyecto.
+
+    Instalar, actualizar o quitar un paquete cambia el directorio
+    site-packages, así que basta con su fecha para saber si el entorno cambió.
+    """
+    root = environment_root(project_path)
+    stamps = {name: _mtime(project_path / name) for name in FINGERPRINT_FILES}
+    stamps["root"] = str(root)
+    stamps["root/uv.lock"] = _mtime(root / "uv.lock")
+    for env in environments(root):
+        stamps[f"{env}/pyvenv.cfg"] = _mtime(root / env / "pyvenv.cfg")
+        for directory in site_packages(root / env):
+            stamps[directory.relative_to(root).as_posix()] = _mtime(directory)
+    return json.dumps(stamps, sort_keys=True)
+
+
+def directory_size(path):
+    """Bytes que ocupa un directorio en disco, sin contar dos veces los enlaces duros."""
+    seen, total = set(), 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                info = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            if (info.st_dev, info.st_ino) in seen:
+                continue
+            seen.add((info.st_dev, info.st_ino))
+            # st_blocks es lo que ocupa de verdad (archivos dispersos, bloques); no existe en Windows
+            total += info.st_blocks * 512 if hasattr(info, "st_blocks") else info.st_size
+    return total
+
+
+def read_venv_cfg(env_path):
+    cfg = {}
+    try:
+        for line in (env_path / "pyvenv.cfg").read_text(encoding="utf-8").splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                cfg[key.strip()] = value.strip()
+    except OSError:
+        pass
+    return cfg
+
+
+def python_version(project_path, root):
+    """Versión de Python del entorno, o la pedida en .python-version si no hay entorno."""
+    cfg = read_venv_cfg(root / ".venv")
+    version = cfg.get("version_info") or cfg.get("version")
+    if version:
+        return version
+    try:
+        return (project_path / ".python-version").read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def lock_info(root):
+    """(archivo de lock, sha256) del primero que exista, o (None, None)."""
+    for name in LOCK_FILES:
+        try:
+            return name, hashlib.sha256((root / name).read_bytes()).hexdigest()
+        except OSError:
+            continue
+    return None, None
+
+
+def locked_versions(root):
+    """{paquete: versión} de uv.lock, sin el propio proyecto."""
+    try:
+        with open(root / "uv.lock", "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    versions = {}
+    for package in data.get("package", []):
+        source = package.get("source", {})
+        if "version" in package and not ("virtual" in source or "editable" in source):
+            versions[normalize(package["name"])] = package["version"]
+    return versions
+
+
+def installed_versions(env_path):
+    """{paquete: versión} de lo instalado en el entorno (según sus .dist-info)."""
+    versions = {}
+    for directory in site_packages(env_path):
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.endswith(".dist-info"):
+                name, _, version = entry[: -len(".dist-info")].partition("-")
+                versions[normalize(name)] = version
+    return versions
+
+
+def inspect_project(project_path):
+    """Inventario de un proyecto, listo para guardar en el índice."""
+    manifest = load_manifest(project_path) or {}
+    root = environment_root(project_path)
+    envs = environments(root)
+    lock_file, lock_hash = lock_info(root)
+    # Con uv.lock manda el lock; con pip, lo que hay instalado en .venv
+    packages = (locked_versions(root) if lock_file == "uv.lock" else {}) or installed_versions(root / ".venv")
+    return {
+        "path": str(project_path),
+        "name": manifest.get("options", {}).get("name") or project_path.name,
+        "generator": manifest.get("generator"),
+        "python": python_version(project_path, root),
+        "lock_file": lock_file,
+        "lock_hash": lock_hash,
+        "environments": json.dumps([str((root / env).relative_to(root.parent)) for env in envs]),
+        # Los entornos de un workspace son de todos sus miembros: se cuentan en cada uno
+        "venv_size": sum(directory_size(root / env) for env in envs),
+        "dependencies": json.dumps(manifest.get("dependencies", {})),
+        "packages": packages,
+    }
+
+
+# Índice
+
+
+def save_project(db, record, stamp):
+    packages = record.pop("packages")
+    db.execute(
+        "INSERT OR REPLACE INTO projects VALUES "
+        "(:path, :name, :generator, :python, :lock_file, :lock_hash, :environments, :venv_size, "
+        ":dependencies, :fingerprint, :scanned_at)",
+        {**record, "fingerprint": stamp, "scanned_at": time.time()},
+    )
+    db.execute("DELETE FROM packages WHERE project = ?", (record["path"],))
+    db.executemany(
+        "INSERT INTO packages VALUES (?, ?, ?)", [(record["path"], name, version) for name, version in packages.items()]
+    )
+
+
+def scan(db, roots, workers, full=False):
+    """Escanea `roots` y actualiza el índice; devuelve un resumen del escaneo."""
+    start = time.perf_counter()
+    known = dict(db.execute("SELECT path, fingerprint FROM projects"))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inventario") as executor:
+        projects = find_projects(roots, executor)
+        stamps = dict(zip(projects, executor.map(fingerprint, projects)))
+        changed = [path for path in projects if full or known.get(str(path)) != stamps[path]]
+        # SQLite se escribe solo desde este hilo, en una única transacción
+        with db:
+            for path, record in zip(changed, executor.map(inspect_project, changed)):
+                save_project(db, record, stamps[path])
+            found = {str(path) for path in projects}
+            removed = [
+                path for path in known
+                if path not in found and any(Path(path).is_relative_to(root) for root in roots)
+            ]
+            db.executemany("DELETE FROM projects WHERE path = ?", [(path,) for path in removed])
+    return {
+        "projects": len(projects),
+        "new": sum(str(path) not in known for path in changed),
+        "updated": sum(str(path) in known for path in changed),
+        "removed": len(removed),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+# Órdenes
+
+
+def scan_command(args):
+    roots = [Path(root).resolve() for root in args.raices]
+    missing = [root for root in roots if not root.is_dir()]
+    if missing:
+        console.print(f"[red]❌ {missing[0]} no es un directorio[/red]")
+        return 1
+    workers = args.hilos or 4 * (os.cpu_count() or 1)
+    db = open_index(index_path(args.indice))
+    with console.status(f"[bold green]Escaneando {', '.join(str(root) for root in roots)}..."):
+        summary = scan(db, roots, workers, args.completo)
+    unchanged = summary["projects"] - summary["new"] - summary["updated"]
+    console.print(
+        f"[green]✓[/green] {summary['projects']} proyecto(s) en {summary['elapsed']:.2f} s: "
+        f"{summary['new']} nuevo(s), {summary['updated']} actualizado(s), {unchanged} sin cambios, "
+        f"{summary['removed']} eliminado(s) del índice"
+    )
+    return 0
+
+
+def list_command(args):
+    db = open_index(index_path(args.indice))
+    query = (
+        "SELECT p.path, p.name, p.generator, p.python, p.lock_file, p.lock_hash, p.venv_size, "
+        "(SELECT COUNT(*) FROM packages WHERE project = p.path), {version} FROM projects p {join} ORDER BY p.path"
+    )
+    if args.paquete:
+        rows = db.execute(
+            query.format(version="k.version", join="JOIN packages k ON k.project = p.path AND k.name = ?"),
+            (normalize(args.paquete),),
+        ).fetchall()
+    else:
+        rows = db.execute(query.format(version="NULL", join="")).fetchall()
+    keys = ["path", "name", "generator", "python", "lock_file", "lock_hash", "venv_size", "packages", "version"]
+    records = [dict(zip(keys, row)) for row in rows]
+    if args.json:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+        return 0
+
+    title = f"Proyectos con {normalize(args.paquete)}" if args.paquete else "Inventario"
+    table = Table(title=f"{title} ({len(records)})", title_style="bold")
+    table.add_column("Proyecto", style="cyan")
+    table.add_column("Generador")
+    table.add_column("Python")
+    if args.paquete:
+        table.add_column("Versión", style="yellow")
+    table.add_column("Paquetes", justify="right")
+    table.add_column("Entornos", justify="right")
+    table.add_column("Lock", style="dim")
+    for record in records:
+        lock = f"{record['lock_file']} {record['lock_hash'][:12]}" if record["lock_file"] else "-"
+        row = [record["path"], record["generator"] or "-", record["python"] or "-"]
+        if args.paquete:
+            row.append(record["version"])
+        row += [str(record["packages"]), format_bytes(record["venv_size"]), lock]
+        table.add_row(*row)
+    console.print(table)
+    console.print(f"[dim]Entornos en total: {format_bytes(sum(record['venv_size'] for record in records))}[/dim]")
+    return 0
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Inventario de proyectos generados en un índice SQLite")
+    parser.add_argument("--indice", help=f"archivo del índice (por defecto, {INDEX_NAME} en la caché de comandos)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    scan_parser = subparsers.add_parser("scan", help="busca proyectos generados y actualiza el índice")
+    scan_parser.add_argument("raices", nargs="*", default=["."], help="directorios a recorrer (por defecto, el actual)")
+    scan_parser.add_argument("--hilos", type=int, help="hilos de recorrido e inspección (por defecto, 4 por núcleo)")
+    scan_parser.add_argument("--completo", action="store_true", help="vuelve a inspeccionar aunque nada haya cambiado")
+    list_parser = subparsers.add_parser("list", help="muestra los proyectos del índice")
+    list_parser.add_argument("--paquete", help="solo los que dependen de este paquete, con su versión")
+    list_parser.add_argument("--json", action="store_true", help="salida en JSON")
+    args = parser.parse_args(argv)
+    if args.command == "scan":
+        return scan_command(args)
+    return list_command(args)
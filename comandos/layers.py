@@ -0,0 +1,356 @@
+"""Entorno base compartido para los proyectos Streamlit (modo por capas).
+
+Streamlit y todo su árbol de dependencias (pyarrow, pandas, numpy...) se
+instalan una sola vez por intérprete en un directorio de solo lectura de la
+caché, versionado por la versión de Streamlit:
+
+    <caché>/bases/cpython-312-linux-x86_64/streamlit-1.40.0/
+
+El .venv de cada proyecto solo contiene sus paquetes propios y un archivo
+.pth que añade la base al final de sys.path, así que lo del proyecto tiene
+prioridad. Antes de instalar se comprueba si el proyecto necesita otra
+versión de algún paquete de la base: si es así, esa versión se instala en
+la capa del proyecto (que la tapa) y se avisa del conflicto.
+"""
+import json
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import tomllib
+from importlib import metadata
+from pathlib import Path
+
+from comandos import resources
+from comandos.background import run_quiet
+from comandos.cache import cache_dir
+from comandos.locking import file_lock, installer_slot
+from comandos.prefetch import interpreter_tag
+from comandos.startup import venv_python
+
+BASE_PACKAGES = ["streamlit"]
+
+# Pasado este tiempo se intenta construir una base más nueva
+BASE_MAX_AGE = 30 * 24 * 60 * 60
+
+MANIFEST_NAME = "base.json"
+CONSTRAINTS_NAME = "restricciones.txt"
+PTH_NAME = "_comandos_base.pth"
+
+
+def normalize(name):
+    """Nombre de paquete normalizado (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def bases_dir():
+    """Directorio de las bases del intérprete actual."""
+    return cache_dir("bases", interpreter_tag())
+
+
+def installed_packages(site_packages):
+    """{nombre normalizado: versión} de lo instalado en un directorio."""
+    return {
+        normalize(dist.metadata["Name"]): dist.version
+        for dist in metadata.distributions(path=[str(site_packages)])
+        if dist.metadata["Name"]
+    }
+
+
+def read_base(path):
+    """Manifiesto de una base completa, o None si está a medias."""
+    try:
+        return json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def find_base():
+    """Base más reciente ya construida: (ruta, manifiesto) o (None, None)."""
+    bases = [(path, read_base(path)) for path in bases_dir().glob("streamlit-*")]
+    bases = [(path, manifest) for path, manifest in bases if manifest]
+    if not bases:
+        return None, None
+    return max(bases, key=lambda base: base[1]["created"])
+
+
+def dir_size(path):
+    """Bytes que ocupan los archivos de un directorio (sin seguir enlaces)."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def make_read_only(path):
+    """Quita el permiso de escritura a todos los archivos de la base."""
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            mode = os.lstat(file_path).st_mode
+            if stat.S_ISREG(mode):
+                os.chmod(file_path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def _build_base(backend):
+    """Instala la base en un directorio temporal y la publica con su versión.
+
+    Devuelve (ruta, error). Se llama con el bloqueo de las bases tomado.
+    """
+    staging = Path(tempfile.mkdtemp(prefix=".nueva-", dir=bases_dir()))
+    site = staging / "site-packages"
+    if backend == "uv":
+        command = ["uv", "pip", "install", "--quiet", "--python", sys.executable, "--target", str(site), *BASE_PACKAGES]
+    else:
+        command = [sys.executable, "-m", "pip", "install", "--quiet", "--target", str(site), *BASE_PACKAGES]
+    with installer_slot():
+        ok, error = run_quiet(command)
+    if not ok:
+        shutil.rmtree(staging, ignore_errors=True)
+        return None, error
+
+    packages = installed_packages(site)
+    final = bases_dir() / f"streamlit-{packages['streamlit']}"
+    if read_base(final):
+        # Ya había una base con esta versión de Streamlit: se renueva su fecha
+        shutil.rmtree(staging, ignore_errors=True)
+        manifest = read_base(final)
+        manifest["created"] = time.time()
+        (final / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return final, None
+    shutil.rmtree(final, ignore_errors=True)
+    staging.rename(final)
+    site = final / "site-packages"
+
+    # Se precompila ya en su sitio: los .pyc guardan la ruta de cada módulo
+    run_quiet([sys.executable, "-m", "compileall", "-q", "-j", "0", str(site)])
+    make_read_only(site)
+    constraints = "".join(f"{name}=={version}\n" for name, version in sorted(packages.items()))
+    (final / CONSTRAINTS_NAME).write_text(constraints, encoding="utf-8")
+    # El manifiesto se escribe al final: marca la base como completa
+    manifest = {"python": interpreter_tag(), "created": time.time(), "packages": packages}
+    (final / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return final, None
+
+
+def ensure_base(backend):
+    """Devuelve (ruta de la base, error), construyéndola si hace falta.
+
+    Si la más reciente caducó se intenta construir otra; si eso falla (por
+    ejemplo, sin red) se sigue usando la que había.
+    """
+    with file_lock(bases_dir() / "bases.lock"):
+        path, manifest = find_base()
+        if manifest and time.time() - manifest["created"] < BASE_MAX_AGE:
+            return path, None
+        built, error = _build_base(backend)
+        if built:
+            return built, None
+        return (path, None) if path else (None, error)
+
+
+def write_launchers(venv_path):
+    """Lanzadores de `streamlit` en el .venv, que no tiene Streamlit instalado."""
+    python = venv_python(venv_path)
+    if sys.platform == "win32":
+        (python.parent / "streamlit.cmd").write_text('@"%~dp0python.exe" -m streamlit %*\r\n', encoding="utf-8")
+    else:
+        launcher = python.parent / "streamlit"
+        launcher.write_text(
+            f"#!{python}\nimport sys\nfrom streamlit.web.cli import main\n\nsys.exit(main())\n", encoding="utf-8"
+        )
+        launcher.chmod(0o755)
+
+
+def link_base(venv_path, base):
+    """Añade la base al sys.path del .venv con un archivo .pth."""
+    ok, purelib = run_quiet([str(venv_python(venv_path)), "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"])
+    if not ok:
+        return ok, purelib
+    (Path(purelib.strip()) / PTH_NAME).write_text(f"{base / 'site-packages'}\n", encoding="utf-8")
+    write_launchers(venv_path)
+    return True, ""
+
+
+def linked_base(venv_path):
+    """Base a la que apunta el .venv, o None si no usa el modo por capas."""
+    # lib/pythonX.Y/site-packages en POSIX, Lib/site-packages en Windows
+    for pth in [*venv_path.glob(f"lib/python*/site-packages/{PTH_NAME}"), *venv_path.glob(f"Lib/site-packages/{PTH_NAME}")]:
+        return Path(pth.read_text(encoding="utf-8").strip()).parent
+    return None
+
+
+def create_layered_venv(project_path, backend):
+    """Crea el .venv del proyecto con el mismo intérprete que la base y lo enlaza.
+
+    Devuelve (paso, ok, error) como prepare_environment.
+    """
+    project_path = project_path.absolute()
+    base, error = ensure_base(backend)
+    if base is None:
+        return "base", False, error
+    if backend == "uv":
+        command = ["uv", "venv", "--quiet", "--python", sys.executable, ".venv"]
+    else:
+        command = [sys.executable, "-m", "venv", ".venv"]
+    with installer_slot():
+        ok, error = run_quiet(command, cwd=project_path)
+    if not ok:
+        return "venv", ok, error
+    ok, error = link_base(project_path / ".venv", base)
+    return "venv", ok, error
+
+
+def project_requirements(project_path):
+    """Dependencias declaradas del proyecto (pyproject.toml o requirements.txt)."""
+    pyproject = project_path / "pyproject.toml"
+    if pyproject.exists():
+        with open(pyproject, "rb") as f:
+            return tomllib.load(f).get("project", {}).get("dependencies", [])
+    requirements = project_path / "requirements.txt"
+    if requirements.exists():
+        lines = requirements.read_text(encoding="utf-8").splitlines()
+        return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    return []
+
+
+def _pip_plan(python, packages, constraints, workdir):
+    """Paquetes que pip instalaría en la capa: (ok, [(nombre, versión)] o error)."""
+    report = workdir / "plan.json"
+    command = [str(python), "-m", "pip", "install", "--quiet", "--dry-run", "--report", str(report)]
+    if constraints:
+        command += ["-c", str(constraints)]
+    ok, error = run_quiet([*command, *packages])
+    if not ok:
+        return ok, error
+    plan = json.loads(report.read_text(encoding="utf-8"))
+    return True, [(normalize(item["metadata"]["name"]), item["metadata"]["version"]) for item in plan["install"]]
+
+
+def _uv_plan(python, packages, constraints, workdir):
+    """Resolución completa con uv pip compile: (ok, [(nombre, versión)] o error).
+
+    UV no mira los .pth, así que resuelve también lo que ya está en la base;
+    se descarta después al comparar con ella.
+    """
+    requirements = workdir / "capa.in"
+    requirements.write_text("".join(f"{pkg}\n" for pkg in packages), encoding="utf-8")
+    command = ["uv", "pip", "compile", "--quiet", "--no-header", "--no-annotate", "--python", str(python), str(requirements)]
+    if constraints:
+        command += ["-c", str(constraints)]
+    ok, output = run_quiet(command)
+    if not ok:
+        return ok, output
+    pins = []
+    for line in output.splitlines():
+        name, sep, version = line.strip().partition("==")
+        if sep and not line.startswith(("#", "-")):
+            pins.append((normalize(name.split("[")[0]), version))
+    return True, pins
+
+
+def install_layer(project_path, backend, packages):
+    """Instala los paquetes del proyecto en su capa, sin repetir los de la base.
+
+    Primero se resuelve fijando las versiones de la base; si no hay solución,
+    el proyecto necesita otras versiones y se resuelve sin fijarlas. Devuelve
+    {ok, error, installed: [(nombre, versión)], conflicts: [(nombre, proyecto, base)]}.
+    """
+    venv_path = project_path.absolute() / ".venv"
+    python = venv_python(venv_path)
+    base = linked_base(venv_path)
+    result = {"ok": True, "error": "", "installed": [], "conflicts": []}
+    if base is None:
+        result.update(ok=False, error="el .venv no está enlazado a ninguna base")
+        return result
+    base_packages = read_base(base)["packages"]
+    constraints = base / CONSTRAINTS_NAME
+    plan_for = _uv_plan if backend == "uv" else _pip_plan
+
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        with installer_slot():
+            ok, plan = plan_for(python, packages, constraints, workdir)
+            if not ok:
+                ok, plan = plan_for(python, packages, None, workdir)
+        if not ok:
+            result.update(ok=False, error=plan.splitlines()[-1] if plan else "no se pudo resolver")
+            return result
+
+        layer = [(name, version) for name, version in plan if base_packages.get(name) != version]
+        result["installed"] = layer
+        result["conflicts"] = [
+            (name, version, base_packages[name]) for name, version in layer if name in base_packages
+        ]
+        if not layer:
+            return result
+        if backend == "uv":
+            # Se instala exactamente lo resuelto que falta en la base
+            pinned = workdir / "capa.txt"
+            pinned.write_text("".join(f"{name}=={version}\n" for name, version in layer), encoding="utf-8")
+            command = ["uv", "pip", "install", "--quiet", "--no-deps", "--python", str(python), "-r", str(pinned)]
+        else:
+            # pip ve la base a través del .pth y solo instala lo que falta
+            command = [str(python), "-m", "pip", "install", "--quiet", *packages]
+            if not result["conflicts"]:
+                command += ["-c", str(constraints)]
+        with installer_slot():
+            ok, error = run_quiet(command, cwd=project_path)
+    if not ok:
+        result.update(ok=False, error=error.splitlines()[-1] if error else "falló la instalación")
+    return result
+
+
+def layer_table(project_path, result):
+    """Tabla de Rich con el tamaño de la capa frente a la base compartida."""
+    from rich.table import Table
+
+    base = linked_base(project_path / ".venv")
+    manifest = read_base(base) if base else None
+    table = Table(title="Entorno por capas", title_style="bold")
+    table.add_column("Capa", style="cyan")
+    table.add_column("Paquetes", justify="right")
+    table.add_column("Tamaño", justify="right")
+    table.add_column("Ubicación", style="dim")
+    if manifest:
+        table.add_row(
+            f"Base compartida (Streamlit {manifest['packages']['streamlit']})", str(len(manifest["packages"])),
+            resources.format_bytes(dir_size(base)), str(base),
+        )
+    table.add_row(
+        "Proyecto", str(len(result["installed"])),
+        resources.format_bytes(dir_size(project_path / ".venv")), ".venv",
+    )
+    return table
+
+
+def conflicts_table(conflicts):
+    """Tabla de Rich con los paquetes en los que el proyecto tapa a la base."""
+    from rich.table import Table
+
+    table = Table(title="Conflictos con la base", title_style="bold yellow")
+    table.add_column("Paquete", style="cyan")
+    table.add_column("Proyecto", justify="right")
+    table.add_column("Base", justify="right")
+    for name, wanted, base_version in conflicts:
+        table.add_row(name, wanted, base_version)
+    return table
+
+
+def report_layer(project_path, result, console):
+    """Muestra cómo quedó la capa del proyecto y los conflictos con la base."""
+    if result["ok"]:
+        console.print(f"[green]✓[/green] Capa del proyecto lista ({len(result['installed'])} paquete(s) propios)")
+    else:
+        console.print(f"[red]✗[/red] Error instalando la capa del proyecto: {result['error']}")
+    if result["conflicts"]:
+        console.print("[yellow]⚠️[/yellow] El proyecto necesita otras versiones que la base; se instalan en su capa y tapan las de la base")
+        console.print(conflicts_table(result["conflicts"]))
+    console.print(layer_table(project_path, result))
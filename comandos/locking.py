@@ -0,0 +1,161 @@
+"""Coordinación entre procesos de los generadores que comparten la caché.
+
+- file_lock: bloqueo de un archivo (fcntl en POSIX, msvcrt en Windows).
+- single_flight: una entrada de caché la construye un solo proceso; los
+  demás esperan a que termine y reutilizan el resultado.
+- installer_slot: limita cuántas instalaciones corren a la vez en la
+  máquina, según los núcleos y la memoria disponible.
+"""
+import hashlib
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+from comandos.cache import cache_dir
+from comandos.tuning import calibrated_installs
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Memoria que se reserva por instalación: pip o UV resolviendo y compilando
+INSTALL_MEMORY = 256 * 1024 * 1024
+
+# Las entradas marcadas como completas se reutilizan durante este tiempo
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+COMPLETE_MARKER = ".completo"
+
+
+def _try_lock(f, shared=False):
+    """Intenta bloquear el archivo sin esperar; devuelve True si lo consigue."""
+    try:
+        if sys.platform == "win32":
+            # msvcrt no tiene bloqueos compartidos: se usa siempre exclusivo
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _backoff(attempt):
+    """Pausa creciente con algo de azar para que los procesos no se sincronicen."""
+    time.sleep(min(0.5, 0.01 * 2 ** attempt) * (0.5 + random.random()))
+
+
+@contextmanager
+def file_lock(path, shared=False):
+    """Mantiene bloqueado `path` mientras dura el bloque with.
+
+    Cada llamada abre su propio descriptor, así que el bloqueo también
+    excluye a otros hilos del mismo proceso.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        attempt = 0
+        while not _try_lock(f, shared):
+            _backoff(attempt)
+            attempt += 1
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def path_lock(path):
+    """Bloqueo asociado a un directorio sin crear archivos dentro de él."""
+    digest = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return file_lock(cache_dir("locks") / f"{digest}.lock")
+
+
+def _is_complete(entry, max_age):
+    try:
+        age = time.time() - (entry / COMPLETE_MARKER).stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return max_age is None or age < max_age
+
+
+def single_flight(entry, build, max_age=DEFAULT_MAX_AGE):
+    """Construye la entrada de caché `entry` una sola vez entre procesos.
+
+    build(entry) rellena el directorio y devuelve True si terminó bien. Si
+    otro proceso la está construyendo se espera a que acabe y se reutiliza
+    lo que dejó. Devuelve True si la entrada quedó lista.
+    """
+    if _is_complete(entry, max_age):
+        return True
+    with file_lock(entry.with_name(entry.name + ".lock")):
+        # Otro proceso pudo completarla mientras se esperaba el bloqueo
+        if _is_complete(entry, max_age):
+            return True
+        entry.mkdir(parents=True, exist_ok=True)
+        if not build(entry):
+            return False
+        (entry / COMPLETE_MARKER).touch()
+        return True
+
+
+def available_memory():
+    """Bytes de memoria disponibles, o None si no se pueden averiguar."""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def max_parallel_installs():
+    """Instalaciones simultáneas permitidas (COMANDOS_MAX_INSTALLS, calibradas o automático)."""
+    if os.environ.get("COMANDOS_MAX_INSTALLS"):
+        return max(1, int(os.environ["COMANDOS_MAX_INSTALLS"]))
+    # Sin calibración (comandos calibrate), uno por núcleo
+    wanted = calibrated_installs() or os.cpu_count() or 1
+    memory = available_memory()
+    by_memory = memory // INSTALL_MEMORY if memory else wanted
+    return max(1, min(wanted, by_memory))
+
+
+@contextmanager
+def installer_slot():
+    """Ocupa una de las plazas de instalación de la máquina.
+
+    Las plazas son archivos de bloqueo en la caché compartida: cada proceso
+    toma el primero libre y, si no hay ninguno, espera a que se libere.
+    """
+    slots = max_parallel_installs()
+    directory = cache_dir("locks", "installer")
+    attempt = 0
+    while True:
+        for index in random.sample(range(slots), slots):
+            f = open(directory / f"{index}.lock", "a+b")
+            if _try_lock(f):
+                try:
+                    yield
+                finally:
+                    _unlock(f)
+                    f.close()
+                return
+            f.close()
+        _backoff(attempt)
+        attempt += 1
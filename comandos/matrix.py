@@ -0,0 +1,244 @@
+"""Entornos para varias versiones de Python a la vez.
+
+Cada versión tiene su propio entorno (.venv-3.12, .venv-3.13...) junto al
+.venv principal. Se construyen en paralelo, limitados por las plazas de
+instalación de la máquina, y todos comparten la caché de UV o de pip, así que
+los paquetes puros se descargan una sola vez. run_matrix.py ejecuta luego los
+tests en todos los entornos a la vez.
+"""
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from comandos import resources
+from comandos.locking import installer_slot
+from comandos.startup import venv_python
+
+DEFAULT_VERSIONS = ["3.11", "3.12", "3.13"]
+
+# run_matrix.py necesita pytest en cada entorno
+MATRIX_DEV_DEPENDENCIES = ["pytest"]
+
+RUNNER_SCRIPT = '''"""Ejecuta los tests en todos los entornos .venv-X.Y del proyecto en paralelo.
+
+Uso:
+    python run_matrix.py                      # python -m pytest en cada entorno
+    python run_matrix.py -v 3.12 3.13         # solo algunas versiones
+    python run_matrix.py -- -x -q tests/      # argumentos para pytest
+
+La salida de cada versión se guarda en .matrix/<versión>.log.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+LOG_DIR = ROOT / ".matrix"
+
+# pytest devuelve 5 cuando no encuentra tests
+NO_TESTS = 5
+
+
+def version_key(version):
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def environments(versions):
+    """{versión: intérprete} de cada .venv-X.Y que exista."""
+    found = {}
+    for env in ROOT.glob(".venv-*"):
+        version = env.name.removeprefix(".venv-")
+        if sys.platform == "win32":
+            python = env / "Scripts" / "python.exe"
+        else:
+            python = env / "bin" / "python"
+        if python.exists() and (not versions or version in versions):
+            found[version] = python
+    return dict(sorted(found.items(), key=lambda item: version_key(item[0])))
+
+
+def run_tests(version, python, args):
+    log = LOG_DIR / f"{version}.log"
+    start = time.perf_counter()
+    with open(log, "w", encoding="utf-8") as f:
+        code = subprocess.run(
+            [str(python), "-m", "pytest", *args], cwd=ROOT, stdout=f, stderr=subprocess.STDOUT
+        ).returncode
+    return version, code, time.perf_counter() - start, log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ejecuta los tests en todas las versiones de Python")
+    parser.add_argument("-v", "--versiones", nargs="*", help="versiones a probar (por defecto, todas)")
+    parser.add_argument("pytest_args", nargs="*", help="argumentos para pytest (después de --)")
+    args = parser.parse_args()
+
+    envs = environments(args.versiones)
+    if not envs:
+        print("No hay entornos .venv-X.Y en el proyecto")
+        return 1
+    LOG_DIR.mkdir(exist_ok=True)
+
+    print(f"Ejecutando pytest en {', '.join(envs)}...")
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=len(envs)) as executor:
+        futures = [executor.submit(run_tests, version, python, args.pytest_args) for version, python in envs.items()]
+        for future in as_completed(futures):
+            version, code, elapsed, log = future.result()
+            status = "ok" if code == 0 else "sin tests" if code == NO_TESTS else f"falló ({code})"
+            print(f"  {version:<8} {status:<12} {elapsed:6.1f} s   {log.relative_to(ROOT)}")
+            results.append(code)
+
+    print(f"Matriz completa en {time.perf_counter() - start:.1f} s")
+    return 0 if all(code in (0, NO_TESTS) for code in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+
+def version_key(version):
+    """Clave para ordenar versiones numéricamente (3.9 antes que 3.10)."""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def parse_versions(text):
+    """Versiones válidas y sin repetir de un texto como '3.11 3.12, 3.13'."""
+    versions = []
+    for version in re.split(r"[\s,]+", text.strip()):
+        if re.fullmatch(r"3\.\d+", version) and version not in versions:
+            versions.append(version)
+    return sorted(versions, key=version_key)
+
+
+def env_path(project_path, version):
+    return project_path / f".venv-{version}"
+
+
+def find_interpreter(version):
+    """Comando para lanzar Python `version` (py -X.Y en Windows), o None."""
+    if sys.platform == "win32":
+        return ["py", f"-{version}"] if shutil.which("py") else None
+    python = shutil.which(f"python{version}")
+    return [python] if python else None
+
+
+def relax_requires_python(project_path, versions):
+    """Baja requires-python de pyproject.toml si excluye la versión más antigua pedida.
+
+    uv init fija la versión con la que se creó el proyecto (">=3.13"), lo que
+    impediría resolver el lock para 3.11 o 3.12.
+    """
+    pyproject = project_path / "pyproject.toml"
+    content = pyproject.read_text(encoding="utf-8")
+    match = re.search(r'^requires-python = ">=\s*([\d.]+)"$', content, flags=re.M)
+    if match and version_key(match.group(1))[:2] > version_key(versions[0]):
+        start, end = match.span(1)
+        pyproject.write_text(content[:start] + versions[0] + content[end:], encoding="utf-8")
+
+
+def _step(results, name, command, **kwargs):
+    """Ejecuta un paso de la versión y guarda su duración; devuelve el resultado."""
+    try:
+        result = resources.run(command, capture_output=True, text=True, **kwargs)
+    except FileNotFoundError as e:
+        results["error"] = str(e)
+        return None
+    results[name] = result.resources["wall"]
+    if result.returncode != 0:
+        lines = [line.strip() for line in (result.stderr or result.stdout).splitlines() if line.strip()]
+        results["error"] = lines[-1] if lines else f"código {result.returncode}"
+        return None
+    return result
+
+
+def build_uv(project_path, version):
+    """uv sync contra el lock ya resuelto, en .venv-X.Y."""
+    results = {"version": version}
+    env = dict(os.environ, UV_PROJECT_ENVIRONMENT=str(env_path(project_path, version)))
+    with installer_slot():
+        _step(
+            results, "install", ["uv", "sync", "--locked", "--python", version],
+            cwd=project_path, env=env, step=f"uv sync {version}",
+        )
+    return results
+
+
+def build_pip(project_path, version):
+    """venv con el intérprete de la versión y pip install de los requirements."""
+    results = {"version": version}
+    interpreter = find_interpreter(version)
+    if interpreter is None:
+        results["error"] = f"no se encontró python{version}"
+        return results
+    venv_path = env_path(project_path, version)
+    with installer_slot():
+        if not _step(
+            results, "create", [*interpreter, "-m", "venv", str(venv_path)],
+            cwd=project_path, step=f"venv {version}",
+        ):
+            return results
+    requirements = []
+    for name in ("requirements.txt", "requirements-dev.txt"):
+        if (project_path / name).exists():
+            requirements += ["-r", name]
+    if requirements:
+        # Sin --no-cache-dir: todas las versiones comparten la caché de pip
+        with installer_slot():
+            _step(
+                results, "install", [str(venv_python(venv_path)), "-m", "pip", "install", *requirements],
+                cwd=project_path, step=f"pip install {version}",
+            )
+    return results
+
+
+def build_matrix(project_path, backend, versions):
+    """Construye en paralelo los entornos de todas las versiones.
+
+    Devuelve una lista de resultados ({version, create, install, wall, error})
+    en el orden de `versions`.
+    """
+    build = build_uv if backend == "uv" else build_pip
+
+    def timed(version):
+        start = time.perf_counter()
+        results = build(project_path, version)
+        results["wall"] = time.perf_counter() - start
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(versions)) as executor:
+        return list(executor.map(timed, versions))
+
+
+def matrix_table(results):
+    """Tabla de Rich con el tiempo de cada versión de la matriz."""
+    from rich.table import Table
+
+    def seconds(value):
+        return f"{value:.1f} s" if value is not None else "-"
+
+    table = Table(title="Matriz de versiones", title_style="bold")
+    table.add_column("Python", style="cyan")
+    table.add_column("Estado")
+    # Tiempo esperando una plaza de instalación libre
+    table.add_column("Espera", justify="right")
+    table.add_column("Crear entorno", justify="right")
+    table.add_column("Instalar", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Detalle", style="dim")
+    for result in results:
+        status = "[red]✗[/red]" if result.get("error") else "[green]✓[/green]"
+        waited = result["wall"] - result.get("create", 0) - result.get("install", 0)
+        table.add_row(
+            f".venv-{result['version']}", status, seconds(waited), seconds(result.get("create")),
+            seconds(result.get("install")), seconds(result["wall"]), result.get("error", ""),
+        )
+    return table
@@ -0,0 +1,253 @@
+"""Índice local de nombres de paquetes para el prompt de dependencias.
+
+Se construye sin red con lo que ya hay en la máquina: la caché de UV, las
+ruedas de la caché de pip, el wheelhouse de comandos y los paquetes
+instalados, más una lista corta de paquetes muy populares para detectar
+errores de tecleo sobre ellos (el terreno de los typosquats) aunque nunca se
+hayan descargado. Se guarda como una lista ordenada de nombres normalizados,
+uno por línea, y se reconstruye como mucho una vez al día.
+
+- complete(): nombres que empiezan por un prefijo, con búsqueda binaria.
+- suggest(): alias conocidos (sklearn → scikit-learn) o el nombre más
+  cercano por distancia de edición con transposiciones (reqeusts → requests).
+
+Todo ocurre antes de lanzar pip o UV: una errata se corrige al momento en
+lugar de fallar tras resolver, o de instalar otro paquete.
+"""
+import bisect
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from importlib import metadata
+from pathlib import Path
+
+from comandos.cache import cache_dir
+
+INDEX_FILE = "paquetes.txt"
+
+# El índice se reconstruye si es más antiguo
+INDEX_MAX_AGE = 24 * 60 * 60
+
+# Paquetes muy descargados: los typosquats imitan sobre todo a estos
+POPULAR = [
+    "aiohttp", "alembic", "altair", "anthropic", "attrs", "beautifulsoup4", "black", "bokeh", "boto3",
+    "botocore", "celery", "certifi", "charset-normalizer", "click", "colorama", "coverage", "cryptography",
+    "dash", "dask", "django", "docker", "fastapi", "flask", "grpcio", "gunicorn", "httpx", "idna", "ipython",
+    "jinja2", "jupyter", "keras", "kubernetes", "langchain", "lightgbm", "loguru", "lxml", "markupsafe",
+    "marshmallow", "matplotlib", "mypy", "networkx", "nltk", "notebook", "numpy", "openai", "opencv-python",
+    "openpyxl", "orjson", "packaging", "pandas", "paramiko", "pillow", "plotly", "polars", "pre-commit",
+    "protobuf", "psycopg2", "psycopg2-binary", "pyarrow", "pydantic", "pyinstrument", "pyjwt", "pymongo",
+    "pymysql", "pytest", "pytest-benchmark", "python-dateutil", "python-dotenv", "pytz", "pyyaml", "redis",
+    "requests", "rich", "ruff", "scikit-image", "scikit-learn", "scipy", "scrapy", "seaborn", "selenium",
+    "setuptools", "six", "spacy", "sphinx", "sqlalchemy", "statsmodels", "streamlit", "sympy", "tenacity",
+    "tensorflow", "toml", "tomli", "torch", "tox", "tqdm", "transformers", "typer", "ujson", "urllib3",
+    "uvicorn", "websockets", "wheel", "xgboost", "xlrd",
+]
+
+# Nombres de import que no coinciden con el del paquete
+ALIASES = {
+    "attr": "attrs",
+    "bs4": "beautifulsoup4",
+    "cv2": "opencv-python",
+    "dateutil": "python-dateutil",
+    "docx": "python-docx",
+    "dotenv": "python-dotenv",
+    "fitz": "pymupdf",
+    "jwt": "pyjwt",
+    "pil": "pillow",
+    "pptx": "python-pptx",
+    "serial": "pyserial",
+    "skimage": "scikit-image",
+    "sklearn": "scikit-learn",
+    "yaml": "pyyaml",
+}
+
+REQUIREMENT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def normalize(name):
+    """Nombre normalizado según PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _platform_cache(tool):
+    """Caché por defecto de pip o UV en esta plataforma."""
+    if sys.platform == "win32":
+        local_app_data = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return local_app_data / tool / "Cache" if tool == "pip" else local_app_data / tool / "cache"
+    if sys.platform == "darwin" and tool == "pip":
+        return Path.home() / "Library" / "Caches" / "pip"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / tool
+
+
+def _uv_names():
+    root = Path(os.environ.get("UV_CACHE_DIR") or _platform_cache("uv"))
+    # Metadatos de los índices (simple-vN/<índice>/<paquete>.rkyv) y ruedas descomprimidas
+    for path in root.glob("simple-v*/*/*.rkyv"):
+        yield path.stem
+    for path in root.glob("wheels-v*/pypi/*"):
+        yield path.name
+
+
+def _wheel_names(root):
+    for path in root.rglob("*.whl"):
+        yield path.name.split("-")[0]
+
+
+def _installed_names():
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            yield name
+
+
+def build_index():
+    """Reúne los nombres de todas las fuentes y guarda el índice."""
+    names = set(POPULAR) | set(ALIASES.values())
+    pip_cache = Path(os.environ.get("PIP_CACHE_DIR") or _platform_cache("pip"))
+    for source in (_uv_names(), _wheel_names(pip_cache / "wheels"), _wheel_names(cache_dir("wheelhouse")), _installed_names()):
+        names.update(normalize(name) for name in source)
+    index = sorted(names)
+    path = cache_dir("indice") / INDEX_FILE
+    # Se escribe aparte y se renombra: otro proceso nunca lee un índice a medias
+    temporary = path.with_name(f"{path.name}.{os.getpid()}")
+    temporary.write_text("\n".join(index) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+    return index
+
+
+def load_index():
+    """Lista ordenada de nombres, reconstruyéndola si caducó."""
+    path = cache_dir("indice") / INDEX_FILE
+    try:
+        if time.time() - path.stat().st_mtime < INDEX_MAX_AGE:
+            return path.read_text(encoding="utf-8").split()
+    except FileNotFoundError:
+        pass
+    return build_index()
+
+
+def contains(index, name):
+    position = bisect.bisect_left(index, name)
+    return position < len(index) and index[position] == name
+
+
+def complete(index, prefix, limit=50):
+    """Nombres del índice que empiezan por `prefix`."""
+    prefix = normalize(prefix)
+    start = bisect.bisect_left(index, prefix)
+    matches = []
+    for name in index[start:start + limit]:
+        if not name.startswith(prefix):
+            break
+        matches.append(name)
+    return matches
+
+
+def distance(a, b, limit):
+    """Distancia de edición con transposiciones, o limit + 1 si la supera."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        # Ninguna fila puede bajar de su mínimo: se corta en cuanto lo supera
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def suggest(index, name):
+    """Nombre que probablemente se quería escribir, o None si `name` parece bien."""
+    name = normalize(name)
+    if name in ALIASES:
+        return ALIASES[name]
+    if contains(index, name):
+        return None
+    # En nombres cortos una sola letra ya cambia de paquete
+    limit = 1 if len(name) <= 4 else 2
+    popular = set(POPULAR)
+    best = None
+    for candidate in index:
+        d = distance(name, candidate, limit)
+        if d <= limit:
+            key = (d, candidate not in popular, candidate)
+            if best is None or key < best:
+                best = key
+    return best[2] if best else None
+
+
+def split_requirement(spec):
+    """Separa 'paquete[extra]>=1.0' en ('paquete', '[extra]>=1.0').
+
+    Devuelve (None, spec) para rutas y URLs, que no se revisan.
+    """
+    match = REQUIREMENT_NAME.match(spec)
+    if not match or "/" in spec or "\\" in spec or ":" in spec:
+        return None, spec
+    return match.group(0), spec[match.end():]
+
+
+@contextmanager
+def completion(index):
+    """Completa nombres de paquete con Tab mientras dura el bloque with.
+
+    Usa readline; donde no está disponible (Windows sin pyreadline3) el
+    bloque se ejecuta igual, sin autocompletado.
+    """
+    try:
+        import readline
+    except ImportError:
+        yield
+        return
+
+    def complete_word(text, state):
+        matches = complete(index, text)
+        return matches[state] if state < len(matches) else None
+
+    previous_completer = readline.get_completer()
+    previous_delims = readline.get_completer_delims()
+    readline.set_completer(complete_word)
+    # Los guiones forman parte del nombre: solo el espacio separa paquetes
+    readline.set_completer_delims(" ")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    try:
+        yield
+    finally:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
+
+
+def review_packages(packages, index, console):
+    """Revisa los paquetes pedidos y ofrece corregir las erratas.
+
+    Devuelve la lista, con las correcciones aceptadas.
+    """
+    from rich.prompt import Confirm
+
+    reviewed = []
+    for spec in packages:
+        name, rest = split_requirement(spec)
+        suggestion = suggest(index, name) if name else None
+        if not suggestion:
+            reviewed.append(spec)
+            continue
+        if normalize(name) in ALIASES:
+            reason = f"'{name}' es el nombre con el que se importa, no el del paquete"
+        else:
+            reason = f"'{name}' no está en el índice local"
+        if Confirm.ask(f"[yellow]⚠️[/yellow] {reason}. ¿Quisiste decir [cyan]{suggestion}[/cyan]?", default=True):
+            spec = suggestion + rest
+        reviewed.append(spec)
+    return reviewed
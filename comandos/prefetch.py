@@ -0,0 +1,106 @@
+"""Descarga anticipada y concurrente de dependencias a la caché del instalador."""
+import platform
+import re
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from comandos.background import run_quiet
+from comandos.cache import cache_dir
+from comandos.locking import installer_slot, single_flight
+from comandos.tuning import calibrated_installs
+
+
+def interpreter_tag():
+    """Etiqueta del intérprete actual y la plataforma (cpython-311-linux-x86_64)."""
+    return f"{sys.implementation.cache_tag}-{sys.platform}-{platform.machine().lower()}"
+
+
+def wheelhouse_dir():
+    """Directorio de ruedas descargadas para el intérprete actual."""
+    return cache_dir("wheelhouse", interpreter_tag())
+
+
+def _entry_name(text):
+    """Nombre de entrada de caché seguro para un paquete o un intérprete."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", text).strip(".").lower() or "_"
+
+
+class Prefetcher:
+    """Descarga cada paquete (y sus dependencias) en cuanto se conoce su nombre.
+
+    Con pip las ruedas se guardan en un wheelhouse por paquete, de modo que la
+    instalación posterior puede hacerse con --no-index sin tocar la red.
+
+    UV no tiene una orden que solo descargue: se hace una instalación completa
+    (resolución, descarga y desempaquetado en su caché) en un directorio
+    temporal que luego se borra. Es casi lo mismo que costaría la instalación
+    real, pero ocurre mientras se responden las preguntas, y después
+    uv add/uv sync solo enlazan desde la caché. La instalación temporal usa
+    enlaces simbólicos a la caché para no copiar los archivos una vez más.
+
+    Cada descarga es una entrada de caché compartida entre procesos: si otro
+    generador ya la está preparando se espera a que termine en lugar de
+    repetirla, y las descargas ocupan plazas de instalación de la máquina.
+    """
+
+    def __init__(self, backend, python=None, max_workers=None):
+        self.backend = backend
+        self.python = python
+        # Cada descarga ocupa una plaza de instalación: más hilos que plazas solo esperarían
+        max_workers = max_workers or calibrated_installs() or 8
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._futures = {}
+
+    def start(self, packages):
+        """Lanza la descarga de los paquetes que aún no se están descargando."""
+        for pkg in packages:
+            if pkg not in self._futures:
+                self._futures[pkg] = self._executor.submit(self._download, pkg)
+
+    def wait(self, pkg):
+        """Espera la descarga de un paquete; devuelve True si terminó bien."""
+        future = self._futures.get(pkg)
+        return future is not None and future.result() is not None
+
+    def local_install_args(self, packages):
+        """Argumentos de pip para instalar los paquetes solo desde lo descargado.
+
+        Devuelve una lista vacía si alguno no se pudo descargar.
+        """
+        if self.backend != "pip" or not all(self.wait(pkg) for pkg in packages):
+            return []
+        args = ["--no-index"]
+        for pkg in packages:
+            args += ["--find-links", str(self._futures[pkg].result())]
+        return args
+
+    def shutdown(self):
+        """Espera a que terminen las descargas pendientes."""
+        self._executor.shutdown(wait=True)
+
+    def _download(self, pkg):
+        name = _entry_name(pkg)
+        if self.backend == "pip":
+            # Un directorio por paquete evita que dos descargas escriban el mismo archivo
+            entry = wheelhouse_dir() / name
+            build = self._pip_download
+        else:
+            # python puede ser una versión (3.12) o la ruta de un intérprete
+            entry = cache_dir("uv-warm", _entry_name(self.python or "default")) / name
+            build = self._uv_warm
+        return entry if single_flight(entry, lambda path: build(path, pkg)) else None
+
+    def _pip_download(self, dest, pkg):
+        with installer_slot():
+            ok, _ = run_quiet([sys.executable, "-m", "pip", "download", "--quiet", "--dest", str(dest), pkg])
+        return ok
+
+    def _uv_warm(self, entry, pkg):
+        # Lo que queda en la caché es lo que importa: el destino solo se enlaza y se borra
+        with installer_slot(), tempfile.TemporaryDirectory(dir=cache_dir("tmp")) as target:
+            command = ["uv", "pip", "install", "--quiet", "--link-mode", "symlink", "--target", target, pkg]
+            if self.python:
+                command += ["--python", self.python]
+            ok, _ = run_quiet(command)
+        return ok
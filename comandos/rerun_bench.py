@@ -0,0 +1,265 @@
+"""Benchmark de latencia de reruns para los proyectos Streamlit generados."""
+from comandos.benchmarking import SCRIPT_COMMANDS
+
+RERUN_BENCH_PATH = "benchmarks/bench_reruns.py"
+
+# Botones que el benchmark no pulsa en cada plantilla: tienen efectos fuera de la sesión
+IGNORED_LABELS = {
+    "datos": ["Generar datos de ejemplo"],
+}
+
+RERUN_BENCH = '''"""Benchmark de reruns de la app con la API de pruebas de Streamlit (AppTest).
+
+Simula varias sesiones que cambian widgets al azar, como haría un usuario, y
+mide la latencia de cada rerun (p50 y p95) y cuánto crece la memoria a lo
+largo de la prueba. La semilla es fija: cada ejecución repite la misma
+secuencia de interacciones.
+
+Uso:
+    {script} benchmarks/bench_reruns.py                  # compara con la línea base
+    {script} benchmarks/bench_reruns.py --guardar-base   # guarda la línea base
+    {script} benchmarks/bench_reruns.py --script pages/otra.py
+
+La línea base se guarda en benchmarks/reruns_base.json: versiónala para
+comparar siempre con la misma, medida en la misma máquina. Sale con código 1
+si el p95 o el crecimiento de memoria empeoran más de lo tolerado, o si la
+app lanza una excepción.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / "reruns_base.json"
+
+# Widgets que no se tocan, por etiqueta: acciones con efectos fuera de la sesión
+IGNORED_LABELS = {ignored}
+
+KINDS = [
+    "button", "checkbox", "toggle", "radio", "selectbox", "multiselect", "select_slider",
+    "slider", "number_input", "text_input", "text_area", "color_picker",
+]
+
+WORDS = ["hola", "streamlit", "rendimiento", "datos", ""]
+
+# Crecimiento de memoria que se tolera siempre (ruido del recolector y del intérprete)
+MEMORY_SLACK = 1024 * 1024
+
+# Parámetros que tienen que coincidir para comparar con la línea base
+COMPARABLE = ["script", "sessions", "iterations", "warmup", "seed"]
+
+
+class AppError(Exception):
+    """La app lanzó una excepción durante un rerun."""
+
+
+def _choosable(widget):
+    # Las opciones se eligen por su texto: solo si se muestran sin format_func propio
+    values = widget.value if isinstance(widget.value, (list, tuple)) else [widget.value]
+    return bool(widget.options) and all(value is None or str(value) in widget.options for value in values)
+
+
+def _numeric(widget):
+    values = widget.value if isinstance(widget.value, tuple) else [widget.value]
+    return all(isinstance(value, (int, float)) for value in values)
+
+
+def _operable(kind, widget):
+    if getattr(widget, "disabled", False) or widget.label in IGNORED_LABELS:
+        return False
+    if kind in ("radio", "selectbox", "multiselect", "select_slider"):
+        return _choosable(widget)
+    if kind == "slider":
+        return _numeric(widget)
+    return True
+
+
+def _nudge(widget, value, rng):
+    """Valor a uno o dos pasos de `value`, dentro de los límites del widget."""
+    step = widget.step or 1
+    moved = (value if value is not None else widget.min or 0) + rng.choice([-2, -1, 1, 2]) * step
+    if widget.min is not None:
+        moved = max(moved, widget.min)
+    if widget.max is not None:
+        moved = min(moved, widget.max)
+    return type(value)(moved) if isinstance(value, int) else moved
+
+
+def interact(at, rng):
+    """Cambia un widget elegido al azar; devuelve False si la app no tiene ninguno."""
+    candidates = [(kind, widget) for kind in KINDS for widget in getattr(at, kind) if _operable(kind, widget)]
+    if not candidates:
+        return False
+    kind, widget = rng.choice(candidates)
+    if kind == "button":
+        widget.click()
+    elif kind in ("checkbox", "toggle"):
+        widget.set_value(not widget.value)
+    elif kind in ("radio", "selectbox", "select_slider"):
+        widget.set_value(rng.choice(widget.options))
+    elif kind == "multiselect":
+        widget.set_value(rng.sample(widget.options, rng.randint(0, min(3, len(widget.options)))))
+    elif kind == "slider" and isinstance(widget.value, tuple):
+        low, high = sorted(_nudge(widget, value, rng) for value in widget.value)
+        widget.set_range(low, high)
+    elif kind in ("slider", "number_input"):
+        # Pasos pequeños desde el valor actual, como quien arrastra o pulsa +/-
+        widget.set_value(_nudge(widget, widget.value, rng))
+    elif kind in ("text_input", "text_area"):
+        widget.input(rng.choice(WORDS))
+    else:
+        widget.pick(f"#{{rng.randrange(0x1000000):06x}}")
+    return True
+
+
+def rerun(at, timeout):
+    """Ejecuta un rerun y devuelve su duración en segundos."""
+    start = time.perf_counter()
+    at.run(timeout=timeout)
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise AppError(at.exception[0].message)
+    return elapsed
+
+
+def simulate(args, trace_memory=False):
+    """Ejecuta la prueba completa; devuelve (latencias en ms, crecimiento de memoria)."""
+    # Cada pasada empieza con las cachés vacías: las comparten todas las sesiones
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    rng = random.Random(args.semilla)
+    script = str(ROOT / args.script)
+    sessions = [AppTest.from_file(script, default_timeout=args.timeout) for _ in range(args.sesiones)]
+    # Primera ejecución de cada sesión y calentamiento: no se miden
+    for at in sessions:
+        rerun(at, args.timeout)
+    for _ in range(args.calentamiento):
+        for at in sessions:
+            interact(at, rng)
+            rerun(at, args.timeout)
+    gc.collect()
+    start_memory = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+
+    latencies = []
+    for iteration in range(args.iteraciones):
+        # Las sesiones se turnan, como usuarios que interactúan a la vez
+        at = sessions[iteration % len(sessions)]
+        interact(at, rng)
+        latencies.append(rerun(at, args.timeout) * 1000)
+
+    growth = 0
+    if trace_memory:
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - start_memory
+        tracemalloc.stop()
+    return latencies, growth
+
+
+def percentile(values, percent):
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def compare(result, baseline, tolerance):
+    """Mensajes de regresión frente a la línea base (lista vacía si no hay)."""
+    failed = []
+    if result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+        failed.append(f"p95 {{result['p95_ms']:.1f}} ms frente a {{baseline['p95_ms']:.1f}} ms en la línea base")
+    if result["memory_growth"] is None or baseline["memory_growth"] is None:
+        return failed
+    if result["memory_growth"] > max(baseline["memory_growth"], 0) * (1 + tolerance) + MEMORY_SLACK:
+        failed.append(
+            f"la memoria crece {{result['memory_growth'] / 1024:,.0f}} KB "
+            f"frente a {{baseline['memory_growth'] / 1024:,.0f}} KB en la línea base"
+        )
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latencia de reruns de la app")
+    parser.add_argument("--script", default="app.py", help="script de la app, relativo al proyecto")
+    parser.add_argument("--sesiones", type=int, default=4, help="sesiones simuladas a la vez")
+    parser.add_argument("--iteraciones", type=int, default=100, help="reruns medidos en total")
+    parser.add_argument("--calentamiento", type=int, default=3, help="reruns sin medir por sesión")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30, help="segundos máximos por rerun")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="empeoramiento admitido (0.2 = 20 %%)")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir el crecimiento de memoria")
+    parser.add_argument("--guardar-base", action="store_true", help="guardar el resultado como línea base")
+    args = parser.parse_args()
+
+    # La app lee .streamlit/ e importa sus módulos desde la raíz del proyecto
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    try:
+        # Tiempo y memoria en pasadas separadas: tracemalloc ralentiza cada asignación
+        latencies, _ = simulate(args)
+        growth = None if args.sin_memoria else simulate(args, trace_memory=True)[1]
+    except AppError as e:
+        print(f"✗ La app lanzó una excepción: {{e}}")
+        return 1
+    if len(latencies) < 2:
+        print("✗ Hacen falta al menos 2 iteraciones")
+        return 1
+
+    result = {{
+        "script": args.script, "sessions": args.sesiones, "iterations": args.iteraciones,
+        "warmup": args.calentamiento, "seed": args.semilla,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "memory_growth": growth,
+        "python": platform.python_version(), "streamlit": st.__version__,
+    }}
+    print(f"Reruns medidos: {{args.iteraciones}} en {{args.sesiones}} sesiones ({{args.script}})")
+    print(f"p50:     {{result['p50_ms']:8.1f}} ms")
+    print(f"p95:     {{result['p95_ms']:8.1f}} ms")
+    print(f"media:   {{result['mean_ms']:8.1f}} ms")
+    if growth is not None:
+        print(f"memoria: {{growth / 1024:+8,.0f}} KB durante la prueba")
+
+    if args.guardar_base:
+        BASELINE.write_text(json.dumps(result, indent=2) + "\\n", encoding="utf-8")
+        print(f"✓ Línea base guardada en {{BASELINE.relative_to(ROOT)}}")
+        return 0
+    if not BASELINE.exists():
+        print("Sin línea base: guárdala con --guardar-base para detectar regresiones")
+        return 0
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8"))
+    if any(baseline.get(key) != result[key] for key in COMPARABLE):
+        print("⚠️  La línea base se midió con otros parámetros: no se compara")
+        return 0
+    failed = compare(result, baseline, args.tolerancia)
+    for message in failed:
+        print(f"✗ {{message}}")
+    if failed:
+        return 1
+    print(f"✓ Sin regresiones frente a la línea base (p95 {{baseline['p95_ms']:.1f}} ms, tolerancia {{args.tolerancia:.0%}})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+
+def render_rerun_bench(template, backend):
+    """Archivos del benchmark de reruns para la plantilla y el backend dados."""
+    content = RERUN_BENCH.format(
+        script=SCRIPT_COMMANDS[backend],
+        ignored=repr(IGNORED_LABELS.get(template, [])),
+    )
+    return {RERUN_BENCH_PATH: content}
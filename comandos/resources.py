@@ -0,0 +1,233 @@
+"""Consumo de recursos de cada comando externo (CPU, memoria y disco).
+
+`run` sustituye a subprocess.run y anota, para cada proceso hijo y los
+procesos que este lance, el tiempo de CPU de usuario y de sistema, la
+memoria residente máxima y los bytes leídos y escritos en disco. Con
+COMANDOS_RESOURCES=1 se muestra una tabla por paso al terminar y con
+COMANDOS_RESOURCES_JSON=<ruta> se guardan las mismas mediciones en JSON.
+"""
+import atexit
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+_records = []
+_lock = threading.Lock()
+
+
+def records():
+    """Copia de las mediciones tomadas hasta ahora."""
+    with _lock:
+        return list(_records)
+
+
+def step_name(command):
+    """Nombre corto del paso a partir del comando."""
+    if isinstance(command, str):
+        return command.split()[0] if command.strip() else command
+    program = Path(str(command[0])).name
+    return " ".join([program, *(str(arg) for arg in command[1:3])])
+
+
+def _drain(process):
+    """Lee stdout y stderr a la vez para que ninguna tubería se llene."""
+    outputs = {}
+
+    def read(name, stream):
+        outputs[name] = stream.read()
+        stream.close()
+
+    threads = [
+        threading.Thread(target=read, args=(name, stream), daemon=True)
+        for name, stream in (("stdout", process.stdout), ("stderr", process.stderr))
+        if stream is not None
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outputs.get("stdout"), outputs.get("stderr")
+
+
+def _proc_io(pid):
+    """Bytes de disco de /proc/<pid>/io (Linux), que incluyen a sus descendientes."""
+    try:
+        fields = dict(
+            line.split(": ", 1)
+            for line in Path(f"/proc/{pid}/io").read_text().splitlines()
+        )
+        return int(fields["read_bytes"]), int(fields["write_bytes"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _wait(process):
+    """Espera al proceso y devuelve su rusage y sus bytes de disco.
+
+    En Linux se espera primero sin recogerlo (WNOWAIT) para poder leer
+    /proc/<pid>/io del proceso ya terminado; después wait4 lo recoge y
+    devuelve el consumo acumulado de todo el árbol de procesos.
+    """
+    disk_io = None
+    if hasattr(os, "waitid") and sys.platform.startswith("linux"):
+        os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+        disk_io = _proc_io(process.pid)
+    if not hasattr(os, "wait4"):
+        process.wait()
+        return None, disk_io
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if disk_io is None:
+        # Sin /proc solo hay bloques de 512 bytes contados por el kernel
+        disk_io = (usage.ru_inblock * 512, usage.ru_oublock * 512)
+    return usage, disk_io
+
+
+def _exited(process):
+    """Si el proceso ya terminó, aunque wait4 aún no lo haya recogido."""
+    if process.returncode is not None:
+        return True
+    if sys.platform == "win32":
+        return process.poll() is not None
+    try:
+        # WNOWAIT: solo se consulta, wait4 lo recoge después con su consumo
+        return os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None
+    except ChildProcessError:
+        return True
+
+
+def _kill(process, killed):
+    """Mata el proceso al vencer el plazo, con todo su grupo si tiene uno propio.
+
+    `killed` solo se marca si el proceso seguía vivo y se le mandó la señal:
+    uno que termina justo en el plazo no es un timeout.
+    """
+    alive = not _exited(process)
+    try:
+        if sys.platform == "win32":
+            if alive:
+                process.kill()
+        else:
+            # Popen.kill consultaría el estado del hijo y lo recogería antes que wait4.
+            # Aunque ya haya terminado se mata al resto del grupo: sus hijos mantendrían abiertas las tuberías
+            os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        return
+    if alive:
+        killed.set()
+
+
+def run(command, *, check=False, capture_output=False, timeout=None, step=None, **kwargs):
+    """Como subprocess.run, pero anota el consumo de recursos del comando.
+
+    El resultado lleva la medición en el atributo `resources`. Con timeout
+    el comando corre en su propio grupo de procesos para poder matar también
+    a los que lance (por ejemplo, con shell=True).
+    """
+    if capture_output:
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+    if timeout is not None and sys.platform != "win32":
+        kwargs["start_new_session"] = True
+    killed = threading.Event()
+    start = time.perf_counter()
+    with subprocess.Popen(command, **kwargs) as process:
+        timer = threading.Timer(timeout, _kill, (process, killed)) if timeout is not None else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+        try:
+            stdout, stderr = _drain(process)
+            usage, disk_io = _wait(process)
+        finally:
+            if timer:
+                timer.cancel()
+    wall = time.perf_counter() - start
+
+    record = {
+        "step": step or step_name(command),
+        "command": command if isinstance(command, str) else [str(arg) for arg in command],
+        "returncode": process.returncode,
+        "wall": wall,
+        "user": usage.ru_utime if usage else None,
+        "sys": usage.ru_stime if usage else None,
+        # ru_maxrss está en KB en Linux y en bytes en macOS
+        "max_rss": (usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024) if usage else None,
+        "read_bytes": disk_io[0] if disk_io else None,
+        "write_bytes": disk_io[1] if disk_io else None,
+    }
+    with _lock:
+        _records.append(record)
+
+    # Si terminó por su cuenta entre la comprobación y la señal, cuenta su propio código de salida
+    if killed.is_set() and (sys.platform == "win32" or process.returncode == -signal.SIGKILL):
+        raise subprocess.TimeoutExpired(command, timeout, stdout, stderr)
+    result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+    result.resources = record
+    if check:
+        result.check_returncode()
+    return result
+
+
+def format_bytes(value):
+    """Tamaño legible (KB, MB, GB)."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.1f} {unit}" if unit != "B" else f"{value:.0f} B"
+        value /= 1024
+
+
+def resources_table(steps):
+    """Tabla de Rich con el consumo de cada paso."""
+    from rich.table import Table
+
+    def cell(value, fmt):
+        return "-" if value is None else fmt(value)
+
+    table = Table(title="Recursos por paso", title_style="bold")
+    table.add_column("Paso", style="cyan", no_wrap=True)
+    table.add_column("Tiempo", justify="right")
+    table.add_column("CPU usuario", justify="right")
+    table.add_column("CPU sistema", justify="right")
+    # Poca CPU y poco disco durante mucho tiempo suele ser espera de red
+    table.add_column("CPU %", justify="right")
+    table.add_column("RSS máx.", justify="right")
+    table.add_column("Lectura", justify="right")
+    table.add_column("Escritura", justify="right")
+    for record in steps:
+        cpu = None if record["user"] is None else record["user"] + record["sys"]
+        table.add_row(
+            record["step"],
+            f"{record['wall']:.2f} s",
+            cell(record["user"], lambda v: f"{v:.2f} s"),
+            cell(record["sys"], lambda v: f"{v:.2f} s"),
+            cell(cpu, lambda v: f"{v / record['wall'] * 100:.0f} %" if record["wall"] else "-"),
+            cell(record["max_rss"], format_bytes),
+            cell(record["read_bytes"], format_bytes),
+            cell(record["write_bytes"], format_bytes),
+            style=None if record["returncode"] == 0 else "red",
+        )
+    return table
+
+
+def report(console):
+    """Muestra y/o guarda las mediciones según las variables de entorno."""
+    steps = records()
+    if not steps:
+        return
+    if os.environ.get("COMANDOS_RESOURCES"):
+        console.print(resources_table(steps))
+    json_path = os.environ.get("COMANDOS_RESOURCES_JSON")
+    if json_path:
+        Path(json_path).write_text(json.dumps(steps, indent=2), encoding="utf-8")
+        console.print(f"[dim]Recursos guardados en {json_path}[/dim]")
+
+
+def report_at_exit(console):
+    """Programa el informe para el final del proceso, también si se aborta."""
+    if os.environ.get("COMANDOS_RESOURCES") or os.environ.get("COMANDOS_RESOURCES_JSON"):
+        atexit.register(report, console)
@@ -0,0 +1,115 @@
+"""Comprobación del tiempo de arranque de `comandos`, pensada para CI.
+
+Mide la mediana de `comandos --help` y de la ayuda de cada generador frente
+a un `python -c pass` vacío, y revisa en sys.modules que cada comando
+importa solo lo suyo: la ayuda general no debe cargar Rich ni ningún
+generador, y cada generador no debe cargar los demás. Sale con código 1 si
+algo se pasa del presupuesto.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from comandos.cli import GENERATORS
+
+# Módulos que `comandos --help` no debe importar nunca
+HEAVY_PREFIXES = ("rich", "comandos.generators.")
+
+
+def _median_ms(command, repeats):
+    """Mediana del tiempo de pared de `command` en milisegundos."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+# Ejecuta la CLI en el mismo intérprete y lista sys.modules al salir.
+# -X importtime no sirve aquí: no registra lo cargado con importlib.import_module.
+MODULES_SCRIPT = """
+import sys
+from comandos.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stderr.write("\\n".join(["--modules--", *sys.modules]))
+"""
+
+
+def imported_modules(args):
+    """Módulos cargados tras `comandos <args>`."""
+    result = subprocess.run(
+        [sys.executable, "-c", MODULES_SCRIPT, *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return set(result.stderr.rpartition("--modules--")[2].split())
+
+
+def check_command(args, forbidden, repeats, baseline):
+    """Mide un comando y devuelve (ms, sobrecoste, módulos prohibidos cargados)."""
+    elapsed = _median_ms([sys.executable, "-m", "comandos", *args], repeats)
+    leaked = sorted(
+        name for name in imported_modules(args)
+        if any(name == prefix or name.startswith(prefix) for prefix in forbidden)
+    )
+    return elapsed, elapsed - baseline, leaked
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Comprueba el tiempo de arranque de la CLI")
+    parser.add_argument("--repeats", type=int, default=5, help="ejecuciones por comando (se usa la mediana)")
+    parser.add_argument(
+        "--max-ms", type=float, default=100.0,
+        help="sobrecoste máximo de `comandos --help` sobre un intérprete vacío, en ms",
+    )
+    parser.add_argument(
+        "--max-generator-ms", type=float, default=400.0,
+        help="sobrecoste máximo de la ayuda de un generador, en ms",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = _median_ms([sys.executable, "-c", "pass"], args.repeats)
+    checks = [(["--help"], HEAVY_PREFIXES, args.max_ms)]
+    for (kind, backend), module in GENERATORS.items():
+        others = tuple(other for other in GENERATORS.values() if other != module)
+        checks.append(([kind, backend, "--help"], others, args.max_generator_ms))
+
+    rows, failed = [], False
+    for command, forbidden, budget in checks:
+        elapsed, overhead, leaked = check_command(command, forbidden, args.repeats, baseline)
+        ok = overhead <= budget and not leaked
+        failed = failed or not ok
+        rows.append((" ".join(["comandos", *command]), elapsed, overhead, budget, ok, leaked))
+
+    # Rich solo hace falta para el informe
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Arranque (python -c pass: {baseline:.0f} ms)", title_style="bold")
+    table.add_column("Comando", style="cyan")
+    table.add_column("Mediana", justify="right")
+    table.add_column("Sobrecoste", justify="right")
+    table.add_column("Límite", justify="right")
+    table.add_column("Estado")
+    table.add_column("Imports de más", style="dim")
+    for command, elapsed, overhead, budget, ok, leaked in rows:
+        status = "[green]✓[/green]" if ok else "[red]✗[/red]"
+        table.add_row(
+            command, f"{elapsed:.0f} ms", f"{overhead:.0f} ms", f"{budget:.0f} ms", status, ", ".join(leaked),
+        )
+    console = Console()
+    console.print(table)
+    if failed:
+        console.print("[red]✗ El arranque se sale del presupuesto[/red]")
+        return 1
+    console.print("[green]✓ Arranque dentro del presupuesto[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,461 @@
+"""Instantáneas portables de un proyecto generado, con su entorno virtual.
+
+`create` empaqueta el proyecto (fuentes, lock y entornos .venv*) en un zip
+con un manifiesto de contenido (snapshot.json). `restore` lo desempaqueta en
+paralelo, cada hilo con su propio descriptor del zip, y recoloca el entorno:
+
+- Los archivos de texto del entorno que contienen la ruta original del
+  proyecto (scripts de activación, shebangs, .pth editables...) se anotan en
+  el manifiesto y se reescriben con la ruta nueva.
+- Si el intérprete base del entorno no existe en la máquina de destino se
+  busca uno de la misma versión y se actualizan pyvenv.cfg y los enlaces.
+- Se conservan enlaces simbólicos, permisos y fechas de modificación (así el
+  bytecode ya compilado sigue siendo válido).
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import stat
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Este script necesita 'rich' para funcionar correctamente.")
+    print("Instálalo con: pip install rich")
+    sys.exit(1)
+
+from comandos import resources
+from comandos.matrix import find_interpreter
+from comandos.resources import format_bytes
+from comandos.update import load_manifest
+
+console = Console()
+
+MANIFEST_NAME = "snapshot.json"
+FORMAT_VERSION = 1
+
+# Se regeneran solos: no vale la pena llevarlos en la instantánea
+EXCLUDED_DIRS = {".pytest_cache", ".mypy_cache", ".ruff_cache", ".matrix", ".profiles"}
+
+# Ya están comprimidos: deflate solo gastaría CPU
+STORED_SUFFIXES = {".whl", ".zip", ".gz", ".bz2", ".xz", ".zst", ".png", ".jpg", ".jpeg", ".parquet"}
+
+# Los archivos del entorno más grandes no se revisan en busca de rutas
+MAX_FIXUP_SIZE = 4 * 1024 * 1024
+
+CHUNK_SIZE = 1024 * 1024
+
+# Enlaces al intérprete en bin/ de un entorno virtual
+INTERPRETER_LINK = re.compile(r"python(3(\.\d+)?)?")
+
+
+def find_environments(project_path):
+    """Directorios de entornos virtuales del proyecto (los que tienen pyvenv.cfg)."""
+    return sorted(
+        child.name for child in project_path.iterdir()
+        if child.is_dir() and not child.is_symlink() and (child / "pyvenv.cfg").exists()
+    )
+
+
+def walk(project_path):
+    """Recorre el proyecto: devuelve (directorios, archivos, enlaces) relativos."""
+    directories, files, links = [], [], []
+    for root, dirnames, filenames in os.walk(project_path):
+        root_path = Path(root)
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+        for name in list(dirnames):
+            path = root_path / name
+            relative = path.relative_to(project_path).as_posix()
+            if path.is_symlink():
+                # os.walk no entra en enlaces a directorios: se guardan como enlace
+                links.append(relative)
+                dirnames.remove(name)
+            else:
+                directories.append(relative)
+        for name in filenames:
+            path = root_path / name
+            relative = path.relative_to(project_path).as_posix()
+            (links if path.is_symlink() else files).append(relative)
+    return directories, files, links
+
+
+def _write_member(archive, project_path, relative, in_env, root_bytes):
+    """Añade un archivo al zip; devuelve su entrada del manifiesto."""
+    path = project_path / relative
+    info = os.stat(path)
+    member = zipfile.ZipInfo.from_file(path, relative, strict_timestamps=False)
+    member.compress_type = (
+        zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+    )
+    digest = hashlib.sha256()
+    needs_fixup = False
+    with open(path, "rb") as source, archive.open(member, "w", force_zip64=True) as target:
+        if in_env and info.st_size <= MAX_FIXUP_SIZE:
+            data = source.read()
+            needs_fixup = root_bytes in data and b"\0" not in data
+            digest.update(data)
+            target.write(data)
+        else:
+            while chunk := source.read(CHUNK_SIZE):
+                digest.update(chunk)
+                target.write(chunk)
+    return {
+        "path": relative,
+        "size": info.st_size,
+        "mode": stat.S_IMODE(info.st_mode),
+        "mtime_ns": info.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+        "fixup": needs_fixup,
+    }
+
+
+def python_info():
+    return {
+        "version": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": sys.platform,
+        "machine": platform.machine(),
+    }
+
+
+def create_snapshot(project_path, output):
+    """Empaqueta el proyecto en `output`; devuelve el manifiesto."""
+    start = time.perf_counter()
+    environments = find_environments(project_path)
+    directories, files, links = walk(project_path)
+    root_bytes = str(project_path).encode("utf-8")
+    entries = []
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for relative in files:
+            in_env = relative.split("/", 1)[0] in environments
+            entries.append(_write_member(archive, project_path, relative, in_env, root_bytes))
+        manifest = {
+            "format": FORMAT_VERSION,
+            "name": project_path.name,
+            "root": str(project_path),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "generator": (load_manifest(project_path) or {}).get("generator"),
+            "python": python_info(),
+            "environments": environments,
+            "directories": directories,
+            "files": entries,
+            "links": [
+                {"path": relative, "target": os.readlink(project_path / relative)} for relative in links
+            ],
+        }
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=1, ensure_ascii=False))
+    manifest["elapsed"] = time.perf_counter() - start
+    return manifest
+
+
+def _balanced_chunks(entries, workers):
+    """Reparte los archivos en `workers` grupos de tamaño total parecido."""
+    chunks = [[] for _ in range(workers)]
+    sizes = [0] * workers
+    for entry in sorted(entries, key=lambda e: e["size"], reverse=True):
+        index = sizes.index(min(sizes))
+        chunks[index].append(entry)
+        sizes[index] += entry["size"]
+    return [chunk for chunk in chunks if chunk]
+
+
+def _safe_path(destination, relative):
+    """Ruta de la instantánea dentro de `destination`.
+
+    Un manifiesto con rutas absolutas o con '..' podría escribir fuera del
+    destino al restaurar: se rechaza con ValueError.
+    """
+    path = Path(os.path.normpath(destination / relative))
+    if os.path.isabs(relative) or path == destination or not path.is_relative_to(destination):
+        raise ValueError(f"La instantánea contiene una ruta fuera del proyecto: {relative}")
+    return path
+
+
+def _project_name(name):
+    """Nombre del proyecto del manifiesto, que es el destino por defecto al restaurar.
+
+    Tiene que ser un único componente de ruta: con '..', separadores o una
+    ruta absoluta se restauraría fuera del directorio actual (ValueError).
+    """
+    if not isinstance(name, str) or name in ("", ".", "..") or Path(name).name != name or "\\" in name:
+        raise ValueError(f"La instantánea tiene un nombre de proyecto no válido: {name!r}")
+    return name
+
+
+def _link_target(destination, link, old_root, environments):
+    """Destino con el que recrear un enlace simbólico, o ValueError si apunta fuera.
+
+    Los absolutos dentro del proyecto original se recolocan en `destination`;
+    fuera de él solo se admiten los del intérprete base de los entornos
+    (bin/python*), que fix_interpreter corrige si no existe aquí.
+    """
+    path = _safe_path(destination, link["path"])
+    target = link["target"]
+    if os.path.isabs(target):
+        target_path = Path(os.path.normpath(target))
+        if target_path.is_relative_to(old_root):
+            return str(destination / target_path.relative_to(old_root))
+        relative = Path(link["path"])
+        if INTERPRETER_LINK.fullmatch(relative.name) and any(
+            relative.parent == Path(env) / "bin" for env in environments
+        ):
+            return target
+    elif Path(os.path.normpath(path.parent / target)).is_relative_to(destination):
+        return target
+    raise ValueError(f"La instantánea contiene un enlace que apunta fuera del proyecto: {link['path']} -> {target}")
+
+
+def _relocate(data, old_root, new_root):
+    """Cambia las rutas bajo `old_root` por `new_root`, sin tocar las que solo empiezan igual."""
+    # /home/a/proj no debe casar con /home/a/proj2
+    return re.sub(re.escape(old_root) + rb"(?![\w.-])", lambda match: new_root, data)
+
+
+def _extract_chunk(archive_path, destination, entries, old_root, new_root, verify):
+    """Extrae un grupo de archivos con su propio descriptor del zip.
+
+    Devuelve la lista de rutas cuyo sha256 no coincide (si verify).
+    """
+    mismatched = []
+    with zipfile.ZipFile(archive_path) as archive:
+        for entry in entries:
+            path = _safe_path(destination, entry["path"])
+            with archive.open(entry["path"]) as source, open(path, "wb") as target:
+                if entry["fixup"] or verify:
+                    data = source.read()
+                    if verify and hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                        mismatched.append(entry["path"])
+                    if entry["fixup"]:
+                        data = _relocate(data, old_root, new_root)
+                    target.write(data)
+                else:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+            os.chmod(path, entry["mode"])
+            os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+    return mismatched
+
+
+def _read_venv_cfg(env_path):
+    cfg = {}
+    for line in (env_path / "pyvenv.cfg").read_text(encoding="utf-8").splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            cfg[key.strip()] = value.strip()
+    return cfg
+
+
+def _python_in(home):
+    names = ["python.exe"] if sys.platform == "win32" else ["python3", "python"]
+    return any((Path(home) / name).exists() for name in names)
+
+
+def _find_base_python(version):
+    """Intérprete X.Y instalado en esta máquina (PATH o los de UV), o None."""
+    interpreter = find_interpreter(version)
+    if interpreter and sys.platform != "win32":
+        return Path(interpreter[0]).resolve()
+    if interpreter:
+        # py -X.Y: se pregunta la ruta real al lanzador
+        result = resources.run(
+            [*interpreter, "-c", "import sys; print(sys.executable)"], capture_output=True, text=True,
+            step=f"buscar Python {version}",
+        )
+        if result.returncode == 0:
+            return Path(result.stdout.strip())
+    if shutil.which("uv"):
+        result = resources.run(
+            ["uv", "python", "find", version], capture_output=True, text=True, step=f"buscar Python {version}"
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return Path(result.stdout.strip()).resolve()
+    return None
+
+
+def fix_interpreter(env_path):
+    """Apunta el entorno a un intérprete base de esta máquina si el original no existe.
+
+    Devuelve None si no hizo falta, la ruta del nuevo intérprete, o False si
+    no se encontró ninguno de la misma versión.
+    """
+    cfg = _read_venv_cfg(env_path)
+    if _python_in(cfg.get("home", "")):
+        return None
+    full_version = cfg.get("version_info") or cfg.get("version") or ""
+    version = ".".join(full_version.split(".")[:2])
+    base = _find_base_python(version) if version else None
+    if base is None:
+        return False
+
+    cfg_path = env_path / "pyvenv.cfg"
+    content = cfg_path.read_text(encoding="utf-8")
+    content = re.sub(r"^home\s*=.*$", f"home = {base.parent}", content, count=1, flags=re.M)
+    cfg_path.write_text(content, encoding="utf-8")
+    if sys.platform != "win32":
+        for link in (env_path / "bin").iterdir():
+            if link.is_symlink() and INTERPRETER_LINK.fullmatch(link.name):
+                target = os.readlink(link)
+                # Los enlaces relativos (python3 -> python) siguen valiendo
+                if os.path.isabs(target):
+                    link.unlink()
+                    link.symlink_to(base)
+    return base
+
+
+def restore_snapshot(archive_path, destination, workers=None, verify=False):
+    """Restaura la instantánea en `destination` (que no debe existir).
+
+    Devuelve (manifiesto, archivos con sha256 distinto, intérpretes cambiados).
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Formato de instantánea no soportado: {manifest.get('format')}")
+    if manifest["python"]["platform"] != sys.platform:
+        raise ValueError(
+            f"La instantánea es de {manifest['python']['platform']}: "
+            f"los entornos virtuales no se pueden llevar a {sys.platform}"
+        )
+
+    # Todas las rutas se comprueban antes de escribir nada
+    destination = Path(os.path.abspath(destination))
+    for relative in [*manifest["directories"], *manifest["environments"], *(e["path"] for e in manifest["files"])]:
+        _safe_path(destination, relative)
+    links = [
+        (_safe_path(destination, link["path"]), _link_target(destination, link, manifest["root"], manifest["environments"]))
+        for link in manifest["links"]
+    ]
+
+    destination.mkdir(parents=True)
+    for relative in manifest["directories"]:
+        (destination / relative).mkdir(parents=True, exist_ok=True)
+
+    old_root = manifest["root"].encode("utf-8")
+    new_root = str(destination).encode("utf-8")
+    workers = workers or min(32, (os.cpu_count() or 1) * 2)
+    chunks = _balanced_chunks(manifest["files"], workers)
+    mismatched = []
+    with ThreadPoolExecutor(max_workers=max(1, len(chunks))) as executor:
+        futures = [
+            executor.submit(_extract_chunk, archive_path, destination, chunk, old_root, new_root, verify)
+            for chunk in chunks
+        ]
+        for future in futures:
+            mismatched += future.result()
+
+    for path, target in links:
+        os.symlink(target, path)
+
+    interpreters = {}
+    for env in manifest["environments"]:
+        interpreters[env] = fix_interpreter(destination / env)
+    return manifest, mismatched, interpreters
+
+
+def summary_table(manifest, elapsed, title):
+    table = Table(title=title, title_style="bold", show_header=False)
+    table.add_column("Dato", style="cyan")
+    table.add_column("Valor")
+    files = manifest["files"]
+    table.add_row("Proyecto", manifest["name"])
+    table.add_row("Generador", manifest.get("generator") or "-")
+    table.add_row("Sistema", f"{manifest['python']['platform']} {manifest['python']['machine']}")
+    table.add_row("Entornos", ", ".join(manifest["environments"]) or "-")
+    table.add_row("Archivos", f"{len(files):,} ({len(manifest['links'])} enlaces)")
+    table.add_row("Tamaño", format_bytes(sum(entry["size"] for entry in files)))
+    table.add_row("Rutas a recolocar", str(sum(entry["fixup"] for entry in files)))
+    table.add_row("Tiempo", f"{elapsed:.2f} s")
+    return table
+
+
+def create_command(args):
+    project_path = Path(args.ruta).resolve()
+    if not project_path.is_dir():
+        console.print(f"[red]❌ {project_path} no es un directorio[/red]")
+        return 1
+    output = Path(args.salida or f"{project_path.name}.snapshot.zip").resolve()
+    if output.is_relative_to(project_path):
+        console.print("[red]❌ La instantánea no puede guardarse dentro del propio proyecto[/red]")
+        return 1
+    if not find_environments(project_path):
+        console.print("[yellow]⚠️[/yellow] El proyecto no tiene entorno virtual propio (¿miembro de un workspace?): solo se empaquetan los archivos")
+
+    with console.status(f"[bold green]Empaquetando {project_path.name}..."):
+        manifest = create_snapshot(project_path, output)
+    console.print(summary_table(manifest, manifest["elapsed"], "Instantánea"))
+    console.print(f"[green]✓[/green] {output} ({format_bytes(output.stat().st_size)})")
+    return 0
+
+
+def restore_command(args):
+    archive_path = Path(args.archivo).resolve()
+    if not zipfile.is_zipfile(archive_path):
+        console.print(f"[red]❌ {archive_path} no es una instantánea válida[/red]")
+        return 1
+    if args.destino:
+        destination = Path(args.destino).resolve()
+    else:
+        with zipfile.ZipFile(archive_path) as archive:
+            name = json.loads(archive.read(MANIFEST_NAME)).get("name")
+        try:
+            destination = Path(_project_name(name)).resolve()
+        except ValueError as e:
+            console.print(f"[red]❌ {e}[/red]")
+            console.print("[dim]Indica el directorio de destino después del archivo[/dim]")
+            return 1
+    if destination.exists():
+        console.print(f"[red]❌ Ya existe {destination}[/red]")
+        return 1
+
+    start = time.perf_counter()
+    try:
+        with console.status(f"[bold green]Restaurando en {destination}..."):
+            manifest, mismatched, interpreters = restore_snapshot(
+                archive_path, destination, args.hilos, args.verificar
+            )
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return 1
+    console.print(summary_table(manifest, time.perf_counter() - start, "Restauración"))
+
+    for env, interpreter in interpreters.items():
+        if interpreter is False:
+            cfg = _read_venv_cfg(destination / env)
+            version = cfg.get("version_info") or cfg.get("version") or "de la misma versión"
+            console.print(f"[yellow]⚠️[/yellow] {env}: no hay Python {version} en esta máquina; instálalo y recrea el entorno")
+        elif interpreter:
+            console.print(f"[green]✓[/green] {env}: intérprete base cambiado a {interpreter}")
+    if mismatched:
+        console.print(f"[red]✗[/red] {len(mismatched)} archivo(s) no coinciden con el manifiesto: {', '.join(mismatched[:5])}")
+        return 1
+    if args.verificar:
+        console.print("[green]✓[/green] Todos los archivos coinciden con el manifiesto")
+    console.print(f"[green]✓[/green] Proyecto restaurado en {destination}")
+    return 0
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Instantáneas portables de proyectos con su entorno")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    create_parser = subparsers.add_parser("create", help="empaqueta un proyecto y sus entornos en un zip")
+    create_parser.add_argument("ruta", nargs="?", default=".", help="proyecto (por defecto, el directorio actual)")
+    create_parser.add_argument("-o", "--salida", help="archivo de salida (por defecto, <proyecto>.snapshot.zip)")
+    restore_parser = subparsers.add_parser("restore", help="restaura una instantánea en paralelo")
+    restore_parser.add_argument("archivo", help="instantánea .zip")
+    restore_parser.add_argument("destino", nargs="?", help="directorio de destino (por defecto, ./<proyecto>)")
+    restore_parser.add_argument("--hilos", type=int, help="hilos de extracción (por defecto, 2 por núcleo)")
+    restore_parser.add_argument("--verificar", action="store_true", help="comprueba el sha256 de cada archivo")
+    args = parser.parse_args(argv)
+    resources.report_at_exit(console)
+    if args.command == "create":
+        return create_command(args)
+    return restore_command(args)
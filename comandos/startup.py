@@ -0,0 +1,71 @@
+"""Precompilación del entorno a bytecode y medición del primer arranque."""
+import sys
+import time
+
+from comandos import resources
+from comandos.background import run_quiet
+
+# Lo que importa `streamlit run` antes de levantar el servidor
+STREAMLIT_ENTRY = ["-c", "import streamlit.web.cli"]
+
+
+def venv_python(venv_path):
+    """Devuelve la ruta al intérprete de un entorno virtual."""
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def entry_command(project_path, module):
+    """Argumentos del intérprete para ejecutar main() del proyecto."""
+    if module == "main":
+        return [str(project_path / "main.py")]
+    return ["-c", f"from {module} import main; main()"]
+
+
+def precompile(python):
+    """Compila site-packages a bytecode en paralelo con todos los núcleos.
+
+    Devuelve (ok, error); algunos paquetes incluyen archivos que no compilan
+    a propósito, así que un fallo aquí no impide usar el entorno.
+    """
+    ok, purelib = run_quiet([str(python), "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"])
+    if not ok:
+        return ok, purelib
+    # -j 0 usa tantos procesos como núcleos tenga la máquina
+    return run_quiet([str(python), "-m", "compileall", "-q", "-j", "0", purelib.strip()])
+
+
+def time_run(python, args, cwd):
+    """Segundos que tarda una ejecución del intérprete con los argumentos dados."""
+    start = time.perf_counter()
+    resources.run([str(python), *args], cwd=cwd, capture_output=True, step="arranque")
+    return time.perf_counter() - start
+
+
+def precompile_and_measure(python, args, cwd, repeats=3):
+    """Mide el primer arranque, precompila y vuelve a medir.
+
+    La primera ejecución es el arranque en frío real: compila a bytecode todo
+    lo que importa. Tras precompilar se toma la mejor de varias ejecuciones.
+    Devuelve (segundos en frío, segundos tras precompilar, ok, error).
+    """
+    cold = time_run(python, args, cwd)
+    ok, error = precompile(python)
+    warm = min(time_run(python, args, cwd) for _ in range(repeats))
+    return cold, warm, ok, error
+
+
+def startup_table(cold, warm):
+    """Tabla de Rich con la comparación de tiempos de arranque."""
+    from rich.table import Table
+
+    table = Table(title="Arranque del punto de entrada", title_style="bold")
+    table.add_column("Medición", style="cyan")
+    table.add_column("Tiempo", justify="right")
+    table.add_row("Primer arranque sin precompilar", f"{cold * 1000:.0f} ms")
+    table.add_row("Arranque con el entorno precompilado", f"{warm * 1000:.0f} ms")
+    if cold > 0:
+        saving = 1 - warm / cold
+        table.add_row("Ahorro", f"{saving * 100:.0f} %", style="green" if saving > 0 else None)
+    return table
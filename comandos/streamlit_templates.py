@@ -0,0 +1,752 @@
+"""Plantillas de aplicación para los generadores de Streamlit."""
+
+# Plantillas disponibles; la básica la escribe cada generador por su cuenta
+TEMPLATE_CHOICES = ["basica", "rendimiento", "datos"]
+
+# Dependencias que cada plantilla agrega además de Streamlit
+TEMPLATE_DEPENDENCIES = {
+    "datos": ["pyarrow"],
+}
+
+BACKEND_LABELS = {
+    "uv": "Streamlit y UV",
+    "pip": "Streamlit y pip",
+}
+
+PERFORMANCE_APP = '''"""Aplicación Streamlit con patrones de rendimiento."""
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Configuración de la página
+st.set_page_config(
+    page_title="Mi Aplicación Streamlit",
+    page_icon="⚡",
+    layout="wide",
+    initial_sidebar_state="auto"
+)
+
+
+# --- Recursos compartidos -------------------------------------------------
+# st.cache_resource crea el objeto una sola vez por proceso y lo comparte entre
+# sesiones y reruns. Úsalo para conexiones, clientes HTTP o modelos.
+@st.cache_resource
+def get_client():
+    """Simula un recurso costoso de inicializar."""
+    time.sleep(1)
+    return {"creado": datetime.now()}
+
+
+# --- Datos cacheados ------------------------------------------------------
+# st.cache_data guarda una copia del resultado por cada combinación de
+# argumentos. ttl evita servir datos obsoletos y max_entries acota la memoria.
+@st.cache_data(ttl=600, max_entries=8, show_spinner="Cargando datos...")
+def load_data(rows):
+    """Genera (o cargaría desde disco/red) el conjunto de datos."""
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        "fecha": pd.date_range("2024-01-01", periods=rows, freq="min"),
+        "categoria": rng.choice(["A", "B", "C", "D"], size=rows),
+        "valor": rng.normal(100, 15, size=rows),
+        "cantidad": rng.integers(1, 50, size=rows),
+    })
+
+
+@st.cache_data(ttl=600, max_entries=32)
+def summarize(rows, column):
+    """Agregado cacheado: recibe parámetros pequeños, no el DataFrame.
+
+    Pasar el DataFrame como argumento obligaría a Streamlit a hashearlo en
+    cada llamada; con los parámetros que lo generan la clave es inmediata.
+    """
+    data = load_data(rows)
+    return data.groupby("categoria")[column].agg(["mean", "sum", "count"])
+
+
+# --- Estado de sesión -----------------------------------------------------
+# Inicializar una sola vez evita recalcular valores por defecto en cada rerun.
+if "rows" not in st.session_state:
+    st.session_state.rows = 10_000
+if "runs" not in st.session_state:
+    st.session_state.runs = 0
+st.session_state.runs += 1
+
+
+# --- Fragmentos -----------------------------------------------------------
+# Un fragmento se vuelve a ejecutar solo, sin rehacer el resto del script.
+@st.fragment
+def metric_explorer(rows):
+    """Cambiar la métrica solo reejecuta este bloque."""
+    column = st.selectbox("Métrica", ["valor", "cantidad"])
+    st.dataframe(summarize(rows, column))
+
+
+@st.fragment(run_every="10s")
+def server_clock():
+    """Se refresca periódicamente sin provocar un rerun completo."""
+    st.metric("Hora del servidor", datetime.now().strftime("%H:%M:%S"))
+
+
+# Título principal
+st.title("Mi Aplicación Streamlit ⚡")
+
+# Sidebar: un formulario agrupa los cambios y provoca un único rerun al enviarlo
+with st.sidebar:
+    st.header("Configuración")
+    with st.form("config"):
+        rows = st.number_input(
+            "Filas de datos", min_value=1_000, max_value=1_000_000,
+            value=st.session_state.rows, step=1_000
+        )
+        if st.form_submit_button("Aplicar"):
+            st.session_state.rows = int(rows)
+    st.caption(f"Reruns en esta sesión: {st.session_state.runs}")
+    st.caption(f"Recurso creado: {get_client()['creado']:%H:%M:%S}")
+
+# Navegación perezosa: a diferencia de st.tabs, solo se ejecuta la sección elegida
+section = st.radio(
+    "Sección", ["Resumen", "Datos", "Gráfico"],
+    horizontal=True, label_visibility="collapsed"
+)
+
+if section == "Resumen":
+    server_clock()
+    metric_explorer(st.session_state.rows)
+elif section == "Datos":
+    data = load_data(st.session_state.rows)
+    st.subheader(f"{len(data):,} filas")
+    # Mostrar solo una muestra evita serializar la tabla completa al navegador
+    st.dataframe(data.head(1_000))
+else:
+    data = load_data(st.session_state.rows)
+    st.line_chart(data.set_index("fecha")["valor"].resample("h").mean())
+
+# Pie de página
+st.divider()
+st.caption("Creado con {backend_label} 🚀")
+'''
+
+PERFORMANCE_CONFIG = """# Configuración de Streamlit orientada a rendimiento
+# Referencia: https://docs.streamlit.io/develop/api-reference/configuration/config.toml
+
+[server]
+# No reejecutar la app en cada guardado; usa "R" en el navegador cuando quieras
+runOnSave = false
+# En producción no hace falta vigilar archivos: fileWatcherType = "none"
+fileWatcherType = "auto"
+maxUploadSize = 200
+
+[runner]
+# Interrumpe el rerun en curso cuando llega una nueva interacción
+fastReruns = true
+# Las expresiones sueltas no se escriben en la página (evita trabajo implícito)
+magicEnabled = false
+
+[browser]
+gatherUsageStats = false
+
+[client]
+toolbarMode = "minimal"
+showErrorDetails = true
+
+[logger]
+level = "warning"
+"""
+
+DATA_MODULE = '''"""Acceso a los datos en Parquet sin cargarlos enteros en memoria.
+
+Los datos viven en data/parquet/ como uno o varios archivos Parquet con las
+mismas columnas (los crea csv_a_parquet.py). Todo se lee de forma perezosa:
+
+- dataset() solo abre los metadatos; las consultas leen del disco lo justo.
+- Proyección de columnas: se leen solo las columnas pedidas.
+- Filtros sobre el dataset: las estadísticas de cada grupo de filas permiten
+  saltarse los que no pueden cumplirlos.
+- Los archivos se abren con memory_map, así que el sistema operativo pagina
+  los bytes bajo demanda y los comparte entre sesiones y procesos.
+"""
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import streamlit as st
+
+DATA_DIR = Path(__file__).parent / "data" / "parquet"
+
+
+def parquet_files():
+    return sorted(DATA_DIR.glob("*.parquet"))
+
+
+@st.cache_resource
+def dataset():
+    """Dataset perezoso sobre todos los Parquet (compartido entre sesiones)."""
+    return ds.dataset(DATA_DIR, format="parquet")
+
+
+@st.cache_resource
+def parquet_file(path):
+    """Archivo Parquet abierto con memory_map, uno por proceso."""
+    return pq.ParquetFile(path, memory_map=True)
+
+
+@st.cache_resource
+def row_groups():
+    """(archivo, grupo de filas, filas) de cada grupo, en orden.
+
+    Sale solo de los metadatos del pie de cada archivo: no lee datos.
+    """
+    groups = []
+    for path in parquet_files():
+        metadata = parquet_file(str(path)).metadata
+        for index in range(metadata.num_row_groups):
+            groups.append((str(path), index, metadata.row_group(index).num_rows))
+    return groups
+
+
+def total_rows():
+    return sum(rows for _, _, rows in row_groups())
+
+
+def numeric_columns():
+    return [f.name for f in dataset().schema if pa.types.is_integer(f.type) or pa.types.is_floating(f.type)]
+
+
+def text_columns():
+    return [f.name for f in dataset().schema if pa.types.is_string(f.type) or pa.types.is_dictionary(f.type)]
+
+
+def build_filter(column, minimum):
+    """Expresión de filtro que pyarrow empuja hasta la lectura."""
+    if column is None:
+        return None
+    return pc.field(column) >= minimum
+
+
+@st.cache_data(max_entries=32)
+def count_matching(column, minimum):
+    return dataset().count_rows(filter=build_filter(column, minimum))
+
+
+@st.cache_data(max_entries=32)
+def grouped(group_column, value_column, column, minimum):
+    """Agregado leyendo solo las dos columnas necesarias."""
+    table = dataset().to_table(columns=[group_column, value_column], filter=build_filter(column, minimum))
+    result = table.group_by(group_column).aggregate([(value_column, "mean"), (value_column, "count")])
+    return result.to_pandas().sort_values(group_column)
+
+
+@st.cache_data(max_entries=64)
+def read_page(columns, page, page_size):
+    """Filas [page * page_size, (page + 1) * page_size) de las columnas pedidas.
+
+    Solo se leen los grupos de filas que se solapan con la página.
+    """
+    start, end = page * page_size, (page + 1) * page_size
+    tables, offset = [], 0
+    for path, index, rows in row_groups():
+        if offset >= end:
+            break
+        if offset + rows > start:
+            table = parquet_file(path).read_row_group(index, columns=list(columns))
+            first = max(start, offset)
+            tables.append(table.slice(first - offset, min(end, offset + rows) - first))
+        offset += rows
+    if not tables:
+        return dataset().schema.empty_table().select(list(columns)).to_pandas()
+    return pa.concat_tables(tables).to_pandas()
+
+
+def write_sample(rows, row_group_size=100_000):
+    """Escribe un Parquet de ejemplo para probar la app sin datos propios."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(42)
+    path = DATA_DIR / "ejemplo.parquet"
+    with pq.ParquetWriter(path, pa.schema([
+        ("id", pa.int64()),
+        ("fecha", pa.timestamp("s")),
+        ("categoria", pa.string()),
+        ("valor", pa.float64()),
+        ("cantidad", pa.int32()),
+    ]), compression="zstd") as writer:
+        for start in range(0, rows, row_group_size):
+            size = min(row_group_size, rows - start)
+            ids = np.arange(start, start + size)
+            writer.write_table(pa.table({
+                "id": ids,
+                "fecha": pa.array((np.datetime64("2024-01-01T00:00:00") + ids.astype("timedelta64[m]")).astype("datetime64[s]")),
+                "categoria": rng.choice(["A", "B", "C", "D"], size=size),
+                "valor": rng.normal(100, 15, size=size),
+                "cantidad": rng.integers(1, 50, size=size, dtype=np.int32),
+            }, schema=writer.schema))
+    return path
+'''
+
+DATA_APP = '''"""Aplicación Streamlit sobre datos en Parquet con lectura perezosa."""
+import streamlit as st
+
+import datos
+
+# Configuración de la página
+st.set_page_config(
+    page_title="Mi Aplicación de Datos",
+    page_icon="🗂️",
+    layout="wide",
+    initial_sidebar_state="auto"
+)
+
+st.title("Mi Aplicación de Datos 🗂️")
+
+if not datos.parquet_files():
+    st.info(
+        "No hay datos en data/parquet/. Convierte tus CSV con "
+        "`python csv_a_parquet.py datos.csv` o genera un ejemplo."
+    )
+    rows = st.number_input("Filas de ejemplo", min_value=10_000, max_value=50_000_000, value=1_000_000, step=100_000)
+    if st.button("Generar datos de ejemplo"):
+        with st.spinner("Escribiendo Parquet..."):
+            datos.write_sample(int(rows))
+        st.cache_resource.clear()
+        st.cache_data.clear()
+        st.rerun()
+    st.stop()
+
+# Todo lo de esta sección sale de los metadatos: no se lee ninguna fila
+files = datos.parquet_files()
+size = sum(path.stat().st_size for path in files)
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Filas", f"{datos.total_rows():,}")
+col2.metric("Archivos", len(files))
+col3.metric("Grupos de filas", len(datos.row_groups()))
+col4.metric("Tamaño en disco", f"{size / 1024 ** 2:,.1f} MB")
+
+with st.expander("Esquema"):
+    st.dataframe(
+        [{"columna": field.name, "tipo": str(field.type)} for field in datos.dataset().schema],
+        hide_index=True,
+    )
+
+# Consulta con proyección de columnas y filtro empujado a la lectura
+st.subheader("Consulta")
+numeric = datos.numeric_columns()
+text = datos.text_columns()
+if not numeric or not text:
+    st.caption("Hace falta al menos una columna numérica y una de texto para agrupar.")
+    st.stop()
+
+with st.form("consulta"):
+    c1, c2, c3, c4 = st.columns(4)
+    group_column = c1.selectbox("Agrupar por", text)
+    value_column = c2.selectbox("Métrica", numeric)
+    filter_column = c3.selectbox("Filtrar por", [None, *numeric], format_func=lambda c: c or "(sin filtro)")
+    minimum = c4.number_input("Valor mínimo", value=0.0)
+    st.form_submit_button("Consultar")
+
+matching = datos.count_matching(filter_column, minimum)
+st.caption(f"{matching:,} filas cumplen el filtro · solo se leen las columnas {group_column} y {value_column}")
+summary = datos.grouped(group_column, value_column, filter_column, minimum)
+st.dataframe(summary, hide_index=True)
+st.bar_chart(summary, x=group_column, y=f"{value_column}_mean")
+
+st.page_link("pages/tabla_paginada.py", label="Ver la tabla completa por páginas", icon="📄")
+
+# Pie de página
+st.divider()
+st.caption("Creado con {backend_label} 🚀")
+'''
+
+DATA_PAGED_PAGE = '''"""Tabla grande mostrada por páginas: solo se lee la página visible."""
+import streamlit as st
+
+import datos
+
+st.title("Tabla paginada 📄")
+
+if not datos.parquet_files():
+    st.info("Aún no hay datos: vuelve a la página principal para generarlos.")
+    st.stop()
+
+total = datos.total_rows()
+schema = datos.dataset().schema
+
+with st.sidebar:
+    columns = st.multiselect("Columnas", schema.names, default=schema.names[:6])
+    page_size = st.select_slider("Filas por página", [50, 100, 250, 500, 1_000], value=100)
+
+if not columns:
+    st.warning("Elige al menos una columna.")
+    st.stop()
+
+pages = max(1, -(-total // page_size))
+page = st.number_input(f"Página (de {pages:,})", min_value=1, max_value=pages, value=1) - 1
+
+# Solo viajan al navegador las filas de la página, no la tabla entera
+data = datos.read_page(tuple(columns), page, page_size)
+first = page * page_size
+st.caption(f"Filas {first + 1:,}–{first + len(data):,} de {total:,}")
+st.dataframe(data, hide_index=True)
+'''
+
+CSV_TO_PARQUET = '''"""Convierte un CSV (de cualquier tamaño) a Parquet por bloques.
+
+El CSV se lee en streaming, así que la memoria usada no depende del tamaño
+del archivo. Cada bloque se escribe como uno o varios grupos de filas, lo que
+permite luego leer páginas y filtrar sin abrir el archivo entero.
+
+Uso:
+    python csv_a_parquet.py datos.csv
+    python csv_a_parquet.py datos.csv --salida data/parquet/ventas.parquet --grupo 200000
+"""
+import argparse
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+
+
+def convert(source, target, row_group_size, block_size, compression):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    reader = csv.open_csv(source, read_options=csv.ReadOptions(block_size=block_size))
+    rows = pending = 0
+    buffered = []
+    with pq.ParquetWriter(target, reader.schema, compression=compression) as writer:
+        for batch in reader:
+            buffered.append(batch)
+            rows += batch.num_rows
+            pending += batch.num_rows
+            if pending >= row_group_size:
+                writer.write_table(pa.Table.from_batches(buffered), row_group_size=row_group_size)
+                buffered, pending = [], 0
+        if buffered:
+            writer.write_table(pa.Table.from_batches(buffered), row_group_size=row_group_size)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convierte un CSV a Parquet por bloques")
+    parser.add_argument("csv", type=Path, help="archivo CSV de entrada")
+    parser.add_argument("--salida", type=Path, help="archivo Parquet (por defecto, data/parquet/<nombre>.parquet)")
+    parser.add_argument("--grupo", type=int, default=100_000, help="filas por grupo de filas (por defecto 100000)")
+    parser.add_argument("--bloque", type=int, default=64, help="MB de CSV leídos por bloque (por defecto 64)")
+    parser.add_argument("--compresion", default="zstd", help="zstd, snappy, gzip o none (por defecto zstd)")
+    args = parser.parse_args()
+
+    target = args.salida or Path(__file__).parent / "data" / "parquet" / f"{args.csv.stem}.parquet"
+    start = time.perf_counter()
+    rows = convert(args.csv, target, args.grupo, args.bloque * 1024 * 1024, args.compresion)
+    elapsed = time.perf_counter() - start
+    ratio = args.csv.stat().st_size / max(1, target.stat().st_size)
+    print(f"{rows:,} filas -> {target} en {elapsed:.1f} s ({ratio:.1f}x más pequeño que el CSV)")
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+PERF_MODULE = '''"""Panel de rendimiento: tiempo de cada rerun, por sección y de la caché.
+
+Solo se activa con la variable de entorno PERF_PANEL=1:
+
+    PERF_PANEL=1 streamlit run app.py
+
+Sin ella, start() y panel() vuelven sin hacer nada, section() devuelve un
+contexto vacío y cache_data/cache_resource son los de Streamlit tal cual, así
+que en producción no cuesta nada.
+
+El panel ocupa siempre lo alto de la barra lateral: start() reserva el sitio
+y panel() lo llena. Si el script para antes con st.stop() (por ejemplo,
+cuando aún no hay datos), el panel se dibuja justo antes de parar.
+
+Uso:
+
+    import perf
+    perf.start()                     # al principio del script
+
+    @perf.cache_data(ttl=600)        # en lugar de @st.cache_data
+    def load_data(): ...
+
+    with perf.section("Gráfico"):    # tiempo de un bloque concreto
+        ...
+
+    perf.panel()                     # al final: dibuja el panel arriba en la barra lateral
+
+Cada función cacheada cuenta como una sección, así que su tiempo muestra
+directamente cuánto cuesta un fallo de caché frente a un acierto.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import streamlit as st
+
+ENABLED = os.environ.get("PERF_PANEL") == "1"
+
+# Reruns que se guardan por sesión para el histórico
+HISTORY = 50
+
+STATE_KEY = "_perf"
+
+_null = nullcontext()
+# Las cachés de Streamlit son por proceso, y sus contadores también
+_cache_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _state():
+    if STATE_KEY not in st.session_state:
+        st.session_state[STATE_KEY] = {"start": None, "sections": {}, "history": []}
+    return st.session_state[STATE_KEY]
+
+
+def start():
+    """Marca el inicio del rerun y reserva lo alto de la barra lateral para el panel."""
+    if not ENABLED:
+        return
+    state = _state()
+    state["start"] = time.perf_counter()
+    state["sections"] = {}
+    state["slot"] = st.sidebar.empty()
+
+
+@contextmanager
+def _timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sections = _state()["sections"]
+        sections[name] = sections.get(name, 0.0) + time.perf_counter() - start
+
+
+def section(name):
+    """Contexto que suma su duración a la sección `name` de este rerun."""
+    return _timed(name) if ENABLED else _null
+
+
+def _counted(decorator, kind):
+    """Envuelve st.cache_data/st.cache_resource contando aciertos y fallos."""
+
+    def factory(func=None, **kwargs):
+        if func is None:
+            return lambda f: factory(f, **kwargs)
+        name = func.__qualname__
+        stats = _cache_stats.setdefault(name, {"kind": kind, "calls": 0, "misses": 0})
+
+        # Streamlit solo ejecuta la función en un fallo de caché
+        @functools.wraps(func)
+        def compute(*args, **kw):
+            with _stats_lock:
+                stats["misses"] += 1
+            return func(*args, **kw)
+
+        cached = decorator(**kwargs)(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kw):
+            with _stats_lock:
+                stats["calls"] += 1
+            with _timed(name):
+                return cached(*args, **kw)
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return factory
+
+
+if ENABLED:
+    cache_data = _counted(st.cache_data, "datos")
+    cache_resource = _counted(st.cache_resource, "recurso")
+else:
+    cache_data = st.cache_data
+    cache_resource = st.cache_resource
+
+
+def _size(obj, seen):
+    """Bytes aproximados de un objeto y de lo que contiene."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    # numpy y pyarrow saben lo que ocupan sus búferes
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    # pandas: DataFrame y Series
+    memory_usage = getattr(obj, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except TypeError:
+            pass
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_size(key, seen) + _size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_size(item, seen) for item in obj)
+    return size
+
+
+def session_memory():
+    """Bytes aproximados de st.session_state, sin las mediciones del panel."""
+    seen = set()
+    return sum(_size(st.session_state[key], seen) for key in st.session_state if key != STATE_KEY)
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:,.0f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def panel():
+    """Dibuja el panel en la barra lateral con las mediciones de este rerun."""
+    if not ENABLED:
+        return
+    state = _state()
+    if state["start"] is None:
+        return
+    # El tiempo del propio panel no cuenta
+    total = time.perf_counter() - state["start"]
+    # Una vez por rerun: st.stop() puede haberlo dibujado ya
+    state["start"] = None
+    previous = state["history"][-1] if state["history"] else None
+    state["history"] = (state["history"] + [total])[-HISTORY:]
+
+    with state["slot"].container(), st.expander("⏱️ Rendimiento", expanded=True):
+        col1, col2 = st.columns(2)
+        col1.metric(
+            "Último rerun", f"{total * 1000:.0f} ms",
+            delta=f"{(total - previous) * 1000:+.0f} ms" if previous is not None else None,
+            delta_color="inverse",
+        )
+        col2.metric("Reruns", len(state["history"]))
+        st.line_chart([value * 1000 for value in state["history"]], height=120)
+
+        sections = state["sections"]
+        if sections:
+            st.caption("Tiempo por sección")
+            st.dataframe(
+                [
+                    {"sección": name, "ms": round(seconds * 1000, 1), "%": round(100 * seconds / total)}
+                    for name, seconds in sorted(sections.items(), key=lambda item: -item[1])
+                ],
+                hide_index=True,
+            )
+
+        if _cache_stats:
+            st.caption("Caché (todo el proceso)")
+            with _stats_lock:
+                rows = [
+                    {
+                        "función": name, "tipo": stats["kind"], "llamadas": stats["calls"],
+                        "aciertos": stats["calls"] - stats["misses"], "fallos": stats["misses"],
+                    }
+                    for name, stats in _cache_stats.items()
+                ]
+            st.dataframe(rows, hide_index=True)
+
+        keys = sum(1 for key in st.session_state if key != STATE_KEY)
+        st.caption(f"Memoria de la sesión: {_format_bytes(session_memory())} en {keys} clave(s)")
+
+
+_streamlit_stop = st.stop
+
+
+def _stop():
+    # Tras st.stop() Streamlit ya no dibuja nada más, ni desde un finally: el panel va antes
+    panel()
+    _streamlit_stop()
+
+
+if ENABLED:
+    st.stop = _stop
+'''
+
+# data/ puede pesar gigas: se versiona solo la carpeta
+DATA_GITIGNORE = """*
+!.gitignore
+"""
+
+
+def render_template(template, backend):
+    """Devuelve los archivos de una plantilla como {ruta relativa: contenido}."""
+    if template == "rendimiento":
+        return {
+            "app.py": PERFORMANCE_APP.replace("{backend_label}", BACKEND_LABELS[backend]),
+            ".streamlit/config.toml": PERFORMANCE_CONFIG,
+        }
+    if template == "datos":
+        return {
+            "app.py": DATA_APP.replace("{backend_label}", BACKEND_LABELS[backend]),
+            "pages/tabla_paginada.py": DATA_PAGED_PAGE,
+            "datos.py": DATA_MODULE,
+            "csv_a_parquet.py": CSV_TO_PARQUET,
+            "data/.gitignore": DATA_GITIGNORE,
+        }
+    raise ValueError(f"Plantilla desconocida: {template}")
+
+
+def _add_import(lines):
+    """Añade `import perf` junto a los imports locales, tras el de Streamlit."""
+    index = lines.index("import streamlit as st") + 1
+    if index + 1 < len(lines) and lines[index] == "" and lines[index + 1].startswith("import "):
+        # Ya hay un grupo de imports locales (import datos): se ordena dentro
+        index += 1
+        while index < len(lines) and lines[index].startswith("import ") and lines[index] < "import perf":
+            index += 1
+        lines.insert(index, "import perf")
+    else:
+        lines[index:index] = ["", "import perf"]
+
+
+def _script_start(lines):
+    """Línea donde empieza el script: tras set_page_config o tras los imports."""
+    if "st.set_page_config(" in lines:
+        return lines.index(")", lines.index("st.set_page_config(")) + 1
+    return max(i for i, line in enumerate(lines) if line.startswith(("import ", "from "))) + 1
+
+
+def instrument(source, script):
+    """Conecta un archivo de la app con perf.py.
+
+    Las funciones cacheadas pasan a perf.cache_data/perf.cache_resource; en
+    los scripts (app.py y pages/) además se mide el rerun y se dibuja el panel.
+    """
+    if "import streamlit as st" not in source:
+        return source
+    uses_cache = "@st.cache_" in source
+    if not (script or uses_cache):
+        return source
+    source = source.replace("@st.cache_data", "@perf.cache_data").replace("@st.cache_resource", "@perf.cache_resource")
+    lines = source.split("\n")
+    _add_import(lines)
+    if script:
+        start = _script_start(lines)
+        lines[start:start] = ["", "# Mide este rerun (solo con PERF_PANEL=1)", "perf.start()"]
+        while lines and lines[-1] == "":
+            lines.pop()
+        lines += ["", "# Panel de rendimiento en la barra lateral (solo con PERF_PANEL=1)", "perf.panel()", ""]
+    return "\n".join(lines)
+
+
+def add_perf_panel(files):
+    """Archivos de la app con el panel de rendimiento conectado."""
+    instrumented = {
+        path: instrument(content, path == "app.py" or path.startswith("pages/")) if path.endswith(".py") else content
+        for path, content in files.items()
+    }
+    return {**instrumented, "perf.py": PERF_MODULE}
@@ -0,0 +1,279 @@
+"""Plantillas externas: un directorio local o un repositorio git.
+
+La fuente es una ruta o una URL de git, con una rama, etiqueta o commit
+opcional tras '#':
+
+    ~/plantillas/python
+    https://git.empresa.com/plantillas/python.git#v2
+    /srv/git/plantillas.git#main
+
+Los repositorios se clonan una sola vez (bare, sin copia de trabajo) en la
+caché y se actualizan con git fetch como mucho cada FETCH_MAX_AGE. Lo
+renderizado se guarda en la caché con clave (commit, parámetros): volver a
+generar con la misma versión de la plantilla es copiar archivos. En un
+directorio local la versión es un hash de su contenido.
+
+En el contenido y en las rutas de los archivos, {{name}}, {{module}} y
+{{generator}} se sustituyen por el nombre del proyecto, ese nombre como
+módulo de Python y el generador. Lo que no es texto UTF-8 se copia tal cual.
+"""
+import hashlib
+import io
+import json
+import re
+import shutil
+import tarfile
+import time
+from functools import partial
+from pathlib import Path, PurePosixPath
+
+from comandos import resources
+from comandos.background import run_quiet
+from comandos.cache import cache_dir
+from comandos.locking import COMPLETE_MARKER, file_lock, single_flight
+from comandos.update import write_files
+
+# Como mucho un git fetch por fuente en este tiempo
+FETCH_MAX_AGE = 10 * 60
+
+# Cambiarlo invalida lo renderizado con una versión anterior del renderizador
+RENDER_FORMAT = 1
+
+FETCHED_MARKER = ".actualizado"
+
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class TemplateSourceError(Exception):
+    """La plantilla externa no se pudo obtener o renderizar."""
+
+
+def parse_source(source):
+    """Separa la fuente en (ubicación, referencia o None)."""
+    location, _, ref = source.partition("#")
+    return location, ref or None
+
+
+def normalize_source(source):
+    """Fuente con las rutas locales en absoluto, tal como se guarda en el manifiesto.
+
+    Una ruta relativa se resolvería después contra el directorio desde el que
+    se ejecute update; las URL se dejan como están.
+    """
+    if not source:
+        return source
+    location, ref = parse_source(source)
+    if "://" not in location and Path(location).expanduser().exists():
+        location = str(Path(location).expanduser().resolve())
+    return f"{location}#{ref}" if ref else location
+
+
+def _is_bare_repo(path):
+    return (path / "HEAD").is_file() and (path / "objects").is_dir()
+
+
+def template_params(options, generator):
+    """Parámetros con los que se renderiza la plantilla."""
+    name = options["name"]
+    return {
+        "name": name,
+        "module": re.sub(r"\W", "_", name).lower(),
+        "generator": generator,
+    }
+
+
+def _substitute(text, params):
+    # Los marcadores desconocidos se dejan tal cual
+    return PLACEHOLDER.sub(lambda match: str(params.get(match.group(1), match.group(0))), text)
+
+
+def _render_path(relative_path, params):
+    """Ruta renderizada, o None si se saldría del proyecto."""
+    path = PurePosixPath(_substitute(relative_path, params))
+    if path.is_absolute() or ".." in path.parts or not path.parts:
+        return None
+    return path.as_posix()
+
+
+def _render_content(data, params):
+    try:
+        return _substitute(data.decode("utf-8"), params).encode("utf-8")
+    except UnicodeDecodeError:
+        return data
+
+
+# Directorios locales
+
+
+def _directory_files(root):
+    """(ruta relativa, bytes) de cada archivo, sin .git."""
+    for path in sorted(root.rglob("*")):
+        relative = path.relative_to(root)
+        if path.is_file() and ".git" not in relative.parts:
+            yield relative.as_posix(), path.read_bytes()
+
+
+def _directory_version(root):
+    digest = hashlib.sha256()
+    for relative_path, data in _directory_files(root):
+        digest.update(f"{relative_path}\0{len(data)}\0".encode("utf-8"))
+        digest.update(data)
+    return "dir-" + digest.hexdigest()
+
+
+# Repositorios git
+
+
+def _git(repo, *args):
+    return run_quiet(["git", "--git-dir", str(repo), *args])
+
+
+def _clone_entry(location):
+    """Entrada de caché del clon de `location`."""
+    if "://" not in location and Path(location).expanduser().exists():
+        # Las rutas locales se identifican por su ruta absoluta
+        location = str(Path(location).expanduser().resolve())
+    digest = hashlib.sha256(location.encode("utf-8")).hexdigest()[:16]
+    return cache_dir("plantillas", "repos") / digest, location
+
+
+def _fetch(repo):
+    ok, error = _git(
+        repo, "fetch", "--quiet", "--prune", "--force", "origin",
+        "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*",
+    )
+    if ok:
+        (repo.parent / FETCHED_MARKER).touch()
+    return ok, error
+
+
+def _resolve_commit(repo, ref):
+    ok, output = _git(repo, "rev-parse", "--verify", "--quiet", f"{ref or 'HEAD'}^{{commit}}")
+    return output if ok else None
+
+
+def _git_commit(location, ref):
+    """Clona o actualiza el repositorio en la caché y devuelve (repo, commit)."""
+    entry, url = _clone_entry(location)
+    repo = entry / "repo.git"
+
+    def clone(path):
+        shutil.rmtree(repo, ignore_errors=True)
+        ok, error = run_quiet(["git", "clone", "--bare", "--quiet", url, str(repo)])
+        if ok:
+            (path / FETCHED_MARKER).touch()
+        return ok
+
+    if not single_flight(entry, clone, max_age=None):
+        raise TemplateSourceError(f"no se pudo clonar {url}")
+
+    with file_lock(entry.with_name(entry.name + ".lock")):
+        try:
+            stale = time.time() - (entry / FETCHED_MARKER).stat().st_mtime > FETCH_MAX_AGE
+        except FileNotFoundError:
+            stale = True
+        commit = _resolve_commit(repo, ref)
+        # Una referencia que aún no está en el clon obliga a actualizarlo
+        if stale or commit is None:
+            ok, error = _fetch(repo)
+            if ok:
+                commit = _resolve_commit(repo, ref)
+            elif commit is None:
+                raise TemplateSourceError(f"no se pudo actualizar {url}: {error}")
+            # Sin conexión se sigue con lo que ya estaba en la caché
+    if commit is None:
+        raise TemplateSourceError(f"{ref} no existe en {url}")
+    return repo, commit
+
+
+def _git_files(repo, commit):
+    """(ruta relativa, bytes) de cada archivo del commit, sin copia de trabajo."""
+    result = resources.run(
+        ["git", "--git-dir", str(repo), "archive", "--format=tar", commit], capture_output=True, step="git archive",
+    )
+    if result.returncode != 0:
+        raise TemplateSourceError(result.stderr.decode("utf-8", "replace").strip())
+    with tarfile.open(fileobj=io.BytesIO(result.stdout)) as archive:
+        for member in archive.getmembers():
+            if member.isfile():
+                yield member.name, archive.extractfile(member).read()
+
+
+# Renderizado con caché
+
+
+def _read_rendered(root):
+    """{ruta relativa: contenido} de lo renderizado, en texto si se puede."""
+    files = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            data = path.read_bytes()
+            try:
+                files[path.relative_to(root).as_posix()] = data.decode("utf-8")
+            except UnicodeDecodeError:
+                files[path.relative_to(root).as_posix()] = data
+    return files
+
+
+def render_source(source, params):
+    """Renderiza la plantilla externa `source` con `params`.
+
+    Devuelve (archivos, versión, si venía de la caché); los archivos van como
+    {ruta relativa: contenido}, con bytes para lo que no es texto.
+    """
+    location, ref = parse_source(source)
+    local = Path(location).expanduser()
+    if local.is_dir() and not _is_bare_repo(local) and ref is None:
+        version = _directory_version(local)
+        read_files = partial(_directory_files, local)
+    else:
+        repo, version = _git_commit(location, ref)
+        read_files = partial(_git_files, repo, version)
+
+    key = json.dumps({"format": RENDER_FORMAT, "version": version, "params": params}, sort_keys=True)
+    entry = cache_dir("plantillas", "renders") / hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    rendered = entry / "archivos"
+    cached = (entry / COMPLETE_MARKER).exists()
+
+    def render(path):
+        shutil.rmtree(rendered, ignore_errors=True)
+        for relative_path, data in read_files():
+            target = _render_path(relative_path, params)
+            if target is None:
+                continue
+            file_path = rendered / target
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(_render_content(data, params))
+        return True
+
+    # Un commit no cambia: lo renderizado no caduca
+    if not single_flight(entry, render, max_age=None):
+        raise TemplateSourceError(f"no se pudo renderizar {source}")
+    return _read_rendered(rendered), version, cached
+
+
+def external_files(options, generator):
+    """Archivos de la plantilla externa del proyecto ({} si no tiene)."""
+    source = options.get("template_source")
+    if not source:
+        return {}
+    files, _, _ = render_source(source, template_params(options, generator))
+    return files
+
+
+def apply_template_source(project_path, source, options, generator, console):
+    """Escribe la plantilla externa encima de los archivos del generador.
+
+    Devuelve True si se aplicó.
+    """
+    with console.status(f"[bold green]Aplicando la plantilla {source}..."):
+        try:
+            files, version, cached = render_source(source, template_params(options, generator))
+        except TemplateSourceError as e:
+            console.print(f"[red]✗[/red] No se pudo aplicar la plantilla externa: {e}")
+            return False
+        write_files(project_path, files)
+    label = version[:12] if not version.startswith("dir-") else "directorio local"
+    origin = ", desde la caché" if cached else ""
+    console.print(f"[green]✓[/green] Plantilla externa aplicada: {len(files)} archivo(s) ({label}{origin})")
+    return True
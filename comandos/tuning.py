@@ -0,0 +1,84 @@
+"""Ajustes de concurrencia del instalador calibrados para esta máquina.
+
+`comandos calibrate` mide instalaciones desde un wheelhouse local con distinta
+concurrencia y guarda aquí lo mejor para la máquina. Los generadores los
+aplican al arrancar:
+
+- UV: UV_CONCURRENT_INSTALLS en el entorno, que heredan todas las órdenes
+  uv que lanzan.
+- pip no instala en paralelo: lo que se ajusta es cuántos instaladores corren
+  a la vez (plazas de instalación y descargas anticipadas).
+
+Lo que ya esté fijado en el entorno (las variables de UV o
+COMANDOS_MAX_INSTALLS) tiene preferencia. Cada máquina tiene su archivo,
+porque la caché puede estar compartida entre varias; si cambia el número de
+núcleos la calibración deja de valer.
+"""
+import json
+import os
+import platform
+import re
+import time
+from functools import cache
+
+from comandos.cache import cache_dir
+
+# Variables de UV que se calibran (las descargas no: la calibración no usa la red)
+UV_SETTINGS = ["UV_CONCURRENT_INSTALLS"]
+
+
+def tuning_path():
+    host = re.sub(r"[^A-Za-z0-9._-]+", "_", platform.node()) or "local"
+    return cache_dir("calibracion") / f"{host}.json"
+
+
+@cache
+def load_tuning():
+    """Ajustes calibrados de esta máquina ({} si no hay o ya no valen)."""
+    try:
+        tuning = json.loads(tuning_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if tuning.get("cpus") != os.cpu_count():
+        return {}
+    return tuning
+
+
+def save_tuning(uv_settings, installs, measurements):
+    """Guarda la calibración de esta máquina y devuelve la ruta del archivo."""
+    path = tuning_path()
+    tuning = {
+        "host": platform.node(),
+        "cpus": os.cpu_count(),
+        "calibrated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "uv": uv_settings,
+        "installs": installs,
+        "measurements": measurements,
+    }
+    temporary = path.with_name(f"{path.name}.{os.getpid()}")
+    temporary.write_text(json.dumps(tuning, indent=2) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+    load_tuning.cache_clear()
+    return path
+
+
+def reset_tuning():
+    """Borra la calibración; devuelve True si había una."""
+    load_tuning.cache_clear()
+    try:
+        tuning_path().unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def apply_tuning():
+    """Pone en el entorno los ajustes de UV calibrados que el usuario no haya fijado."""
+    for name, value in load_tuning().get("uv", {}).items():
+        if name in UV_SETTINGS:
+            os.environ.setdefault(name, str(value))
+
+
+def calibrated_installs():
+    """Instaladores simultáneos calibrados, o None sin calibración."""
+    return load_tuning().get("installs")
@@ -0,0 +1,216 @@
+"""Modo update: aplica las plantillas actuales a un proyecto ya generado.
+
+Al crear un proyecto se guarda en .comandos/manifest.json el generador, las
+opciones elegidas y el hash de cada archivo escrito desde una plantilla. Al
+actualizar se vuelve a renderizar con esas opciones y solo se reescriben los
+archivos cuyo contenido cambió en la plantilla y que el usuario no tocó.
+"""
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_PATH = Path(".comandos") / "manifest.json"
+
+# Archivos que deciden qué hay instalado en el entorno
+DEPENDENCY_FILES = ["pyproject.toml", "uv.lock", "requirements.txt", "requirements-dev.txt"]
+
+# Acciones del plan: (etiqueta, estilo)
+ACTIONS = {
+    "new": ("nuevo", "green"),
+    "update": ("actualizado", "green"),
+    "same": ("sin cambios", "dim"),
+    "modified": ("modificado por ti, se conserva", "yellow"),
+    "deleted": ("eliminado por ti, se conserva", "yellow"),
+    "untracked": ("ya existía, se conserva", "yellow"),
+    "dropped": ("ya no está en la plantilla, se conserva", "dim"),
+}
+
+
+def content_hash(data):
+    """sha256 de un texto o de unos bytes."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """Hash del archivo en disco, o None si no existe."""
+    try:
+        return content_hash(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def write_files(project_path, files, only=None):
+    """Escribe {ruta relativa: contenido}, opcionalmente solo las rutas dadas.
+
+    El contenido es texto, o bytes para los archivos binarios.
+    """
+    for relative_path, content in files.items():
+        if only is not None and relative_path not in only:
+            continue
+        file_path = project_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+            continue
+        with open(file_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+
+
+def dependency_hash(project_path, dependencies):
+    """Hash de las dependencias pedidas y de los archivos que las fijan."""
+    digest = hashlib.sha256(json.dumps(dependencies, sort_keys=True).encode("utf-8"))
+    for name in DEPENDENCY_FILES:
+        digest.update(f"\0{name}\0{file_hash(project_path / name)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_manifest(project_path):
+    """Lee el manifiesto del proyecto, o None si no tiene."""
+    try:
+        return json.loads((project_path / MANIFEST_PATH).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_manifest(project_path, generator, options, files, dependencies, previous=None, synced=True):
+    """Guarda el manifiesto con los archivos de plantilla que hay en disco.
+
+    Los archivos que el usuario modificó conservan el hash anterior para
+    seguir reconociéndolos como modificados en la próxima actualización. Si
+    el entorno no llegó a sincronizarse (synced=False) se conservan también
+    las dependencias y el hash anteriores, para volver a intentarlo: la
+    próxima actualización agrega otra vez lo que falló.
+    """
+    hashes = {}
+    previous_hashes = (previous or {}).get("files", {})
+    for relative_path, content in files.items():
+        expected = content_hash(content)
+        if file_hash(project_path / relative_path) == expected:
+            hashes[relative_path] = expected
+        elif relative_path in previous_hashes:
+            hashes[relative_path] = previous_hashes[relative_path]
+    manifest = {
+        "generator": generator,
+        "options": options,
+        "files": hashes,
+        "dependencies": dependencies if synced else (previous or {}).get("dependencies", {}),
+        "dependency_hash": (
+            dependency_hash(project_path, dependencies) if synced else (previous or {}).get("dependency_hash")
+        ),
+    }
+    manifest_path = project_path / MANIFEST_PATH
+    manifest_path.parent.mkdir(exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest
+
+
+def plan_update(project_path, files, manifest):
+    """Decide qué hacer con cada archivo: {ruta relativa: acción}."""
+    recorded = manifest.get("files", {})
+    plan = {}
+    for relative_path, content in files.items():
+        on_disk = file_hash(project_path / relative_path)
+        wanted = content_hash(content)
+        if on_disk == wanted:
+            plan[relative_path] = "same"
+        elif relative_path not in recorded:
+            plan[relative_path] = "new" if on_disk is None else "untracked"
+        elif on_disk is None:
+            plan[relative_path] = "deleted"
+        elif on_disk == recorded[relative_path]:
+            plan[relative_path] = "update"
+        else:
+            plan[relative_path] = "modified"
+    for relative_path in recorded:
+        if relative_path not in files:
+            plan[relative_path] = "dropped"
+    return plan
+
+
+def missing_dependencies(old, new):
+    """Dependencias de `new` que no estaban en `old`, por grupo."""
+    return {
+        group: [pkg for pkg in packages if pkg not in old.get(group, [])]
+        for group, packages in new.items()
+    }
+
+
+def plan_table(plan):
+    """Tabla de Rich con el plan de actualización."""
+    from rich.table import Table
+
+    table = Table(title="Archivos de plantilla", title_style="bold")
+    table.add_column("Archivo", style="cyan")
+    table.add_column("Acción")
+    for relative_path, action in sorted(plan.items()):
+        label, style = ACTIONS[action]
+        table.add_row(relative_path, f"[{style}]{label}[/{style}]")
+    return table
+
+
+def update_project(project_path, generator, render, resync, console):
+    """Actualiza un proyecto generado con `generator`.
+
+    render(options) devuelve (archivos, dependencias) y resync(project_path,
+    options, faltantes) instala lo que falte y sincroniza; debe devolver
+    (ok, error). Devuelve True si el proyecto quedó actualizado.
+    """
+    manifest = load_manifest(project_path)
+    if manifest is None:
+        console.print(f"[red]❌ {project_path} no tiene {MANIFEST_PATH.as_posix()}: no se creó con estos generadores[/red]")
+        return False
+    if manifest.get("generator") != generator:
+        console.print(f"[red]❌ El proyecto se creó con {manifest.get('generator')}.py, no con {generator}.py[/red]")
+        return False
+
+    # Las plantillas externas pueden fallar al obtenerse (sin red, sin acceso)
+    from comandos.template_sources import TemplateSourceError
+
+    options = manifest["options"]
+    try:
+        files, dependencies = render(options)
+    except TemplateSourceError as e:
+        console.print(f"[red]✗ No se pudo renderizar la plantilla externa: {e}[/red]")
+        return False
+    plan = plan_update(project_path, files, manifest)
+    console.print(plan_table(plan))
+
+    to_write = [path for path, action in plan.items() if action in ("new", "update")]
+    write_files(project_path, files, only=to_write)
+    if to_write:
+        console.print(f"[green]✓[/green] {len(to_write)} archivo(s) actualizados")
+    else:
+        console.print("[green]✓[/green] Los archivos de plantilla ya estaban al día")
+
+    # Solo se sincroniza si cambió lo que se pidió instalar o lo que lo fija
+    ok = True
+    if dependency_hash(project_path, dependencies) != manifest.get("dependency_hash"):
+        missing = missing_dependencies(manifest.get("dependencies", {}), dependencies)
+        with console.status("[bold green]Las dependencias cambiaron, sincronizando el entorno..."):
+            ok, error = resync(project_path, options, missing)
+        if ok:
+            console.print("[green]✓[/green] Entorno sincronizado")
+        else:
+            console.print("[red]✗[/red] Error sincronizando el entorno")
+            console.print(f"[dim]{error}[/dim]")
+    else:
+        console.print("[green]✓[/green] Las dependencias no cambiaron, no hace falta sincronizar")
+
+    save_manifest(project_path, generator, options, files, dependencies, previous=manifest, synced=ok)
+    return ok
+
+
+def parse_args(description, argv=None, prog=None):
+    """Argumentos de los generadores: sin subcomando crean un proyecto nuevo."""
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    subparsers = parser.add_subparsers(dest="command")
+    parser.add_argument(
+        "--plantilla", metavar="FUENTE",
+        help="plantilla externa que se aplica encima: directorio o repositorio git (URL[#rama])",
+    )
+    update_parser = subparsers.add_parser("update", help="aplica las plantillas actuales a un proyecto existente")
+    update_parser.add_argument("ruta", nargs="?", default=".", help="proyecto a actualizar (por defecto, el directorio actual)")
+    return parser.parse_args(argv)
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Comparador de backends: construye el mismo proyecto con UV y con pip
+"""
+import sys
+
+from comandos.compare import main
+
+if __name__ == "__main__":
+    sys.exit(main())
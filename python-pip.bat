@@ -1,4 +1,4 @@
 @echo off
-rem Nota: Este script requiere 'rich' instalado globalmente
-rem Instalar con: pip install rich
-python "C:\comandos\python-pip.py" 
\ No newline at end of file
+rem Nota: Este script requiere la orden "comandos" instalada
+rem Instalar con: uv tool install . (o pipx install .) desde este repositorio
+comandos python pip %*
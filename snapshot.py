@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Instantáneas portables: empaqueta un proyecto con su entorno y lo restaura
+"""
+import sys
+
+from comandos.snapshot import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import zipfile
+
+import pytest
+
+from comandos.tuning import load_tuning
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path, monkeypatch):
+    """Cada test usa su propia caché de comandos, nunca la del usuario."""
+    root = tmp_path / "cache"
+    monkeypatch.setenv("COMANDOS_CACHE_DIR", str(root))
+    load_tuning.cache_clear()
+    yield root
+    load_tuning.cache_clear()
+
+
+def build_wheel(directory, name, version="1.0", requires=()):
+    """Escribe una rueda pura mínima (sin red ni herramientas de construcción)."""
+    module = name.replace("-", "_")
+    dist_info = f"{module}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {requirement}\n" for requirement in requires)
+    files = {
+        f"{module}/__init__.py": f'VERSION = "{version}"\n',
+        f"{dist_info}/METADATA": metadata,
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nGenerator: tests\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    record = "".join(f"{path},,\n" for path in files) + f"{dist_info}/RECORD,,\n"
+    path = directory / f"{module}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(path, "w") as archive:
+        for member, content in {**files, f"{dist_info}/RECORD": record}.items():
+            archive.writestr(member, content)
+    return path
+
+
+@pytest.fixture
+def wheelhouse(tmp_path):
+    """Wheelhouse local con dos paquetes: paquete-base y paquete-app, que depende de él."""
+    directory = tmp_path / "wheels"
+    directory.mkdir()
+    build_wheel(directory, "paquete-base")
+    build_wheel(directory, "paquete-app", requires=["paquete-base"])
+    return directory
+
+
+@pytest.fixture
+def offline(wheelhouse, tmp_path, monkeypatch):
+    """pip y UV instalan solo desde el wheelhouse, con cachés propias."""
+    config = tmp_path / "uv.toml"
+    config.write_text(f'no-index = true\nfind-links = ["{wheelhouse.as_posix()}"]\n', encoding="utf-8")
+    monkeypatch.setenv("UV_CONFIG_FILE", str(config))
+    monkeypatch.setenv("UV_CACHE_DIR", str(tmp_path / "uv-cache"))
+    monkeypatch.setenv("PIP_NO_INDEX", "1")
+    monkeypatch.setenv("PIP_FIND_LINKS", str(wheelhouse))
+    monkeypatch.setenv("PIP_CACHE_DIR", str(tmp_path / "pip-cache"))
+    monkeypatch.setenv("PIP_DISABLE_PIP_VERSION_CHECK", "1")
+    return wheelhouse
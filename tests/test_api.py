@@ -0,0 +1,90 @@
+import asyncio
+import json
+import shutil
+
+import pytest
+
+from comandos.api import complete_spec, create_project, create_projects
+
+
+def collect(events):
+    async def run():
+        return [event async for event in events]
+
+    return asyncio.run(run())
+
+
+def test_complete_spec_fills_defaults(tmp_path):
+    spec = complete_spec({"generator": "streamlit-uv", "name": " panel ", "directory": tmp_path})
+    assert spec["path"] == tmp_path.resolve() / "panel"
+    assert spec["template"] == "basica"
+    assert spec["lazy_env"] is False
+    assert spec["packages"] == []
+
+
+@pytest.mark.parametrize("spec,message", [
+    ({"generator": "rust-cargo", "name": "x"}, "generador desconocido"),
+    ({"generator": "python-pip", "name": "x", "lazy_env": True}, "lazy_env"),
+    ({"generator": "python-uv", "name": "x", "template": "basica"}, "template"),
+    ({"generator": "python-uv", "name": "  "}, "vacío"),
+])
+def test_complete_spec_rejects_invalid_specs(spec, message, tmp_path):
+    with pytest.raises(ValueError, match=message):
+        complete_spec({"directory": tmp_path, **spec})
+
+
+def test_complete_spec_rejects_existing_projects(tmp_path):
+    (tmp_path / "existe").mkdir()
+    with pytest.raises(ValueError, match="ya existe"):
+        complete_spec({"generator": "python-uv", "name": "existe", "directory": tmp_path})
+
+
+def test_create_projects_rejects_duplicate_paths(tmp_path):
+    spec = {"generator": "python-uv", "name": "doble", "directory": tmp_path}
+    with pytest.raises(ValueError, match="mismo proyecto"):
+        collect(create_projects([spec, dict(spec)]))
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_concurrent_creations_emit_ordered_events(offline, tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    specs = [
+        {"generator": "python-uv", "name": "uno", "directory": tmp_path, "packages": ["paquete-app"]},
+        {"generator": "python-uv", "name": "dos", "directory": tmp_path, "lazy_env": True, "git": False},
+    ]
+    events = collect(create_projects(specs))
+
+    for name, steps in [("uno", ["project", "deps", "venv", "git", "manifest"]), ("dos", ["project", "venv", "manifest"])]:
+        own = [event for event in events if event["project"] == name]
+        assert [event["step"] for event in own if event["type"] == "step_started"] == steps
+        finished = [event for event in own if event["type"] == "step_finished"]
+        assert [event["step"] for event in finished] == steps
+        assert all(event["ok"] and event["error"] is None for event in finished)
+        assert own[-1]["type"] == "finished" and own[-1]["ok"] and own[-1]["error"] is None
+        manifest = json.loads((tmp_path / name / ".comandos" / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["options"] == own[-1]["options"]
+
+    assert (tmp_path / "uno" / ".venv").is_dir() and (tmp_path / "uno" / ".git").is_dir()
+    assert not (tmp_path / "dos" / ".venv").exists()
+    assert any(event["type"] == "output" and event["project"] == "uno" for event in events)
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_failed_step_is_reported(offline, tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    spec = {"generator": "python-uv", "name": "roto", "directory": tmp_path, "packages": ["no-existe"], "git": False}
+    events = collect(create_project(spec))
+
+    deps = next(event for event in events if event["type"] == "step_finished" and event["step"] == "deps")
+    assert not deps["ok"]
+    assert "no-existe" in deps["error"]
+    assert events[-1]["type"] == "finished" and not events[-1]["ok"]
+
+
+def test_failure_outside_the_steps_is_reported(tmp_path):
+    (tmp_path / "archivo").write_text("", encoding="utf-8")
+    spec = {"generator": "python-pip", "name": "x", "directory": tmp_path / "archivo" / "dentro"}
+    events = collect(create_project(spec))
+    assert [event["type"] for event in events] == ["finished"]
+    assert not events[0]["ok"]
+    assert "archivo" in events[0]["error"]
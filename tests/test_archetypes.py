@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+from comandos.archetypes import ARCHETYPE_CHOICES, render_archetype, startup_args, usage_rows
+from comandos.generators import python_pip
+from comandos.update import write_files
+
+ARCHETYPES = [archetype for archetype in ARCHETYPE_CHOICES if archetype != "basico"]
+
+
+def python(project, *args):
+    return subprocess.run([sys.executable, *args], cwd=project, capture_output=True, text=True, timeout=120)
+
+
+@pytest.fixture
+def make_project(tmp_path):
+    def make(archetype):
+        project = tmp_path / archetype
+        write_files(project, render_archetype(archetype, "pip"))
+        return project
+
+    return make
+
+
+@pytest.mark.parametrize("archetype", ARCHETYPES)
+def test_archetype_demo_and_startup(make_project, archetype):
+    project = make_project(archetype)
+    assert python(project, "-c", "import main; main.demo()").returncode == 0
+    assert python(project, *startup_args(archetype)).returncode == 0
+    assert usage_rows(archetype, "uv")[-1][0] == f"uv run benchmarks/bench_{archetype}.py"
+
+
+def test_cli_imports_stay_lazy(make_project):
+    project = make_project("cli")
+    result = python(project, "main.py", "saludo", "Ana")
+    assert result.returncode == 0 and "Ana" in result.stdout
+    result = python(project, "benchmarks/bench_cli.py", "--repeticiones", "2")
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_batch_pool_matches_serial(make_project):
+    project = make_project("lotes")
+    assert python(project, "main.py", "--generar", "2500", "entrada.csv").returncode == 0
+    result = python(project, "main.py", "entrada.csv", "pool.csv", "--procesos", "2", "--bloque", "300")
+    assert result.returncode == 0 and result.stdout.startswith("2500 filas"), result.stderr
+    assert python(project, "-c", "import main; main.run_serial('entrada.csv', 'serie.csv', 300)").returncode == 0
+    assert (project / "pool.csv").read_text() == (project / "serie.csv").read_text()
+
+
+def test_generator_uses_archetype_files():
+    files = python_pip.render_base("demo", "servicio")
+    assert files["main.py"] == render_archetype("servicio", "pip")["main.py"]
+    with pytest.raises(ValueError):
+        render_archetype("otro", "pip")
@@ -0,0 +1,34 @@
+import sys
+import threading
+
+import pytest
+
+from comandos.background import BackgroundTasks, run_quiet
+
+
+def test_tasks_run_concurrently():
+    tasks = BackgroundTasks()
+    barrier = threading.Barrier(2, timeout=5)
+    # Si los pasos corrieran de uno en uno, la barrera nunca se abriría
+    tasks.start("a", barrier.wait)
+    tasks.start("b", barrier.wait)
+    assert tasks.started("a")
+    assert {tasks.join("a"), tasks.join("b")} == {0, 1}
+    assert not tasks.started("a")
+    tasks.shutdown()
+
+
+def test_join_reraises():
+    tasks = BackgroundTasks()
+    tasks.start("falla", int, "no es un número")
+    with pytest.raises(ValueError):
+        tasks.join("falla")
+    tasks.shutdown()
+
+
+def test_run_quiet_reports_errors():
+    assert run_quiet([sys.executable, "-c", "pass"]) == (True, "")
+    ok, error = run_quiet([sys.executable, "-c", "import sys; sys.exit('roto')"])
+    assert not ok and error == "roto"
+    ok, error = run_quiet(["comandos-no-existe"])
+    assert not ok and "comandos-no-existe" in error
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from comandos.benchmarking import find_entry_module, render_harness, write_harness
+
+
+def test_find_entry_module(tmp_path):
+    assert find_entry_module(tmp_path) is None
+    (tmp_path / "src" / "paquete").mkdir(parents=True)
+    (tmp_path / "src" / "paquete" / "__init__.py").write_text("", encoding="utf-8")
+    assert find_entry_module(tmp_path) == "paquete"
+    (tmp_path / "main.py").write_text("", encoding="utf-8")
+    assert find_entry_module(tmp_path) == "main"
+
+
+def test_render_harness_uses_backend_commands():
+    uv = render_harness("main", "uv")
+    pip = render_harness("main", "pip")
+    assert "uv run pytest benchmarks" in uv["benchmarks/README.md"]
+    assert "python -m pytest benchmarks" in pip["benchmarks/README.md"]
+    for files in (uv, pip):
+        for path, content in files.items():
+            if path.endswith(".py"):
+                compile(content, path, "exec")
+
+
+def test_write_harness_skips_invalid_module(tmp_path):
+    (tmp_path / "src" / "mi-paquete").mkdir(parents=True)
+    (tmp_path / "src" / "mi-paquete" / "__init__.py").write_text("", encoding="utf-8")
+    assert write_harness(tmp_path, "pip") is None
+    assert not (tmp_path / "profiling.py").exists()
+
+
+def test_profiling_script_runs(tmp_path):
+    (tmp_path / "main.py").write_text("def main():\n    return sum(range(1000))\n", encoding="utf-8")
+    assert write_harness(tmp_path, "pip") == "main"
+    result = subprocess.run(
+        [sys.executable, "profiling.py", "--limit", "3"], cwd=tmp_path, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Perfil guardado en" in result.stdout
+    assert list((tmp_path / ".profiles").glob("main-*.prof"))
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+from comandos import selfcheck
+from comandos.cli import GENERATORS, TOOLS
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return selfcheck._median_ms([sys.executable, "-c", "pass"], 3)
+
+
+def test_help_lists_every_command():
+    result = subprocess.run([sys.executable, "-m", "comandos", "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    for command in ["python", "streamlit", *TOOLS]:
+        assert command in result.stdout
+
+
+def test_help_stays_within_budget(baseline):
+    _, overhead, leaked = selfcheck.check_command(["--help"], selfcheck.HEAVY_PREFIXES, 3, baseline)
+    assert leaked == []
+    assert overhead <= 100
+
+
+@pytest.mark.parametrize("kind,backend", list(GENERATORS))
+def test_generator_help_stays_within_budget(kind, backend, baseline):
+    others = tuple(module for module in GENERATORS.values() if module != GENERATORS[kind, backend])
+    _, overhead, leaked = selfcheck.check_command([kind, backend, "--help"], others, 3, baseline)
+    assert leaked == []
+    assert overhead <= 400
+
+
+def test_unknown_command_fails():
+    result = subprocess.run([sys.executable, "-m", "comandos", "ruby"], capture_output=True, text=True)
+    assert result.returncode == 2
@@ -0,0 +1,42 @@
+import json
+import shutil
+
+import pytest
+
+from comandos import compare
+from comandos.generators import python_pip, python_uv, streamlit_uv
+
+
+def test_steps_come_from_generators(tmp_path):
+    project_path, steps = compare.uv_steps("python", ["six"], tmp_path)
+    assert project_path == tmp_path / compare.PROJECT_NAME
+    assert [command for command, _ in steps] == [
+        python_uv.init_command(compare.PROJECT_NAME), python_uv.add_command(["six"]), python_uv.sync_command(),
+    ]
+    _, steps = compare.uv_steps("streamlit", ["streamlit"], tmp_path)
+    assert [command for command, _ in steps] == [streamlit_uv.add_command(["streamlit"]), streamlit_uv.sync_command()]
+    _, steps = compare.pip_steps("python", ["six"], tmp_path)
+    assert [command for command, _ in steps] == [
+        python_pip.venv_command(), python_pip.install_command(project_path, ["six"]),
+    ]
+
+
+def test_missing_wheelhouse(tmp_path):
+    assert compare.main(["--wheelhouse", str(tmp_path / "no-existe")]) == 1
+
+
+def test_missing_uv(wheelhouse, tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert compare.main(["--wheelhouse", str(wheelhouse), "--repeats", "1"]) == 1
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_compare_builds_both_backends(wheelhouse, tmp_path):
+    output = tmp_path / "resultados.json"
+    args = ["--wheelhouse", str(wheelhouse), "--packages", "paquete-app", "--repeats", "1", "--cold", "--json", str(output)]
+    assert compare.main(args) == 0
+    results = json.loads(output.read_text(encoding="utf-8"))["results"]
+    assert set(results) == {"uv", "pip"}
+    for runs in results.values():
+        assert len(runs) == 1
+        assert runs[0]["wall"] > 0 and runs[0]["files"] > 0
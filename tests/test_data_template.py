@@ -0,0 +1,75 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from comandos.streamlit_templates import render_template
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("streamlit")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for path, content in render_template("datos", "uv").items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    sys.modules.pop("datos", None)
+
+
+@pytest.fixture
+def datos(project):
+    module = importlib.import_module("datos")
+    module.write_sample(1_000, row_group_size=300)
+    return module
+
+
+def run_app(project):
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(str(project / "app.py"), default_timeout=60).run()
+
+
+def test_app_without_data_explains_how_to_add_it(project):
+    app = run_app(project)
+    assert not app.exception
+    assert app.info or app.warning
+
+
+def test_app_with_sample_data(project, datos):
+    app = run_app(project)
+    assert not app.exception
+
+
+def test_pages_span_row_groups(datos):
+    assert [rows for _, _, rows in datos.row_groups()] == [300, 300, 300, 100]
+    assert datos.total_rows() == 1_000
+    page = datos.read_page(("id", "valor"), 1, 250)
+    assert list(page.columns) == ["id", "valor"]
+    assert page["id"].tolist() == list(range(250, 500))
+    assert datos.read_page(("id",), 10, 250).empty
+
+
+def test_filters_are_pushed_down(datos):
+    assert datos.count_matching("id", 900) == 100
+    assert datos.count_matching(None, 0) == 1_000
+    assert set(datos.grouped("categoria", "valor", "id", 0)["categoria"]) <= {"A", "B", "C", "D"}
+
+
+def test_csv_to_parquet(project):
+    import pyarrow.parquet as pq
+
+    source = project / "ventas.csv"
+    source.write_text("id,valor\n" + "".join(f"{i},{i * 0.5}\n" for i in range(500)), encoding="utf-8")
+    target = project / "data" / "parquet" / "ventas.parquet"
+    result = subprocess.run(
+        [sys.executable, "csv_a_parquet.py", str(source), "--grupo", "200"], cwd=project, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    metadata = pq.ParquetFile(target).metadata
+    assert metadata.num_rows == 500
+    assert metadata.num_row_groups >= 3
@@ -0,0 +1,134 @@
+import os
+import sys
+
+import pytest
+
+from comandos.hooks import HookRunner, load_hooks
+
+GENERATOR = "python-uv"
+
+
+def write_config(tmp_path, text):
+    path = tmp_path / "hooks.toml"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def append(name, seconds=0):
+    """Hook que espera y anota su nombre en orden.txt."""
+    code = f"import time; time.sleep({seconds}); open('orden.txt', 'a').write('{name}\\n')"
+    return [sys.executable, "-c", code]
+
+
+def hook(name, run, after=("project",), timeout=None):
+    return {"name": name, "run": run, "after": list(after), "timeout": timeout}
+
+
+def test_load_hooks_filters_by_generator(tmp_path):
+    path = write_config(tmp_path, """
+[[hook]]
+name = "todos"
+run = "echo hola"
+
+[[hook]]
+run = ["echo", "pip"]
+after = "venv"
+generators = ["python-pip"]
+""")
+    assert load_hooks(GENERATOR, path) == [hook("todos", "echo hola")]
+    assert load_hooks("python-pip", path)[1] == hook("hook-2", ["echo", "pip"], after=["venv"])
+    assert load_hooks(GENERATOR, tmp_path / "no-existe.toml") == []
+
+
+@pytest.mark.parametrize("text,message", [
+    ("[[hook]]\nname = 'a'\n", "necesita 'run'"),
+    ("[[hook]]\nname = 'a'\nrun = 'x'\n[[hook]]\nname = 'a'\nrun = 'y'\n", "mismo nombre"),
+    ("[[hook]]\nname = 'a'\nrun = 'x'\nafter = ['compilar']\n", "pasos desconocidos: compilar"),
+    ("[[hook]]\nname = 'a'\nrun = 'x'\nafter = ['b']\n[[hook]]\nname = 'b'\nrun = 'y'\nafter = ['a']\n", "ciclo"),
+    ("[[hook]\n", "hooks.toml"),
+    ("[[hook]]\nname = 'git'\nrun = 'x'\n", "paso integrado"),
+    # Un hook de otro generador también se valida
+    ("[[hook]]\nname = 'a'\nrun = 'x'\nafter = ['nada']\ngenerators = ['python-pip']\n", "pasos desconocidos: nada"),
+])
+def test_load_hooks_rejects_invalid_config(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        load_hooks(GENERATOR, write_config(tmp_path, text))
+
+
+def test_hooks_depending_on_another_generator_are_skipped(tmp_path):
+    path = write_config(tmp_path, """
+[[hook]]
+name = "depende"
+run = "x"
+after = ["solo-pip"]
+
+[[hook]]
+name = "solo-pip"
+run = "y"
+generators = ["python-pip"]
+
+[[hook]]
+name = "encadenado"
+run = "z"
+after = ["depende", "git"]
+
+[[hook]]
+name = "suelto"
+run = "w"
+
+[[hook]]
+name = "ninguno"
+run = "v"
+generators = []
+""")
+    warnings = []
+    assert load_hooks(GENERATOR, path, warnings.append) == [hook("suelto", "w")]
+    assert len(warnings) == 2
+    assert "'depende'" in warnings[0] and "solo-pip" in warnings[0]
+    assert "'encadenado'" in warnings[1]
+    assert [item["name"] for item in load_hooks("python-pip", path)] == ["depende", "solo-pip", "encadenado", "suelto"]
+
+
+def test_hooks_follow_their_dependencies(tmp_path):
+    hooks = [
+        hook("tercero", append("tercero"), after=["segundo"]),
+        hook("segundo", append("segundo"), after=["primero", "git"]),
+        hook("primero", append("primero", 0.2), after=["venv"]),
+    ]
+    runner = HookRunner(hooks, tmp_path, dict(os.environ))
+    runner.step_done("project")
+    runner.step_done("venv")
+    runner.step_done("git")
+    results = runner.finish()
+    assert [result["status"] for result in results] == ["ok", "ok", "ok"]
+    assert (tmp_path / "orden.txt").read_text().split() == ["primero", "segundo", "tercero"]
+
+
+def test_independent_hooks_run_in_parallel(tmp_path):
+    hooks = [hook(f"h{index}", append(f"h{index}", 0.5)) for index in range(4)]
+    runner = HookRunner(hooks, tmp_path, dict(os.environ))
+    runner.step_done("project")
+    results = runner.finish()
+    assert all(result["status"] == "ok" for result in results)
+    # Cada hook tarda 0,5 s: de uno en uno serían al menos 2 s
+    assert max(result["wall"] for result in results) < 1.5
+    assert sorted((tmp_path / "orden.txt").read_text().split()) == ["h0", "h1", "h2", "h3"]
+
+
+def test_failures_skip_only_dependents(tmp_path):
+    hooks = [
+        hook("falla", [sys.executable, "-c", "raise SystemExit('roto')"]),
+        hook("depende", append("depende"), after=["falla"]),
+        hook("sin-deps", append("sin-deps")),
+        hook("lento", [sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5),
+        hook("sin-git", append("sin-git"), after=["git"]),
+    ]
+    runner = HookRunner(hooks, tmp_path, dict(os.environ))
+    runner.step_done("project")
+    results = {result["name"]: result for result in runner.finish()}
+    assert results["falla"]["status"] == "error" and results["falla"]["error"] == "roto"
+    assert results["depende"]["status"] == "skipped"
+    assert results["sin-deps"]["status"] == "ok"
+    assert results["lento"]["status"] == "timeout"
+    # finish() da por fallidos los pasos integrados que no se anunciaron
+    assert results["sin-git"]["status"] == "skipped"
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+from comandos.inventory import main, open_index, scan
+
+UV_LOCK = """version = 1
+
+[[package]]
+name = "demo"
+version = "0.1.0"
+source = { virtual = "." }
+
+[[package]]
+name = "Requests"
+version = "2.32.3"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+
+def make_project(path, generator, files=None):
+    manifest = {"generator": generator, "options": {"name": path.name}, "dependencies": {"main": ["requests"]}}
+    for name, content in {".comandos/manifest.json": json.dumps(manifest), **(files or {})}.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "proyectos"
+    make_project(root / "uv-app", "python-uv", {"uv.lock": UV_LOCK, ".python-version": "3.12\n"})
+    make_project(root / "grupo" / "pip-app", "python-pip", {
+        "requirements.txt": "requests\n",
+        ".venv/pyvenv.cfg": "home = /usr/bin\nversion_info = 3.11.7\n",
+        ".venv/lib/python3.11/site-packages/requests-2.31.0.dist-info/METADATA": "Name: requests\n",
+    })
+    # Ni los directorios ocultos ni node_modules se recorren
+    make_project(root / ".oculto" / "x", "python-uv")
+    make_project(root / "node_modules" / "y", "python-uv")
+    return root
+
+
+def test_scan_indexes_projects(tree, tmp_path):
+    db = open_index(tmp_path / "indice.sqlite")
+    summary = scan(db, [tree], workers=4)
+    assert (summary["projects"], summary["new"], summary["updated"]) == (2, 2, 0)
+
+    rows = dict(db.execute("SELECT name, python FROM projects"))
+    assert rows == {"uv-app": "3.12", "pip-app": "3.11.7"}
+    packages = db.execute("SELECT p.name, k.name, k.version FROM packages k JOIN projects p ON p.path = k.project")
+    # En uv.lock no cuenta el propio proyecto; con pip manda lo instalado en .venv
+    assert sorted(packages) == [("pip-app", "requests", "2.31.0"), ("uv-app", "requests", "2.32.3")]
+    venv_size = db.execute("SELECT venv_size FROM projects WHERE name = 'pip-app'").fetchone()[0]
+    assert venv_size > 0
+
+
+def test_rescan_only_inspects_changes(tree, tmp_path):
+    db = open_index(tmp_path / "indice.sqlite")
+    scan(db, [tree], workers=4)
+    summary = scan(db, [tree], workers=4)
+    assert (summary["new"], summary["updated"], summary["removed"]) == (0, 0, 0)
+    assert scan(db, [tree], workers=4, full=True)["updated"] == 2
+
+    lock = tree / "uv-app" / "uv.lock"
+    lock.write_text(UV_LOCK.replace("2.32.3", "2.32.4"), encoding="utf-8")
+    stat = lock.stat()
+    os.utime(lock, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    summary = scan(db, [tree], workers=4)
+    assert (summary["new"], summary["updated"]) == (0, 1)
+    assert db.execute("SELECT version FROM packages WHERE name = 'requests' AND project LIKE '%uv-app'").fetchone() == ("2.32.4",)
+
+    (tree / "grupo" / "pip-app" / ".comandos" / "manifest.json").unlink()
+    assert scan(db, [tree], workers=4)["removed"] == 1
+    # Los proyectos de otras raíces no se tocan al escanear una sola
+    assert scan(db, [tree / "grupo"], workers=4)["removed"] == 0
+    assert db.execute("SELECT COUNT(*) FROM projects").fetchone() == (1,)
+
+
+def test_list_by_package(tree, tmp_path, capsys):
+    index = str(tmp_path / "indice.sqlite")
+    assert main(["--indice", index, "scan", str(tree)]) == 0
+    capsys.readouterr()
+    assert main(["--indice", index, "list", "--paquete", "Requests", "--json"]) == 0
+    records = json.loads(capsys.readouterr().out)
+    assert {(record["name"], record["version"]) for record in records} == {("uv-app", "2.32.3"), ("pip-app", "2.31.0")}
+    assert all(record["generator"] for record in records)
+
+
+def test_scan_rejects_missing_roots(tmp_path):
+    assert main(["--indice", str(tmp_path / "indice.sqlite"), "scan", str(tmp_path / "no-existe")]) == 1
@@ -0,0 +1,61 @@
+import shutil
+import subprocess
+
+import pytest
+
+from comandos.layers import create_layered_venv, ensure_base, install_layer, linked_base, read_base
+from comandos.startup import venv_python
+from conftest import build_wheel
+
+
+@pytest.fixture
+def streamlit_wheelhouse(offline):
+    """Un "streamlit" de prueba que fija paquete-base 1.0, y paquetes que piden la 2.0."""
+    build_wheel(offline, "streamlit", requires=["paquete-base==1.0"])
+    build_wheel(offline, "paquete-base", version="2.0")
+    build_wheel(offline, "paquete-nuevo", requires=["paquete-base>=2"])
+    return offline
+
+
+def backends():
+    return ["pip", pytest.param("uv", marks=pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado"))]
+
+
+def imports(project, code):
+    return subprocess.run([str(venv_python(project / ".venv")), "-c", code], capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("backend", backends())
+def test_base_is_built_once_and_shared(streamlit_wheelhouse, backend):
+    base, error = ensure_base(backend)
+    assert base is not None, error
+    assert read_base(base)["packages"] == {"streamlit": "1.0", "paquete-base": "1.0"}
+    assert base.name == "streamlit-1.0"
+    assert ensure_base(backend) == (base, None)
+
+
+@pytest.mark.parametrize("backend", backends())
+def test_layer_only_holds_what_the_base_lacks(streamlit_wheelhouse, tmp_path, backend):
+    project = tmp_path / "app"
+    project.mkdir()
+    step, ok, error = create_layered_venv(project, backend)
+    assert (step, ok) == ("venv", True), error
+    assert linked_base(project / ".venv") == ensure_base(backend)[0]
+
+    result = install_layer(project, backend, ["streamlit", "paquete-app"])
+    assert result["ok"], result["error"]
+    assert result["installed"] == [("paquete-app", "1.0")]
+    assert result["conflicts"] == []
+    check = imports(project, "import paquete_app, paquete_base, streamlit; print(paquete_base.VERSION)")
+    assert check.stdout.strip() == "1.0", check.stderr
+
+
+@pytest.mark.parametrize("backend", backends())
+def test_conflicting_versions_shadow_the_base(streamlit_wheelhouse, tmp_path, backend):
+    project = tmp_path / "app"
+    project.mkdir()
+    create_layered_venv(project, backend)
+    result = install_layer(project, backend, ["paquete-nuevo"])
+    assert result["ok"], result["error"]
+    assert result["conflicts"] == [("paquete-base", "2.0", "1.0")]
+    assert imports(project, "import paquete_base; print(paquete_base.VERSION)").stdout.strip() == "2.0"
@@ -0,0 +1,50 @@
+import shutil
+import subprocess
+import tomllib
+
+import pytest
+
+from comandos.generators import python_uv
+
+pytestmark = pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+
+
+@pytest.fixture
+def project(offline, tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    ok, error = python_uv.create_project("diferido", cwd=tmp_path)
+    assert ok, error
+    return tmp_path / "diferido"
+
+
+def dependencies(project):
+    return tomllib.loads((project / "pyproject.toml").read_text(encoding="utf-8"))["project"]["dependencies"]
+
+
+def test_lazy_mode_only_writes_the_lock(project):
+    python_uv.add_dependencies(project, ["paquete-app"], lazy=True)
+    ok, error = python_uv.sync_environment(project, lazy=True)
+    assert ok, error
+    assert dependencies(project) == ["paquete-app>=1.0"]
+    assert "paquete-base" in (project / "uv.lock").read_text(encoding="utf-8")
+    assert not (project / ".venv").exists()
+
+    # El entorno aparece en el primer uv run
+    result = subprocess.run(
+        ["uv", "run", "python", "-c", "import paquete_app"], cwd=project, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert (project / ".venv").is_dir()
+
+
+def test_resync_of_a_lazy_project_stays_lazy(project):
+    options = {"workspace": False, "lazy_env": True}
+    ok, error = python_uv.resync_environment(project, options, {"main": ["paquete-base"], "dev": []})
+    assert ok, error
+    assert dependencies(project) == ["paquete-base>=1.0"]
+    assert not (project / ".venv").exists()
+
+
+def test_eager_mode_creates_the_environment(project):
+    python_uv.add_dependencies(project, ["paquete-base"])
+    assert (project / ".venv").is_dir()
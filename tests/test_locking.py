@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from comandos.locking import COMPLETE_MARKER, file_lock, installer_slot, max_parallel_installs, single_flight
+
+# Construye la entrada en otro proceso y anota cada construcción en builds.txt
+BUILD_SCRIPT = """
+import sys, time
+from pathlib import Path
+from comandos.locking import single_flight
+
+def build(entry):
+    with open(entry.parent / "builds.txt", "a") as f:
+        f.write("x")
+    time.sleep(0.3)
+    return True
+
+sys.exit(0 if single_flight(Path(sys.argv[1]), build) else 1)
+"""
+
+
+def test_single_flight_builds_once_across_threads(tmp_path):
+    builds = []
+
+    def build(entry):
+        builds.append(entry)
+        time.sleep(0.2)
+        (entry / "dato").write_text("listo", encoding="utf-8")
+        return True
+
+    entry = tmp_path / "entrada"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: single_flight(entry, build), range(4)))
+    assert results == [True] * 4
+    assert len(builds) == 1
+    assert (entry / COMPLETE_MARKER).exists()
+
+
+def test_single_flight_builds_once_across_processes(tmp_path):
+    entry = tmp_path / "entrada"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    processes = [
+        subprocess.Popen([sys.executable, "-c", BUILD_SCRIPT, str(entry)], env=env) for _ in range(3)
+    ]
+    assert [process.wait() for process in processes] == [0, 0, 0]
+    assert (tmp_path / "builds.txt").read_text() == "x"
+
+
+def test_single_flight_retries_failed_and_expired_entries(tmp_path):
+    entry = tmp_path / "entrada"
+    assert not single_flight(entry, lambda path: False)
+    assert single_flight(entry, lambda path: True)
+    # Sin caducidad se reutiliza; con caducidad 0 se vuelve a construir
+    assert single_flight(entry, lambda path: False, max_age=None)
+    assert not single_flight(entry, lambda path: False, max_age=0)
+
+
+def test_file_lock_excludes_threads(tmp_path):
+    inside, overlaps = [], []
+
+    def work(_):
+        with file_lock(tmp_path / "lock"):
+            overlaps.append(len(inside))
+            inside.append(1)
+            time.sleep(0.02)
+            inside.pop()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(work, range(8)))
+    assert overlaps == [0] * 8
+
+
+def test_installer_slot_limits_concurrency(monkeypatch):
+    monkeypatch.setenv("COMANDOS_MAX_INSTALLS", "2")
+    assert max_parallel_installs() == 2
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def install(_):
+        with installer_slot():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(install, range(12)))
+    assert peak[0] == 2
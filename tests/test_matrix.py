@@ -0,0 +1,52 @@
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from comandos.matrix import build_matrix, env_path, find_interpreter, parse_versions, relax_requires_python
+from comandos.startup import venv_python
+
+CURRENT = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def test_parse_versions():
+    assert parse_versions("3.13, 3.9 3.12 3.9 2.7 tres 3.10") == ["3.9", "3.10", "3.12", "3.13"]
+    assert parse_versions("") == []
+
+
+def test_relax_requires_python(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "x"\nrequires-python = ">=3.13"\n', encoding="utf-8")
+    relax_requires_python(tmp_path, ["3.11", "3.12"])
+    assert 'requires-python = ">=3.11"' in pyproject.read_text(encoding="utf-8")
+    # Si ya admite la más antigua no se toca
+    relax_requires_python(tmp_path, ["3.12"])
+    assert 'requires-python = ">=3.11"' in pyproject.read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(find_interpreter(CURRENT) is None, reason=f"python{CURRENT} no está en el PATH")
+def test_pip_matrix_builds_each_version(offline, tmp_path):
+    (tmp_path / "requirements.txt").write_text("paquete-base\n", encoding="utf-8")
+    results = build_matrix(tmp_path, "pip", [CURRENT, "3.99"])
+    assert [result["version"] for result in results] == [CURRENT, "3.99"]
+    built, missing = results
+    assert "error" not in built, built
+    assert built["create"] > 0 and built["install"] > 0 and built["wall"] >= built["create"]
+    assert missing["error"] == "no se encontró python3.99"
+    python = venv_python(env_path(tmp_path, CURRENT))
+    subprocess.run([str(python), "-c", "import paquete_base"], check=True)
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_uv_matrix_syncs_the_lock(offline, tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "matriz"\nversion = "0.1.0"\nrequires-python = ">=3.8"\ndependencies = ["paquete-base"]\n',
+        encoding="utf-8",
+    )
+    subprocess.run(["uv", "lock", "--quiet"], cwd=tmp_path, check=True)
+    (result,) = build_matrix(tmp_path, "uv", [CURRENT])
+    assert "error" not in result, result
+    python = venv_python(env_path(tmp_path, CURRENT))
+    subprocess.run([str(python), "-c", "import paquete_base"], check=True)
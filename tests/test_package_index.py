@@ -0,0 +1,72 @@
+import io
+
+import pytest
+from rich.console import Console
+
+from comandos.cache import cache_dir
+from comandos.package_index import (
+    POPULAR, build_index, complete, distance, load_index, normalize, review_packages, split_requirement, suggest,
+)
+from conftest import build_wheel
+
+INDEX = sorted({*POPULAR, "scikit-learn", "paquete-local", "requests-toolbelt"})
+
+
+@pytest.mark.parametrize("typed,expected", [
+    ("reqeusts", "requests"),
+    ("Requests", None),
+    ("sklearn", "scikit-learn"),
+    ("PyYAML", None),
+    ("yaml", "pyyaml"),
+    ("numpi", "numpy"),
+    ("paquete_locla", "paquete-local"),
+    ("six", None),
+    ("sxi", "six"),
+    ("algo-que-no-se-parece", None),
+])
+def test_suggest(typed, expected):
+    assert suggest(INDEX, typed) == expected
+
+
+def test_suggest_prefers_popular_packages():
+    assert suggest(sorted(["pandas", "pandaz"]), "pandsa") == "pandas"
+
+
+def test_distance_counts_transpositions_once():
+    assert distance("reqeusts", "requests", 2) == 1
+    assert distance("abc", "xyz", 1) == 2
+
+
+def test_complete():
+    assert complete(INDEX, "Requests") == ["requests", "requests-toolbelt"]
+    assert complete(INDEX, "zzz") == []
+
+
+def test_split_requirement():
+    assert split_requirement("httpx[http2]>=0.27") == ("httpx", "[http2]>=0.27")
+    assert split_requirement("./paquetes/propio") == (None, "./paquetes/propio")
+    assert split_requirement("git+https://example.com/x.git") == (None, "git+https://example.com/x.git")
+
+
+def test_build_index_collects_local_names(tmp_path, monkeypatch):
+    uv_cache = tmp_path / "uv"
+    (uv_cache / "simple-v16" / "pypi").mkdir(parents=True)
+    (uv_cache / "simple-v16" / "pypi" / "desde-uv.rkyv").write_bytes(b"")
+    monkeypatch.setenv("UV_CACHE_DIR", str(uv_cache))
+    monkeypatch.setenv("PIP_CACHE_DIR", str(tmp_path / "pip"))
+    wheel = build_wheel(cache_dir("wheelhouse", "cpython"), "Desde_Wheelhouse")
+
+    index = build_index()
+    assert index == sorted(index)
+    assert {"desde-uv", "desde-wheelhouse", "pytest", "requests"} <= set(index)
+    # Se reutiliza el índice guardado hasta que caduca
+    wheel.unlink()
+    assert "desde-wheelhouse" in load_index()
+
+
+def test_review_packages_applies_accepted_fixes(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("y\nn\n"))
+    console = Console(file=io.StringIO())
+    reviewed = review_packages(["reqeusts>=2", "sklearn", "rich"], INDEX, console)
+    assert reviewed == ["requests>=2", "sklearn", "rich"]
+    assert normalize("Scikit_Learn") == "scikit-learn"
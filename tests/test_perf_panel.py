@@ -0,0 +1,75 @@
+import sys
+
+import pytest
+
+from comandos.generators import streamlit_uv
+from comandos.streamlit_templates import add_perf_panel, instrument
+
+PANEL = "⏱️ Rendimiento"
+
+
+def test_instrument_scripts_and_cached_modules():
+    script = instrument('import streamlit as st\n\n@st.cache_data\ndef f():\n    pass\n\nst.write(f())\n', True)
+    assert "import perf" in script
+    assert "@perf.cache_data" in script and "@st.cache_data" not in script
+    assert script.index("perf.start()") < script.index("st.write") < script.index("perf.panel()")
+    module = instrument('import streamlit as st\n\n@st.cache_resource\ndef g():\n    pass\n', False)
+    assert "@perf.cache_resource" in module and "perf.start()" not in module
+    # Lo que no usa Streamlit se deja igual
+    assert instrument("VALOR = 1\n", True) == "VALOR = 1\n"
+
+
+@pytest.mark.parametrize("template", ["basica", "rendimiento", "datos"])
+def test_add_perf_panel_compiles(template):
+    files = add_perf_panel(streamlit_uv.render_app(template))
+    assert "perf.py" in files
+    for path, content in files.items():
+        if path.endswith(".py"):
+            compile(content, path, "exec")
+    assert "perf.panel()" in files["app.py"]
+
+
+def expanders(app):
+    return [expander.label for expander in app.expander]
+
+
+@pytest.fixture
+def run_app(tmp_path, monkeypatch):
+    testing = pytest.importorskip("streamlit.testing.v1")
+
+    def run(template, enabled):
+        monkeypatch.setenv("PERF_PANEL", "1" if enabled else "0")
+        options = {"name": "demo", "template": template, "packages": [], "perf_panel": True}
+        for path, content in streamlit_uv.render_files(options)[0].items():
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_text(content, encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        # perf.py lee PERF_PANEL al importarse
+        for name in ("perf", "datos"):
+            sys.modules.pop(name, None)
+        return testing.AppTest.from_file(str(tmp_path / "app.py"), default_timeout=60).run()
+
+    yield run
+    for name in ("perf", "datos"):
+        sys.modules.pop(name, None)
+
+
+def test_panel_is_drawn_when_enabled(run_app):
+    app = run_app("rendimiento", True)
+    assert not app.exception
+    assert PANEL in expanders(app)
+
+
+def test_panel_is_hidden_by_default(run_app):
+    app = run_app("rendimiento", False)
+    assert not app.exception
+    assert PANEL not in expanders(app)
+
+
+def test_panel_survives_st_stop(run_app):
+    pytest.importorskip("pyarrow")
+    # Sin datos, la app de la plantilla datos se detiene pronto con st.stop()
+    app = run_app("datos", True)
+    assert not app.exception
+    assert PANEL in expanders(app)
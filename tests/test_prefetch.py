@@ -0,0 +1,43 @@
+import shutil
+import sys
+
+import pytest
+
+from comandos.prefetch import Prefetcher, wheelhouse_dir
+
+
+def test_pip_prefetch_fills_wheelhouse(offline):
+    prefetcher = Prefetcher("pip", max_workers=2)
+    prefetcher.start(["paquete-app"])
+    assert prefetcher.wait("paquete-app")
+    prefetcher.shutdown()
+    entry = wheelhouse_dir() / "paquete-app"
+    # Se descargan también las dependencias
+    assert sorted(wheel.name.split("-")[0] for wheel in entry.glob("*.whl")) == ["paquete_app", "paquete_base"]
+    assert prefetcher.local_install_args(["paquete-app"]) == ["--no-index", "--find-links", str(entry)]
+
+
+def test_failed_download_gives_no_local_args(offline):
+    prefetcher = Prefetcher("pip", max_workers=2)
+    prefetcher.start(["paquete-base", "no-existe"])
+    assert not prefetcher.wait("no-existe")
+    assert prefetcher.local_install_args(["paquete-base", "no-existe"]) == []
+    prefetcher.shutdown()
+
+
+def test_unknown_package_is_not_waited():
+    prefetcher = Prefetcher("pip")
+    assert not prefetcher.wait("nunca-pedido")
+    prefetcher.shutdown()
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_uv_prefetch_fills_uv_cache(offline, tmp_path):
+    prefetcher = Prefetcher("uv", python=sys.executable, max_workers=2)
+    prefetcher.start(["paquete-app"])
+    assert prefetcher.wait("paquete-app")
+    # Solo UV tiene argumentos locales que pasar a pip
+    assert prefetcher.local_install_args(["paquete-app"]) == []
+    prefetcher.shutdown()
+    cached = {path.name.split("-")[0] for path in (tmp_path / "uv-cache").rglob("*.dist-info")}
+    assert {"paquete_app", "paquete_base"} <= cached
@@ -0,0 +1,68 @@
+import importlib.util
+import json
+import subprocess
+import sys
+
+import pytest
+
+from comandos.generators import streamlit_uv
+from comandos.rerun_bench import RERUN_BENCH_PATH, render_rerun_bench
+
+
+@pytest.mark.parametrize("template", ["basica", "rendimiento", "datos"])
+@pytest.mark.parametrize("backend", ["uv", "pip"])
+def test_render_rerun_bench_compiles(template, backend):
+    content = render_rerun_bench(template, backend)[RERUN_BENCH_PATH]
+    compile(content, RERUN_BENCH_PATH, "exec")
+    assert ("uv run" in content) == (backend == "uv")
+    assert ("Generar datos de ejemplo" in content) == (template == "datos")
+
+
+@pytest.fixture
+def project(tmp_path):
+    pytest.importorskip("streamlit.testing.v1")
+    options = {"name": "demo", "template": "basica", "packages": [], "perf_panel": False}
+    files = {**streamlit_uv.render_files(options)[0], **render_rerun_bench("basica", "uv")}
+    for path, content in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def bench(project, *args):
+    command = [
+        sys.executable, RERUN_BENCH_PATH, "--sesiones", "2", "--iteraciones", "6", "--calentamiento", "1",
+        "--sin-memoria", *args,
+    ]
+    return subprocess.run(command, cwd=project, capture_output=True, text=True, timeout=300)
+
+
+def test_compare_reports_regressions(project):
+    spec = importlib.util.spec_from_file_location("bench_reruns", project / RERUN_BENCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    baseline = {"p95_ms": 10.0, "memory_growth": 0}
+    assert module.compare({"p95_ms": 11.0, "memory_growth": 1000}, baseline, 0.2) == []
+    failed = module.compare({"p95_ms": 13.0, "memory_growth": 4 * 1024 * 1024}, baseline, 0.2)
+    assert len(failed) == 2 and "p95" in failed[0] and "memoria" in failed[1]
+    assert module.compare({"p95_ms": 1.0, "memory_growth": None}, baseline, 0.2) == []
+    assert module.percentile([1, 2, 3, 4, 5], 50) == 3
+
+
+def test_baseline_round_trip(project):
+    result = bench(project, "--guardar-base")
+    assert result.returncode == 0, result.stdout + result.stderr
+    baseline_path = project / "benchmarks" / "reruns_base.json"
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    assert baseline["iterations"] == 6 and baseline["memory_growth"] is None
+
+    # Una línea base imposible de igualar es una regresión
+    baseline_path.write_text(json.dumps({**baseline, "p95_ms": 0.001}), encoding="utf-8")
+    result = bench(project)
+    assert result.returncode == 1, result.stdout + result.stderr
+    assert "✗ p95" in result.stdout
+
+    # Con otros parámetros no se compara
+    result = bench(project, "--semilla", "7")
+    assert result.returncode == 0
+    assert "otros parámetros" in result.stdout
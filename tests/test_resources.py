@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from comandos import resources
+
+MEGABYTES = 50
+
+
+def test_run_records_usage():
+    script = f"data = bytearray({MEGABYTES} * 1024 * 1024); sum(range(10**6)); print('hecho')"
+    result = resources.run([sys.executable, "-c", script], capture_output=True, text=True, step="prueba")
+    assert result.returncode == 0 and result.stdout.strip() == "hecho"
+    record = result.resources
+    assert record["step"] == "prueba"
+    assert record in resources.records()
+    if record["max_rss"] is not None:
+        assert record["max_rss"] >= MEGABYTES * 1024 * 1024
+        assert record["user"] + record["sys"] > 0
+
+
+def test_step_name():
+    assert resources.step_name(["/usr/bin/uv", "pip", "install", "six"]) == "uv pip install"
+    assert resources.step_name("git status") == "git"
+
+
+def test_check_raises():
+    with pytest.raises(subprocess.CalledProcessError):
+        resources.run([sys.executable, "-c", "raise SystemExit(3)"], check=True)
+
+
+def test_timeout_kills_the_command():
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        resources.run([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+    assert time.perf_counter() - start < 10
+
+
+def test_command_finishing_in_time_is_not_a_timeout():
+    result = resources.run([sys.executable, "-c", "pass"], timeout=30)
+    assert result.returncode == 0
+
+
+def test_format_bytes():
+    assert resources.format_bytes(512) == "512 B"
+    assert resources.format_bytes(1536) == "1.5 KB"
+    assert resources.format_bytes(3 * 1024 ** 3) == "3.0 GB"
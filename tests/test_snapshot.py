@@ -0,0 +1,121 @@
+import json
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from comandos.snapshot import MANIFEST_NAME, create_snapshot, main, restore_snapshot
+from comandos.startup import venv_python
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="usa enlaces simbólicos y rutas POSIX")
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "proyecto"
+    path.mkdir()
+    (path / "main.py").write_text("print('hola')\n", encoding="utf-8")
+    (path / "datos").mkdir()
+    (path / "datos" / "ejemplo.txt").write_text("x" * 10_000, encoding="utf-8")
+    (path / "ultimo.txt").symlink_to("datos/ejemplo.txt")
+    (path / ".pytest_cache").mkdir()
+    subprocess.run([sys.executable, "-m", "venv", "--without-pip", str(path / ".venv")], check=True)
+    # Una ruta que solo empieza como la del proyecto no debe recolocarse
+    (path / ".venv" / "rutas.txt").write_text(f"{path}\n{path}2\n", encoding="utf-8")
+    return path
+
+
+def tampered(archive, tmp_path, change):
+    """Copia de la instantánea con el manifiesto modificado por change(manifest)."""
+    output = tmp_path / "manipulada.zip"
+    with zipfile.ZipFile(archive) as source, zipfile.ZipFile(output, "w") as target:
+        for name in source.namelist():
+            data = source.read(name)
+            if name == MANIFEST_NAME:
+                manifest = json.loads(data)
+                change(manifest)
+                data = json.dumps(manifest)
+            target.writestr(name, data)
+    return output
+
+
+def test_round_trip_relocates_the_project(project, tmp_path):
+    archive = tmp_path / "proyecto.zip"
+    manifest = create_snapshot(project, archive)
+    assert manifest["environments"] == [".venv"]
+    assert not any(entry["path"].startswith(".pytest_cache") for entry in manifest["files"])
+
+    destination = tmp_path / "restaurado"
+    _, mismatched, interpreters = restore_snapshot(archive, destination, workers=3, verify=True)
+    assert mismatched == []
+    assert interpreters == {".venv": None}
+    assert (destination / "datos" / "ejemplo.txt").read_text(encoding="utf-8") == "x" * 10_000
+    assert (destination / "ultimo.txt").is_symlink()
+    assert (destination / "ultimo.txt").read_text(encoding="utf-8") == "x" * 10_000
+    assert (destination / ".venv" / "rutas.txt").read_text(encoding="utf-8") == f"{destination}\n{project}2\n"
+    assert str(destination) in (destination / ".venv" / "bin" / "activate").read_text(encoding="utf-8")
+    result = subprocess.run(
+        [str(venv_python(destination / ".venv")), "main.py"], cwd=destination, capture_output=True, text=True,
+    )
+    assert result.stdout == "hola\n"
+
+
+def test_restore_refuses_existing_destination(project, tmp_path):
+    archive = tmp_path / "proyecto.zip"
+    create_snapshot(project, archive)
+    with pytest.raises(FileExistsError):
+        restore_snapshot(archive, project)
+
+
+@pytest.mark.parametrize("change", [
+    lambda manifest: manifest["files"][0].update(path="../fuera.txt"),
+    lambda manifest: manifest["directories"].append("/tmp/fuera"),
+    lambda manifest: manifest["links"].append({"path": "../enlace", "target": "main.py"}),
+    lambda manifest: manifest["links"].append({"path": "clave", "target": "/etc/passwd"}),
+    lambda manifest: manifest["links"].append({"path": "datos/clave", "target": "../../../etc/passwd"}),
+    lambda manifest: manifest["links"].append({"path": "otro", "target": manifest["root"] + "2/main.py"}),
+], ids=["archivo", "directorio", "enlace", "enlace-absoluto", "enlace-relativo", "prefijo"])
+def test_restore_rejects_paths_outside_the_project(project, tmp_path, change):
+    archive = tmp_path / "proyecto.zip"
+    create_snapshot(project, archive)
+    destination = tmp_path / "restaurado"
+    with pytest.raises(ValueError, match="fuera del proyecto"):
+        restore_snapshot(tampered(archive, tmp_path, change), destination)
+    assert not destination.exists()
+
+
+@pytest.mark.parametrize("name", ["../../fuera", "/tmp/fuera", "..", "a/b", ""])
+def test_restore_rejects_names_outside_the_current_directory(project, tmp_path, monkeypatch, name):
+    archive = tmp_path / "proyecto.zip"
+    create_snapshot(project, archive)
+    workdir = tmp_path / "a" / "b"
+    workdir.mkdir(parents=True)
+    monkeypatch.chdir(workdir)
+    before = sorted(tmp_path.rglob("*"))
+    assert main(["restore", str(tampered(archive, tmp_path, lambda manifest: manifest.update(name=name)))]) == 1
+    assert sorted(path for path in tmp_path.rglob("*") if path.name != "manipulada.zip") == before
+
+    # Con un destino explícito el nombre no se usa
+    assert main(["restore", str(tmp_path / "manipulada.zip"), "restaurado"]) == 0
+    assert (workdir / "restaurado" / "main.py").exists()
+
+
+def test_restore_repoints_a_missing_base_interpreter(project, tmp_path):
+    cfg = project / ".venv" / "pyvenv.cfg"
+    cfg.write_text(
+        "".join(
+            "home = /no/existe/bin\n" if line.startswith("home") else line
+            for line in cfg.read_text(encoding="utf-8").splitlines(keepends=True)
+        ),
+        encoding="utf-8",
+    )
+    archive = tmp_path / "proyecto.zip"
+    create_snapshot(project, archive)
+    destination = tmp_path / "restaurado"
+    _, _, interpreters = restore_snapshot(archive, destination)
+    if interpreters[".venv"] is False:
+        pytest.skip("no hay otro intérprete de la misma versión en esta máquina")
+    assert "/no/existe" not in (destination / ".venv" / "pyvenv.cfg").read_text(encoding="utf-8")
+    result = subprocess.run([str(venv_python(destination / ".venv")), "-c", "print(1)"], capture_output=True, text=True)
+    assert result.stdout == "1\n"
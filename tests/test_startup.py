@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from comandos.startup import entry_command, precompile, precompile_and_measure, venv_python
+
+
+@pytest.fixture
+def venv(tmp_path):
+    path = tmp_path / ".venv"
+    subprocess.run([sys.executable, "-m", "venv", "--without-pip", str(path)], check=True)
+    return path
+
+
+def purelib(python):
+    result = subprocess.run(
+        [str(python), "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"],
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_entry_command(tmp_path):
+    assert entry_command(tmp_path, "main") == [str(tmp_path / "main.py")]
+    assert entry_command(tmp_path, "paquete") == ["-c", "from paquete import main; main()"]
+
+
+def test_precompile_writes_bytecode(venv):
+    python = venv_python(venv)
+    site_packages = Path(purelib(python))
+    (site_packages / "modulo_prueba.py").write_text("VALOR = 1\n", encoding="utf-8")
+    assert precompile(python) == (True, "")
+    assert list((site_packages / "__pycache__").glob("modulo_prueba.*.pyc"))
+
+
+def test_precompile_and_measure(venv, tmp_path):
+    (tmp_path / "main.py").write_text("def main():\n    pass\n\nmain()\n", encoding="utf-8")
+    cold, warm, ok, error = precompile_and_measure(venv_python(venv), entry_command(tmp_path, "main"), tmp_path, repeats=2)
+    assert ok, error
+    assert cold > 0 and warm > 0
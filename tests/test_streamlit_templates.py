@@ -0,0 +1,48 @@
+import tomllib
+
+import pytest
+
+from comandos.generators import streamlit_pip, streamlit_uv
+from comandos.streamlit_templates import BACKEND_LABELS, TEMPLATE_CHOICES, render_template
+
+
+def options(template, **extra):
+    return {"name": "demo", "template": template, "packages": ["httpx"], **extra}
+
+
+@pytest.mark.parametrize("backend", ["uv", "pip"])
+def test_performance_template(backend):
+    files = render_template("rendimiento", backend)
+    assert set(files) == {"app.py", ".streamlit/config.toml"}
+    assert BACKEND_LABELS[backend] in files["app.py"]
+    assert "{backend_label}" not in files["app.py"]
+    assert "@st.cache_data" in files["app.py"]
+    compile(files["app.py"], "app.py", "exec")
+    tomllib.loads(files[".streamlit/config.toml"])
+
+
+def test_unknown_template():
+    with pytest.raises(ValueError):
+        render_template("otra", "uv")
+
+
+@pytest.mark.parametrize("generator", [streamlit_uv, streamlit_pip])
+@pytest.mark.parametrize("template", TEMPLATE_CHOICES)
+def test_generator_files_compile(generator, template):
+    files, dependencies = generator.render_files(options(template))
+    assert "app.py" in files
+    for path, content in files.items():
+        if path.endswith(".py"):
+            compile(content, path, "exec")
+    assert dependencies["main"][0] == "streamlit"
+    assert dependencies["main"][-1] == "httpx"
+
+
+def test_performance_app_runs(tmp_path, monkeypatch):
+    testing = pytest.importorskip("streamlit.testing.v1")
+    for path, content in render_template("rendimiento", "uv").items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    app = testing.AppTest.from_file(str(tmp_path / "app.py"), default_timeout=30).run()
+    assert not app.exception
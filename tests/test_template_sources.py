@@ -0,0 +1,97 @@
+import shutil
+import subprocess
+
+import pytest
+
+from comandos.generators import python_pip
+from comandos.template_sources import TemplateSourceError, normalize_source, render_source
+
+PARAMS = {"name": "Mi-Proyecto", "module": "mi_proyecto", "generator": "python-pip"}
+
+needs_git = pytest.mark.skipif(not shutil.which("git"), reason="git no está instalado")
+
+
+@pytest.fixture
+def template(tmp_path):
+    root = tmp_path / "plantilla"
+    (root / "src" / "{{module}}").mkdir(parents=True)
+    (root / "src" / "{{module}}" / "__init__.py").write_text('"""{{name}} ({{generator}})"""\n', encoding="utf-8")
+    (root / "README.md").write_text("# {{ name }} {{desconocido}}\n", encoding="utf-8")
+    (root / "logo.bin").write_bytes(b"\xff\xfe{{name}}")
+    return root
+
+
+def git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "-c", "init.defaultBranch=main", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+def test_local_directory_is_rendered(template):
+    files, version, cached = render_source(str(template), PARAMS)
+    assert version.startswith("dir-") and not cached
+    assert files == {
+        "README.md": "# Mi-Proyecto {{desconocido}}\n",
+        "logo.bin": b"\xff\xfe{{name}}",
+        "src/mi_proyecto/__init__.py": '"""Mi-Proyecto (python-pip)"""\n',
+    }
+
+
+def test_renders_are_cached_by_version_and_params(template):
+    render_source(str(template), PARAMS)
+    assert render_source(str(template), PARAMS)[2] is True
+    assert render_source(str(template), {**PARAMS, "name": "otro"})[2] is False
+    (template / "README.md").write_text("cambiado {{name}}\n", encoding="utf-8")
+    files, _, cached = render_source(str(template), PARAMS)
+    assert not cached and files["README.md"] == "cambiado Mi-Proyecto\n"
+
+
+def test_paths_outside_the_project_are_skipped(template):
+    (template / "{{name}}").mkdir()
+    (template / "{{name}}" / "escapa.txt").write_text("x", encoding="utf-8")
+    files, _, _ = render_source(str(template), {**PARAMS, "name": ".."})
+    assert not any("escapa" in path for path in files)
+
+
+def test_normalize_source(template, monkeypatch):
+    monkeypatch.chdir(template.parent)
+    assert normalize_source("plantilla") == str(template.resolve())
+    assert normalize_source("plantilla#v1") == f"{template.resolve()}#v1"
+    assert normalize_source("https://git.example.com/p.git#main") == "https://git.example.com/p.git#main"
+    assert normalize_source(None) is None
+
+
+@needs_git
+def test_git_source_pins_refs(template, tmp_path):
+    git(template, "init", "--quiet")
+    git(template, "add", ".")
+    git(template, "commit", "--quiet", "-m", "v1")
+    git(template, "tag", "v1")
+    (template / "README.md").write_text("v2 {{name}}\n", encoding="utf-8")
+    git(template, "commit", "--quiet", "-am", "v2")
+
+    files, commit, _ = render_source(f"{template}#v1", PARAMS)
+    assert files["README.md"] == "# Mi-Proyecto {{desconocido}}\n"
+    assert len(commit) == 40
+    files, latest, _ = render_source(f"{template}#main", PARAMS)
+    assert files["README.md"] == "v2 Mi-Proyecto\n" and latest != commit
+    # El mismo commit sale de la caché sin volver a renderizar
+    assert render_source(f"{template}#v1", PARAMS)[2] is True
+    with pytest.raises(TemplateSourceError):
+        render_source(f"{template}#no-existe", PARAMS)
+
+
+def test_unreachable_source_fails(tmp_path):
+    with pytest.raises(TemplateSourceError):
+        render_source(str(tmp_path / "no-existe.git"), PARAMS)
+
+
+def test_generator_files_include_the_template(template):
+    options = {
+        "name": "Mi-Proyecto", "archetype": "basico", "packages": [], "benchmarks": None,
+        "template_source": str(template),
+    }
+    files, _ = python_pip.render_files(options)
+    assert files["README.md"] == "# Mi-Proyecto {{desconocido}}\n"
+    assert "main.py" in files
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from comandos import calibrate
+from comandos.locking import max_parallel_installs
+from comandos.tuning import apply_tuning, calibrated_installs, load_tuning, reset_tuning, save_tuning, tuning_path
+
+
+def test_save_load_and_reset():
+    assert load_tuning() == {}
+    path = save_tuning({"UV_CONCURRENT_INSTALLS": 4}, 2, {})
+    assert path == tuning_path()
+    assert load_tuning()["uv"] == {"UV_CONCURRENT_INSTALLS": 4}
+    assert calibrated_installs() == 2
+    assert reset_tuning()
+    assert load_tuning() == {}
+    assert not reset_tuning()
+
+
+def test_calibration_of_another_machine_is_ignored():
+    path = save_tuning({}, 3, {})
+    tuning = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**tuning, "cpus": (os.cpu_count() or 1) + 1}), encoding="utf-8")
+    load_tuning.cache_clear()
+    assert load_tuning() == {}
+    assert calibrated_installs() is None
+
+
+def test_environment_wins_over_calibration(monkeypatch):
+    save_tuning({"UV_CONCURRENT_INSTALLS": 8}, 3, {})
+    monkeypatch.delenv("UV_CONCURRENT_INSTALLS", raising=False)
+    monkeypatch.delenv("COMANDOS_MAX_INSTALLS", raising=False)
+    apply_tuning()
+    assert os.environ["UV_CONCURRENT_INSTALLS"] == "8"
+    monkeypatch.setenv("UV_CONCURRENT_INSTALLS", "1")
+    apply_tuning()
+    assert os.environ["UV_CONCURRENT_INSTALLS"] == "1"
+
+    monkeypatch.setattr("comandos.locking.available_memory", lambda: None)
+    assert max_parallel_installs() == 3
+    monkeypatch.setenv("COMANDOS_MAX_INSTALLS", "5")
+    assert max_parallel_installs() == 5
+
+
+def test_levels_are_powers_of_two():
+    values = calibrate.levels()
+    assert values[0] == 1 and values[-1] >= 4
+    assert all(b == 2 * a for a, b in zip(values, values[1:]))
+
+
+def test_install_args(wheelhouse, tmp_path):
+    # Sin paquetes, una rueda de cada paquete
+    args = calibrate.install_args(wheelhouse, [])
+    assert args[0] == "--no-index" and sorted(os.path.basename(arg) for arg in args[1:]) == [
+        "paquete_app-1.0-py3-none-any.whl", "paquete_base-1.0-py3-none-any.whl",
+    ]
+    assert calibrate.install_args(wheelhouse, ["paquete-app"]) == [
+        "--no-index", "--find-links", str(wheelhouse), "paquete-app",
+    ]
+    assert calibrate.install_args(tmp_path / "vacio", []) is None
+
+
+@pytest.mark.parametrize("backend", [
+    "pip", pytest.param("uv", marks=pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")),
+])
+def test_calibration_saves_results(offline, backend):
+    assert calibrate.main(["--wheelhouse", str(offline), "--backend", backend, "--repeats", "1"]) == 0
+    tuning = load_tuning()
+    assert backend in tuning["measurements"]
+    if backend == "pip":
+        assert tuning["installs"] in calibrate.levels()
+    else:
+        assert set(tuning["uv"]) <= {"UV_CONCURRENT_INSTALLS"}
+
+
+def test_calibration_without_wheels_fails(tmp_path):
+    assert calibrate.main(["--wheelhouse", str(tmp_path), "--backend", "pip"]) == 1
+    assert load_tuning() == {}
@@ -0,0 +1,114 @@
+import asyncio
+import io
+import shutil
+
+import pytest
+from rich.console import Console
+
+from comandos.api import create_project
+from comandos.generators import python_uv
+from comandos.update import (
+    content_hash, load_manifest, missing_dependencies, plan_update, save_manifest, update_project, write_files,
+)
+from conftest import build_wheel
+
+GENERATOR = "python-uv"
+
+
+def quiet_console():
+    return Console(file=io.StringIO())
+
+
+def test_plan_update_actions(tmp_path):
+    write_files(tmp_path, {"igual.py": "a", "tocado.py": "mío", "viejo.py": "v1", "suelto.py": "x"})
+    manifest = {"files": {
+        "igual.py": content_hash("a"),
+        "tocado.py": content_hash("original"),
+        "viejo.py": content_hash("v1"),
+        "borrado.py": content_hash("b"),
+        "retirado.py": content_hash("r"),
+    }}
+    files = {
+        "igual.py": "a", "tocado.py": "v2", "viejo.py": "v2", "borrado.py": "b2", "suelto.py": "y", "nuevo.py": "n",
+    }
+    assert plan_update(tmp_path, files, manifest) == {
+        "igual.py": "same",
+        "tocado.py": "modified",
+        "viejo.py": "update",
+        "borrado.py": "deleted",
+        "suelto.py": "untracked",
+        "nuevo.py": "new",
+        "retirado.py": "dropped",
+    }
+
+
+def test_save_manifest_keeps_hash_of_modified_files(tmp_path):
+    files = {"main.py": "print(1)\n"}
+    write_files(tmp_path, files)
+    first = save_manifest(tmp_path, GENERATOR, {}, files, {"main": []})
+    (tmp_path / "main.py").write_text("print('mío')\n", encoding="utf-8")
+    second = save_manifest(tmp_path, GENERATOR, {}, files, {"main": []}, previous=first)
+    assert second["files"] == first["files"]
+    assert load_manifest(tmp_path) == second
+
+
+def test_missing_dependencies():
+    old = {"main": ["rich"], "dev": []}
+    new = {"main": ["rich", "httpx"], "dev": ["pytest"]}
+    assert missing_dependencies(old, new) == {"main": ["httpx"], "dev": ["pytest"]}
+
+
+def test_update_project_rewrites_untouched_files_and_resyncs(tmp_path):
+    options = {"version": 1}
+    files = {"a.py": "v1", "b.py": "v1"}
+    write_files(tmp_path, files)
+    save_manifest(tmp_path, GENERATOR, options, files, {"main": ["rich"]})
+    (tmp_path / "b.py").write_text("mío", encoding="utf-8")
+
+    calls = []
+
+    def render(opts):
+        assert opts == options
+        return {"a.py": "v2", "b.py": "v2"}, {"main": ["rich", "httpx"]}
+
+    def resync(project_path, opts, missing):
+        calls.append(missing)
+        return True, ""
+
+    assert update_project(tmp_path, GENERATOR, render, resync, quiet_console())
+    assert (tmp_path / "a.py").read_text(encoding="utf-8") == "v2"
+    assert (tmp_path / "b.py").read_text(encoding="utf-8") == "mío"
+    assert calls == [{"main": ["httpx"]}]
+
+    # Sin cambios de dependencias no se vuelve a sincronizar
+    assert update_project(tmp_path, GENERATOR, render, resync, quiet_console())
+    assert len(calls) == 1
+
+
+def test_update_project_refuses_other_generator(tmp_path):
+    save_manifest(tmp_path, "python-pip", {}, {}, {})
+    assert not update_project(tmp_path, GENERATOR, None, None, quiet_console())
+    assert not update_project(tmp_path / "otro", GENERATOR, None, None, quiet_console())
+
+
+def test_unsynced_manifest_keeps_previous_dependencies(tmp_path):
+    manifest = save_manifest(tmp_path, GENERATOR, {}, {}, {"main": ["rich", "httpx"]}, synced=False)
+    assert manifest["dependencies"] == {} and manifest["dependency_hash"] is None
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_update_retries_a_failed_install(offline, tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    spec = {"generator": "python-uv", "name": "sin-red", "directory": tmp_path, "packages": ["paquete-extra"], "git": False}
+
+    async def create():
+        return [event async for event in create_project(spec)]
+
+    # paquete-extra aún no está en el wheelhouse: la instalación falla
+    assert not asyncio.run(create())[-1]["ok"]
+    project = tmp_path / "sin-red"
+
+    build_wheel(offline, "paquete-extra")
+    assert update_project(project, GENERATOR, python_uv.render_files, python_uv.resync_environment, quiet_console())
+    assert "paquete-extra" in (project / "pyproject.toml").read_text(encoding="utf-8")
+    assert load_manifest(project)["dependencies"]["main"] == ["paquete-extra"]
@@ -0,0 +1,53 @@
+import shutil
+import tomllib
+
+import pytest
+
+from comandos.generators.python_uv import create_project, create_workspace, find_workspace_root
+
+
+def test_create_workspace_writes_virtual_root(tmp_path):
+    root = tmp_path / "ws"
+    assert create_workspace(root) is True
+    data = tomllib.loads((root / "pyproject.toml").read_text(encoding="utf-8"))
+    assert data == {"tool": {"uv": {"workspace": {"members": []}}}}
+
+
+def test_create_workspace_keeps_existing_workspace(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "raiz"\n\n[tool.uv.workspace]\nmembers = ["a"]\n', encoding="utf-8")
+    before = pyproject.read_text(encoding="utf-8")
+    assert create_workspace(tmp_path) is False
+    assert pyproject.read_text(encoding="utf-8") == before
+
+
+def test_create_workspace_refuses_plain_project(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "otro"\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="no declara un workspace"):
+        create_workspace(tmp_path)
+    assert pyproject.read_text(encoding="utf-8") == '[project]\nname = "otro"\n'
+
+
+def test_create_workspace_refuses_invalid_toml(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[project\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="no es un TOML válido"):
+        create_workspace(tmp_path)
+
+
+def test_find_workspace_root_walks_up(tmp_path):
+    create_workspace(tmp_path)
+    member = tmp_path / "paquetes" / "uno"
+    member.mkdir(parents=True)
+    (member / "pyproject.toml").write_text('[project]\nname = "uno"\n', encoding="utf-8")
+    assert find_workspace_root(member) == tmp_path
+    assert find_workspace_root(tmp_path.parent) is None
+
+
+@pytest.mark.skipif(not shutil.which("uv"), reason="UV no está instalado")
+def test_new_project_joins_workspace(tmp_path):
+    create_workspace(tmp_path)
+    ok, error = create_project("miembro", cwd=tmp_path)
+    assert ok, error
+    data = tomllib.loads((tmp_path / "pyproject.toml").read_text(encoding="utf-8"))
+    assert data["tool"]["uv"]["workspace"]["members"] == ["miembro"]